@@ -24,7 +24,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"arcs":[],"name":"AssetLabeling","structs":{"LabelDescriptor":[{"name":"name","type":"string"},{"name":"url","type":"string"},{"name":"numAssets","type":"uint64"},{"name":"numOperators","type":"uint64"}],"AssetMicro":[{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"}],"AssetMicroLabels":[{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"labels","type":"string[]"}],"AssetTiny":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"}],"AssetTinyLabels":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"labels","type":"string[]"}],"AssetText":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"}],"AssetTextLabels":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"},{"name":"labels","type":"string[]"}],"AssetSmall":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"total","type":"uint64"},{"name":"hasFreeze","type":"bool"},{"name":"hasClawback","type":"bool"},{"name":"labels","type":"string[]"}],"AssetFull":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"},{"name":"total","type":"uint64"},{"name":"decimals","type":"uint8"},{"name":"creator","type":"address"},{"name":"manager","type":"address"},{"name":"freeze","type":"address"},{"name":"clawback","type":"address"},{"name":"reserve","type":"address"},{"name":"defaultFrozen","type":"bool"},{"name":"metadataHash","type":"byte[]"},{"name":"reserveBalance","type":"uint64"},{"name":"labels","type":"string[]"}]},"methods":[{"name":"change_admin","args":[{"name":"new_admin","type":"account"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label","args":[{"name":"id","type":"string"},{"name":"name","type":"string"},{"name":"url","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_label","args":[{"name":"id","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"change_label","args":[{"name":"id","type":"string"},{"name":"name","type":"string"},{"name":"url","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_label","args":[{"name":"id","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_label","args":[{"name":"id","type":"string"}],"returns":{"type":"(string,string,uint64,uint64)","struct":"LabelDescriptor"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_labels","args":[{"name":"ids","type":"string[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"add_operator_to_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_operator_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_operator_from_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_operator_labels","args":[{"name":"operator","type":"account"}],"returns":{"type":"string[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label_to_asset","args":[{"name":"label","type":"string"},{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label_to_assets","args":[{"name":"label","type":"string"},{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_label_from_asset","args":[{"name":"label","type":"string"},{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_asset_label","args":[{"name":"asset_id","type":"uint64"},{"name":"label","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_labels","args":[{"name":"asset","type":"asset"}],"returns":{"type":"string[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"string[][]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_assets_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_micro","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,uint8)","struct":"AssetMicro"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_micro","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_micro_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,uint8,string[])","struct":"AssetMicroLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_micro_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_tiny","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8)","struct":"AssetTiny"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_tiny","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_tiny_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8,string[])","struct":"AssetTinyLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_tiny_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_text","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string)","struct":"AssetText"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_text","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_text_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string,string[])","struct":"AssetTextLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_text_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_small","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8,uint64,bool,bool,string[])","struct":"AssetSmall"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_small","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_full","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string,uint64,uint8,address,address,address,address,address,bool,byte[],uint64,string[])","struct":"AssetFull"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_full","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}}],"state":{"schema":{"global":{"ints":0,"bytes":1},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"key":"YWRtaW4=","keyType":"AVMString","valueType":"AVMBytes"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMiA4IDQyOTQ5NjcyOTUgNDI5NDk2NzI5NgogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4MDAwMCAiRVJSOk5PRVhJU1QiICIiIDB4MDAwMDAwMDAwMDAwMDAwMCAiYWRtaW4iICJFUlI6TEVOR1RIIiAiRVJSOkVYSVNUUyIgIkVSUjpOT0VNUFRZIiAweDAwMDIgMHgwMCAiRVJSOlVOQVVUSCIgMHgwMDAxIDB4MDAwNQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU5CiAgICAvLyBzZWxmLmFkbWluID0gVHhuLnNlbmRlcgogICAgYnl0ZWMgNSAvLyAiYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AzOQogICAgcHVzaGJ5dGVzcyAweDhmMGQ3ZDhlIDB4MzNhMmUyZjcgMHhiNzJiYjc4ZiAweDk3NmNkZTY0IDB4MTdlNjkxYWUgMHg3NjY1ZDJiNCAweDcyNTYxNmU3IDB4ZmFjMWNmMWIgMHg2ZmQ4MTQ4YyAweGI0YzUwYjlmIDB4YTJkZDIyNDcgMHhhMzdkZWExMSAweDEzNWFiMjFlIDB4NjhmMThlZmEgMHg5N2Y0MGE4YSAweGMyZWQ3NDNmIDB4YTY3ZjAzYzIgMHg5N2EzMjEyMyAweGFhZWUwYzYxIDB4YjZjMzlmNjggMHg2MzViZTM2MiAweDcwOTNiMTBkIDB4NzBhYzk5YWQgMHhkOWEyYmQ5YyAweDc2YzY1MjhlIDB4NTFmNzdiZmYgMHgyMGQ5ZjI0YyAweDU1NDBiODBhIDB4MDcxMGU1YzQgMHg2ZjE3Y2RkNSAweDdhNGNlNGI5IDB4MzY2YzUxYWYgMHgzNGE0OGZiYyAweDAzYmE5OGRiIC8vIG1ldGhvZCAiY2hhbmdlX2FkbWluKGFjY291bnQpdm9pZCIsIG1ldGhvZCAiYWRkX2xhYmVsKHN0cmluZyxzdHJpbmcsc3RyaW5nKXZvaWQiLCBtZXRob2QgImhhc19sYWJlbChzdHJpbmcpdWludDY0IiwgbWV0aG9kICJjaGFuZ2VfbGFiZWwoc3RyaW5nLHN0cmluZyxzdHJpbmcpdm9pZCIsIG1ldGhvZCAicmVtb3ZlX2xhYmVsKHN0cmluZyl2b2lkIiwgbWV0aG9kICJnZXRfbGFiZWwoc3RyaW5nKShzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJsb2dfbGFiZWxzKHN0cmluZ1tdKXZvaWQiLCBtZXRob2QgImFkZF9vcGVyYXRvcl90b19sYWJlbChhY2NvdW50LHN0cmluZyl2b2lkIiwgbWV0aG9kICJoYXNfb3BlcmF0b3JfbGFiZWwoYWNjb3VudCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbChhY2NvdW50LHN0cmluZyl2b2lkIiwgbWV0aG9kICJnZXRfb3BlcmF0b3JfbGFiZWxzKGFjY291bnQpc3RyaW5nW10iLCBtZXRob2QgImFkZF9sYWJlbF90b19hc3NldChzdHJpbmcsYXNzZXQpdm9pZCIsIG1ldGhvZCAiYWRkX2xhYmVsX3RvX2Fzc2V0cyhzdHJpbmcsdWludDY0W10pdm9pZCIsIG1ldGhvZCAicmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXQoc3RyaW5nLGFzc2V0KXZvaWQiLCBtZXRob2QgImhhc19hc3NldF9sYWJlbCh1aW50NjQsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2xhYmVscyhhc3NldClzdHJpbmdbXSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c19sYWJlbHModWludDY0W10pc3RyaW5nW11bXSIsIG1ldGhvZCAibG9nX2Fzc2V0c19sYWJlbHModWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X21pY3JvKHVpbnQ2NCkoc3RyaW5nLHVpbnQ4KSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c19taWNybyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfbWljcm9fbGFiZWxzKHVpbnQ2NCkoc3RyaW5nLHVpbnQ4LHN0cmluZ1tdKSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c19taWNyb19sYWJlbHModWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X3RpbnkodWludDY0KShzdHJpbmcsc3RyaW5nLHVpbnQ4KSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c190aW55KHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImdldF9hc3NldF90aW55X2xhYmVscyh1aW50NjQpKHN0cmluZyxzdHJpbmcsdWludDgsc3RyaW5nW10pIiwgbWV0aG9kICJnZXRfYXNzZXRzX3RpbnlfbGFiZWxzKHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImdldF9hc3NldF90ZXh0KHVpbnQ2NCkoc3RyaW5nLHN0cmluZyxzdHJpbmcpIiwgbWV0aG9kICJnZXRfYXNzZXRzX3RleHQodWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X3RleHRfbGFiZWxzKHVpbnQ2NCkoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nW10pIiwgbWV0aG9kICJnZXRfYXNzZXRzX3RleHRfbGFiZWxzKHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImdldF9hc3NldF9zbWFsbCh1aW50NjQpKHN0cmluZyxzdHJpbmcsdWludDgsdWludDY0LGJvb2wsYm9vbCxzdHJpbmdbXSkiLCBtZXRob2QgImdldF9hc3NldHNfc21hbGwodWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2Z1bGwodWludDY0KShzdHJpbmcsc3RyaW5nLHN0cmluZyx1aW50NjQsdWludDgsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGJvb2wsYnl0ZVtdLHVpbnQ2NCxzdHJpbmdbXSkiLCBtZXRob2QgImdldF9hc3NldHNfZnVsbCh1aW50NjRbXSl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jaGFuZ2VfYWRtaW5fcm91dGVANSBtYWluX2FkZF9sYWJlbF9yb3V0ZUA2IG1haW5faGFzX2xhYmVsX3JvdXRlQDcgbWFpbl9jaGFuZ2VfbGFiZWxfcm91dGVAOCBtYWluX3JlbW92ZV9sYWJlbF9yb3V0ZUA5IG1haW5fZ2V0X2xhYmVsX3JvdXRlQDEwIG1haW5fbG9nX2xhYmVsc19yb3V0ZUAxMSBtYWluX2FkZF9vcGVyYXRvcl90b19sYWJlbF9yb3V0ZUAxMiBtYWluX2hhc19vcGVyYXRvcl9sYWJlbF9yb3V0ZUAxMyBtYWluX3JlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX3JvdXRlQDE0IG1haW5fZ2V0X29wZXJhdG9yX2xhYmVsc19yb3V0ZUAxNSBtYWluX2FkZF9sYWJlbF90b19hc3NldF9yb3V0ZUAxNiBtYWluX2FkZF9sYWJlbF90b19hc3NldHNfcm91dGVAMTcgbWFpbl9yZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9yb3V0ZUAxOCBtYWluX2hhc19hc3NldF9sYWJlbF9yb3V0ZUAxOSBtYWluX2dldF9hc3NldF9sYWJlbHNfcm91dGVAMjAgbWFpbl9nZXRfYXNzZXRzX2xhYmVsc19yb3V0ZUAyMSBtYWluX2xvZ19hc3NldHNfbGFiZWxzX3JvdXRlQDIyIG1haW5fZ2V0X2Fzc2V0X21pY3JvX3JvdXRlQDIzIG1haW5fZ2V0X2Fzc2V0c19taWNyb19yb3V0ZUAyNCBtYWluX2dldF9hc3NldF9taWNyb19sYWJlbHNfcm91dGVAMjUgbWFpbl9nZXRfYXNzZXRzX21pY3JvX2xhYmVsc19yb3V0ZUAyNiBtYWluX2dldF9hc3NldF90aW55X3JvdXRlQDI3IG1haW5fZ2V0X2Fzc2V0c190aW55X3JvdXRlQDI4IG1haW5fZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzX3JvdXRlQDI5IG1haW5fZ2V0X2Fzc2V0c190aW55X2xhYmVsc19yb3V0ZUAzMCBtYWluX2dldF9hc3NldF90ZXh0X3JvdXRlQDMxIG1haW5fZ2V0X2Fzc2V0c190ZXh0X3JvdXRlQDMyIG1haW5fZ2V0X2Fzc2V0X3RleHRfbGFiZWxzX3JvdXRlQDMzIG1haW5fZ2V0X2Fzc2V0c190ZXh0X2xhYmVsc19yb3V0ZUAzNCBtYWluX2dldF9hc3NldF9zbWFsbF9yb3V0ZUAzNSBtYWluX2dldF9hc3NldHNfc21hbGxfcm91dGVAMzYgbWFpbl9nZXRfYXNzZXRfZnVsbF9yb3V0ZUAzNyBtYWluX2dldF9hc3NldHNfZnVsbF9yb3V0ZUAzOAoKbWFpbl9hZnRlcl9pZl9lbHNlQDQzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzEgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfZnVsbF9yb3V0ZUAzODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTM1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfZnVsbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfZnVsbF9yb3V0ZUAzNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF9mdWxsCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfc21hbGxfcm91dGVAMzY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDk4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX3NtYWxsCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF9zbWFsbF9yb3V0ZUAzNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDk0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF9zbWFsbAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRzX3RleHRfbGFiZWxzX3JvdXRlQDM0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ3NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0c190ZXh0X2xhYmVscwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfdGV4dF9sYWJlbHNfcm91dGVAMzM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDcwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRfdGV4dF9sYWJlbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c190ZXh0X3JvdXRlQDMyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ1MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NTMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0c190ZXh0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF90ZXh0X3JvdXRlQDMxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NDkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3RleHQKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c190aW55X2xhYmVsc19yb3V0ZUAzMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MzMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfdGlueV9sYWJlbHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzX3JvdXRlQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfdGlueV9yb3V0ZUAyODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDEyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfdGlueQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfdGlueV9yb3V0ZUAyNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MDgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDA4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF90aW55CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfbWljcm9fbGFiZWxzX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM5MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0c19taWNyb19sYWJlbHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X21pY3JvX2xhYmVsc19yb3V0ZUAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzg4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF9taWNyb19sYWJlbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c19taWNyb19yb3V0ZUAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzcyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfbWljcm8KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X21pY3JvX3JvdXRlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM2OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X21pY3JvCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2xvZ19hc3NldHNfbGFiZWxzX3JvdXRlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgbG9nX2Fzc2V0c19sYWJlbHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c19sYWJlbHNfcm91dGVAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzMyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMzMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfbGFiZWxzX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRfbGFiZWxzCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2hhc19hc3NldF9sYWJlbF9yb3V0ZUAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxNwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBoYXNfYXNzZXRfbGFiZWwKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjgzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjgzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYWRkX2xhYmVsX3RvX2Fzc2V0c19yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzUKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjc1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgYWRkX2xhYmVsX3RvX2Fzc2V0cwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9hZGRfbGFiZWxfdG9fYXNzZXRfcm91dGVAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjcwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjcwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgYWRkX2xhYmVsX3RvX2Fzc2V0CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9vcGVyYXRvcl9sYWJlbHNfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjI5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X29wZXJhdG9yX2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2hhc19vcGVyYXRvcl9sYWJlbF9yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgaGFzX29wZXJhdG9yX2xhYmVsCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9vcGVyYXRvcl90b19sYWJlbF9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9vcGVyYXRvcl90b19sYWJlbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9sb2dfbGFiZWxzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEyMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgbG9nX2xhYmVscwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfbGFiZWxfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2xhYmVsCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3JlbW92ZV9sYWJlbF9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMDgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZW1vdmVfbGFiZWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hhbmdlX2xhYmVsX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo5OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNoYW5nZV9sYWJlbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oYXNfbGFiZWxfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo5NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgaGFzX2xhYmVsCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9sYWJlbF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjgyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBhZGRfbGFiZWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hhbmdlX2FkbWluX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjaGFuZ2VfYWRtaW4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDM5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBzd2l0Y2ggbWFpbl9fX2FsZ29weV9kZWZhdWx0X2NyZWF0ZUA0MiBtYWluX2FmdGVyX2lmX2Vsc2VANDMgbWFpbl9hZnRlcl9pZl9lbHNlQDQzIG1haW5fYWZ0ZXJfaWZfZWxzZUA0MyBtYWluX3VwZGF0ZUA0MCBtYWluX2RlbGV0ZUA0MQogICAgYiBtYWluX2FmdGVyX2lmX2Vsc2VANDMKCm1haW5fZGVsZXRlQDQxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY5CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJEZWxldGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlQDQwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY1CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJVcGRhdGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANDI6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWQoYXJyYXk6IGJ5dGVzLCBuZXdfaXRlbXNfYnl0ZXM6IGJ5dGVzLCBuZXdfaXRlbXNfY291bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWQ6CiAgICBwcm90byAzIDEKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgc3dhcAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18yIC8vIDIKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBiemVybwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGR1cAogICAgaW50Y18xIC8vIDAKICAgIHN3YXAKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWRfZm9yX2hlYWRlckAyOgogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBkeW5hbWljX2FycmF5X2NvbmNhdF9ieXRlX2xlbmd0aF9oZWFkX2FmdGVyX2ZvckA1CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBkaWcgMQogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDMKICAgIGIgZHluYW1pY19hcnJheV9jb25jYXRfYnl0ZV9sZW5ndGhfaGVhZF9mb3JfaGVhZGVyQDIKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWRfYWZ0ZXJfZm9yQDU6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBfcHV5YV9saWIuYXJjNC5keW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnQoYXJyYXlfaXRlbXNfY291bnQ6IHVpbnQ2NCwgYXJyYXlfaGVhZF9hbmRfdGFpbDogYnl0ZXMsIG5ld19pdGVtc19jb3VudDogdWludDY0LCBuZXdfaGVhZF9hbmRfdGFpbDogYnl0ZXMpIC0+IGJ5dGVzOgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnQ6CiAgICBwcm90byA0IDEKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgaW50Y18xIC8vIDAKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9mb3JfaGVhZGVyQDE6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudF9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJAMQoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA0OgogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGZyYW1lX2J1cnkgMAogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgNAoKZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2Zvcl9oZWFkZXJANToKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgPAogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50X2FmdGVyX2ZvckA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgMAogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfZm9yX2hlYWRlckA1CgpkeW5hbWljX2FycmF5X2NvbmNhdF9keW5hbWljX2VsZW1lbnRfYWZ0ZXJfZm9yQDg6CiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIDMKICAgIGZyYW1lX2RpZyAwCiAgICBzdWJzdHJpbmczCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAyCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuYjJzdHIoYjogYnl0ZXMpIC0+IGJ5dGVzOgpiMnN0cjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1Mi01MwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBiMnN0cihiOiBCeXRlcykgLT4gYXJjNC5TdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gcmV0dXJuIGFyYzQuU3RyaW5nKFN0cmluZy5mcm9tX2J5dGVzKGIpKQogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcudXBkYXRlKCkgLT4gdm9pZDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY3CiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5kZWxldGUoKSAtPiB2b2lkOgpkZWxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NzEKICAgIC8vIHNlbGYuYWRtaW5fb25seSgpCiAgICBjYWxsc3ViIGFkbWluX29ubHkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkbWluX29ubHkoKSAtPiB2b2lkOgphZG1pbl9vbmx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBlbnN1cmUoVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCBTKCJFUlI6VU5BVVRIIikpCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBhZG1pbl9vbmx5X2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBlbnN1cmUoVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCBTKCJFUlI6VU5BVVRIIikpCiAgICBieXRlYyAxMSAvLyAiRVJSOlVOQVVUSCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgphZG1pbl9vbmx5X2FmdGVyX2lmX2Vsc2VAMzoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmNoYW5nZV9hZG1pbihuZXdfYWRtaW46IGJ5dGVzKSAtPiB2b2lkOgpjaGFuZ2VfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NzctNzgKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGNoYW5nZV9hZG1pbihzZWxmLCBuZXdfYWRtaW46IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi5hZG1pbl9vbmx5KCkKICAgIGNhbGxzdWIgYWRtaW5fb25seQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjgwCiAgICAvLyBzZWxmLmFkbWluID0gbmV3X2FkbWluCiAgICBieXRlYyA1IC8vICJhZG1pbiIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkZF9sYWJlbChpZDogYnl0ZXMsIG5hbWU6IGJ5dGVzLCB1cmw6IGJ5dGVzKSAtPiB2b2lkOgphZGRfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODItODMKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFkZF9sYWJlbChzZWxmLCBpZDogU3RyaW5nLCBuYW1lOiBTdHJpbmcsIHVybDogU3RyaW5nKSAtPiBOb25lOiAgIyBub3FhIEEwMDIKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojg0CiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODUKICAgIC8vIGVuc3VyZShpZCBub3QgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpFWElTVFMiKSkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYnogYWRkX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBlbnN1cmUoaWQgbm90IGluIHNlbGYubGFiZWxzLCBTKCJFUlI6RVhJU1RTIikpCiAgICBieXRlYyA3IC8vICJFUlI6RVhJU1RTIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmFkZF9sYWJlbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODYKICAgIC8vIGVuc3VyZShpZC5ieXRlcy5sZW5ndGggPT0gMiwgUygiRVJSOkxFTkdUSCIpKQogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBhZGRfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODYKICAgIC8vIGVuc3VyZShpZC5ieXRlcy5sZW5ndGggPT0gMiwgUygiRVJSOkxFTkdUSCIpKQogICAgYnl0ZWMgNiAvLyAiRVJSOkxFTkdUSCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgphZGRfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyBhcmM0LlN0cmluZyhuYW1lKSwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo4OQogICAgLy8gYXJjNC5TdHJpbmcodXJsKSwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo4Ny05MgogICAgLy8gc2VsZi5sYWJlbHNbaWRdID0gTGFiZWxEZXNjcmlwdG9yKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKG5hbWUpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHVybCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMQogICAgbGVuCiAgICBwdXNoaW50IDIwIC8vIDIwCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAxNAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTAKICAgIC8vIGFyYzQuVUludDY0KDApLAogICAgYnl0ZWMgNCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo4Ny05MgogICAgLy8gc2VsZi5sYWJlbHNbaWRdID0gTGFiZWxEZXNjcmlwdG9yKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKG5hbWUpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHVybCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo5MQogICAgLy8gYXJjNC5VSW50NjQoMCksCiAgICBieXRlYyA0IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojg3LTkyCiAgICAvLyBzZWxmLmxhYmVsc1tpZF0gPSBMYWJlbERlc2NyaXB0b3IoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcobmFtZSksCiAgICAvLyAgICAgYXJjNC5TdHJpbmcodXJsKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuaGFzX2xhYmVsKGlkOiBieXRlcykgLT4gdWludDY0OgpoYXNfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTQtOTUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBoYXNfbGFiZWwoc2VsZiwgaWQ6IFN0cmluZykgLT4gVUludDY0OiAgIyBub3FhIEEwMDIKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIFMoIkVSUjpMRU5HVEgiKSkKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogaGFzX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIFMoIkVSUjpMRU5HVEgiKSkKICAgIGJ5dGVjIDYgLy8gIkVSUjpMRU5HVEgiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKaGFzX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo5NwogICAgLy8gcmV0dXJuIFVJbnQ2NChpZCBpbiBzZWxmLmxhYmVscykKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5jaGFuZ2VfbGFiZWwoaWQ6IGJ5dGVzLCBuYW1lOiBieXRlcywgdXJsOiBieXRlcykgLT4gdm9pZDoKY2hhbmdlX2xhYmVsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk5LTEwMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY2hhbmdlX2xhYmVsKHNlbGYsIGlkOiBTdHJpbmcsIG5hbWU6IFN0cmluZywgdXJsOiBTdHJpbmcpIC0+IE5vbmU6ICAjIG5vcWEgQTAwMgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTAxCiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTAyCiAgICAvLyBlbnN1cmUoaWQgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBjaGFuZ2VfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTAyCiAgICAvLyBlbnN1cmUoaWQgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBieXRlY18yIC8vICJFUlI6Tk9FWElTVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpjaGFuZ2VfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gbGFiZWxfZGVzY3JpcHRvciA9IHNlbGYubGFiZWxzW2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGFiZWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwNAogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5uYW1lID0gYXJjNC5TdHJpbmcobmFtZSkKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMAogICAgZGlnIDIKICAgIGV4dHJhY3QzCiAgICBkaWcgMwogICAgaW50Y18yIC8vIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgNAogICAgbGVuCiAgICB1bmNvdmVyIDUKICAgIGRpZyAyCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIHVuY292ZXIgMgogICAgZGlnIDQKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIC0KICAgIHVuY292ZXIgMgogICAgbGVuCiAgICBkaWcgMgogICAgaW50Y18yIC8vIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICArCiAgICBzd2FwCiAgICAtCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcmVwbGFjZTIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwNQogICAgLy8gbGFiZWxfZGVzY3JpcHRvci51cmwgPSBhcmM0LlN0cmluZyh1cmwpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDIKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QzCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYubGFiZWxzW2lkXSA9IGxhYmVsX2Rlc2NyaXB0b3IuY29weSgpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5yZW1vdmVfbGFiZWwoaWQ6IGJ5dGVzKSAtPiB2b2lkOgpyZW1vdmVfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTA4LTEwOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVtb3ZlX2xhYmVsKHNlbGYsIGlkOiBTdHJpbmcpIC0+IE5vbmU6ICAjIG5vcWEgQTAwMgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTEwCiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTExCiAgICAvLyBlbnN1cmUoaWQgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTExCiAgICAvLyBlbnN1cmUoaWQgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBieXRlY18yIC8vICJFUlI6Tk9FWElTVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExMgogICAgLy8gZW5zdXJlKHNlbGYubGFiZWxzW2lkXS5udW1fb3BlcmF0b3JzID09IDAsIFMoIkVSUjpOT0VNUFRZIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhYmVscyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgMTIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjIDQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVtb3ZlX2xhYmVsX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExMgogICAgLy8gZW5zdXJlKHNlbGYubGFiZWxzW2lkXS5udW1fb3BlcmF0b3JzID09IDAsIFMoIkVSUjpOT0VNUFRZIikpCiAgICBieXRlYyA4IC8vICJFUlI6Tk9FTVBUWSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExMwogICAgLy8gZW5zdXJlKHNlbGYubGFiZWxzW2lkXS5udW1fYXNzZXRzID09IDAsIFMoIkVSUjpOT0VNUFRZIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhYmVscyBlbnRyeSBleGlzdHMKICAgIGV4dHJhY3QgNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExMwogICAgLy8gZW5zdXJlKHNlbGYubGFiZWxzW2lkXS5udW1fYXNzZXRzID09IDAsIFMoIkVSUjpOT0VNUFRZIikpCiAgICBieXRlYyA4IC8vICJFUlI6Tk9FTVBUWSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTQKICAgIC8vIGRlbCBzZWxmLmxhYmVsc1tpZF0KICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2RlbAogICAgcG9wCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfbGFiZWwoaWQ6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2xhYmVsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNi0xMTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfbGFiZWwoc2VsZiwgaWQ6IFN0cmluZykgLT4gTGFiZWxEZXNjcmlwdG9yOiAgIyBub3FhIEEwMDIKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExOAogICAgLy8gZW5zdXJlKGlkIGluIHNlbGYubGFiZWxzLCBTKCJFUlI6Tk9FWElTVCIpKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogZ2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExOAogICAgLy8gZW5zdXJlKGlkIGluIHNlbGYubGFiZWxzLCBTKCJFUlI6Tk9FWElTVCIpKQogICAgYnl0ZWNfMiAvLyAiRVJSOk5PRVhJU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKZ2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTkKICAgIC8vIHJldHVybiBzZWxmLmxhYmVsc1tpZF0KICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGFiZWxzIGVudHJ5IGV4aXN0cwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcubG9nX2xhYmVscyhpZHM6IGJ5dGVzKSAtPiB2b2lkOgpsb2dfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEyMS0xMjIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBsb2dfbGFiZWxzKHNlbGYsIGlkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTIzCiAgICAvLyBmb3IgX2lkeCwgbGFiZWxfaWQgaW4gdWVudW1lcmF0ZShpZHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpsb2dfbGFiZWxzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMjMKICAgIC8vIGZvciBfaWR4LCBsYWJlbF9pZCBpbiB1ZW51bWVyYXRlKGlkcyk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGxvZ19sYWJlbHNfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMjQKICAgIC8vIGxvZyhzZWxmLmxhYmVsc1tsYWJlbF9pZC5uYXRpdmVdKQogICAgZXh0cmFjdCAyIDAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhYmVscyBlbnRyeSBleGlzdHMKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBsb2dfbGFiZWxzX2Zvcl9oZWFkZXJAMQoKbG9nX2xhYmVsc19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkbWluX29yX29wZXJhdG9yX29ubHkobGFiZWw6IGJ5dGVzKSAtPiB2b2lkOgphZG1pbl9vcl9vcGVyYXRvcl9vbmx5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEzMC0xMzEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYWRtaW5fb3Jfb3BlcmF0b3Jfb25seShzZWxmLCBsYWJlbDogU3RyaW5nKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTMyCiAgICAvLyBpZiBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW46CiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzEgLy8gMAogICAgYnl0ZWMgNSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYnogYWRtaW5fb3Jfb3BlcmF0b3Jfb25seV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzMKICAgIC8vIHJldHVybgogICAgcmV0c3ViCgphZG1pbl9vcl9vcGVyYXRvcl9vbmx5X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzQKICAgIC8vIHNlbGYub3BlcmF0b3Jfb25seShsYWJlbCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBvcGVyYXRvcl9vbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5vcGVyYXRvcl9vbmx5KGxhYmVsOiBieXRlcykgLT4gdm9pZDoKb3BlcmF0b3Jfb25seToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzYtMTM3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIG9wZXJhdG9yX29ubHkoc2VsZiwgbGFiZWw6IFN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEzOAogICAgLy8gb3BlcmF0b3JfaW5kZXggPSBzZWxmLmdldF9vcGVyYXRvcl9sYWJlbF9pbmRleChUeG4uc2VuZGVyLCBsYWJlbCkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBnZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXgKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gb3BlcmF0b3JfaW5kZXggIT0gVUludDY0KE5PVF9GT1VORF9LRVkpCiAgICBpbnRjIDUgLy8gNDI5NDk2NzI5NgogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNDAtMTQxCiAgICAvLyBvcGVyYXRvcl9pbmRleCAhPSBVSW50NjQoTk9UX0ZPVU5EX0tFWSkKICAgIC8vIGFuZCBvcGVyYXRvcl9pbmRleCAhPSBVSW50NjQoTk9UX0ZPVU5EX1ZBTFVFKSwKICAgIGJ6IG9wZXJhdG9yX29ubHlfYm9vbF9mYWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQxCiAgICAvLyBhbmQgb3BlcmF0b3JfaW5kZXggIT0gVUludDY0KE5PVF9GT1VORF9WQUxVRSksCiAgICBmcmFtZV9kaWcgMAogICAgaW50YyA0IC8vIDQyOTQ5NjcyOTUKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQwLTE0MQogICAgLy8gb3BlcmF0b3JfaW5kZXggIT0gVUludDY0KE5PVF9GT1VORF9LRVkpCiAgICAvLyBhbmQgb3BlcmF0b3JfaW5kZXggIT0gVUludDY0KE5PVF9GT1VORF9WQUxVRSksCiAgICBieiBvcGVyYXRvcl9vbmx5X2Jvb2xfZmFsc2VAMwogICAgaW50Y18wIC8vIDEKCm9wZXJhdG9yX29ubHlfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBvcGVyYXRvcl9vbmx5X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0MgogICAgLy8gUygiRVJSOlVOQVVUSCIpLAogICAgYnl0ZWMgMTEgLy8gIkVSUjpVTkFVVEgiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKb3BlcmF0b3Jfb25seV9hZnRlcl9pZl9lbHNlQDc6CiAgICByZXRzdWIKCm9wZXJhdG9yX29ubHlfYm9vbF9mYWxzZUAzOgogICAgaW50Y18xIC8vIDAKICAgIGIgb3BlcmF0b3Jfb25seV9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXgob3BlcmF0b3I6IGJ5dGVzLCBsYWJlbDogYnl0ZXMpIC0+IHVpbnQ2NDoKZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0NS0xNDYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4KHNlbGYsIG9wZXJhdG9yOiBBY2NvdW50LCBsYWJlbDogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18zIC8vICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNDcKICAgIC8vIGlmIG9wZXJhdG9yIG5vdCBpbiBzZWxmLm9wZXJhdG9yczoKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBibnogZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gcmV0dXJuIFVJbnQ2NChOT1RfRk9VTkRfS0VZKQogICAgaW50YyA1IC8vIDQyOTQ5NjcyOTYKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXhfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gZm9yIGlkeCwgc3RvcmVkX2xhYmVsIGluIHVlbnVtZXJhdGUoc2VsZi5vcGVyYXRvcnNbb3BlcmF0b3JdKToKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZXJhdG9ycyBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSAyCgpnZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXhfZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0OQogICAgLy8gZm9yIGlkeCwgc3RvcmVkX2xhYmVsIGluIHVlbnVtZXJhdGUoc2VsZi5vcGVyYXRvcnNbb3BlcmF0b3JdKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4X2FmdGVyX2ZvckA4CiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGV4dHJhY3QzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTUwCiAgICAvLyBpZiBzdG9yZWRfbGFiZWwgPT0gbGFiZWw6CiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gcmV0dXJuIGlkeAogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpnZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXhfYWZ0ZXJfaWZfZWxzZUA2OgogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4X2Zvcl9oZWFkZXJAMwoKZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4X2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gcmV0dXJuIFVJbnQ2NChOT1RfRk9VTkRfVkFMVUUpCiAgICBpbnRjIDQgLy8gNDI5NDk2NzI5NQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5hZGRfb3BlcmF0b3JfdG9fbGFiZWwob3BlcmF0b3I6IGJ5dGVzLCBsYWJlbDogYnl0ZXMpIC0+IHZvaWQ6CmFkZF9vcGVyYXRvcl90b19sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTQtMTU1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfb3BlcmF0b3JfdG9fbGFiZWwoc2VsZiwgb3BlcmF0b3I6IEFjY291bnQsIGxhYmVsOiBTdHJpbmcpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTYKICAgIC8vIHNlbGYuYWRtaW5fb3Jfb3BlcmF0b3Jfb25seShsYWJlbCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhZG1pbl9vcl9vcGVyYXRvcl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTU3CiAgICAvLyBlbnN1cmUobGFiZWwgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBhZGRfb3BlcmF0b3JfdG9fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gZW5zdXJlKGxhYmVsIGluIHNlbGYubGFiZWxzLCBTKCJFUlI6Tk9FWElTVCIpKQogICAgYnl0ZWNfMiAvLyAiRVJSOk5PRVhJU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYWRkX29wZXJhdG9yX3RvX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTU4LTE1OQogICAgLy8gIyBjaGVjayBpZiBvcGVyYXRvciBleGlzdHMgYWxyZWFkeQogICAgLy8gaWYgb3BlcmF0b3IgaW4gc2VsZi5vcGVyYXRvcnM6CiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogYWRkX29wZXJhdG9yX3RvX2xhYmVsX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTYyCiAgICAvLyBzZWxmLmdldF9vcGVyYXRvcl9sYWJlbF9pbmRleChvcGVyYXRvciwgbGFiZWwpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBnZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjMKICAgIC8vID09IFVJbnQ2NChOT1RfRk9VTkRfVkFMVUUpLAogICAgaW50YyA0IC8vIDQyOTQ5NjcyOTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyBzZWxmLmdldF9vcGVyYXRvcl9sYWJlbF9pbmRleChvcGVyYXRvciwgbGFiZWwpCiAgICAvLyA9PSBVSW50NjQoTk9UX0ZPVU5EX1ZBTFVFKSwKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGFkZF9vcGVyYXRvcl90b19sYWJlbF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjQKICAgIC8vIFMoIkVSUjpFWElTVFMiKSwKICAgIGJ5dGVjIDcgLy8gIkVSUjpFWElTVFMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYWRkX29wZXJhdG9yX3RvX2xhYmVsX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjctMTY4CiAgICAvLyAjIGFkZCBsYWJlbCB0byBvcGVyYXRvcgogICAgLy8gZXhpc3RpbmcgPSBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZXJhdG9ycyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjkKICAgIC8vIGV4aXN0aW5nLmFwcGVuZChhcmM0LlN0cmluZyhsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBpbnRjXzAgLy8gMQogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X2NvbmNhdF9ieXRlX2xlbmd0aF9oZWFkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTcwCiAgICAvLyBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0gPSBleGlzdGluZy5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9wdXQKCmFkZF9vcGVyYXRvcl90b19sYWJlbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTc1LTE3NgogICAgLy8gIyBpbmNyZW1lbnQgbGFiZWwgb3BlcmF0b3JzCiAgICAvLyBsYWJlbF9kZXNjcmlwdG9yID0gc2VsZi5sYWJlbHNbbGFiZWxdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sYWJlbHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTc4CiAgICAvLyBsYWJlbF9kZXNjcmlwdG9yLm51bV9vcGVyYXRvcnMubmF0aXZlICsgVUludDY0KDEpCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE3Ny0xNzkKICAgIC8vIGxhYmVsX2Rlc2NyaXB0b3IubnVtX29wZXJhdG9ycyA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIGxhYmVsX2Rlc2NyaXB0b3IubnVtX29wZXJhdG9ycy5uYXRpdmUgKyBVSW50NjQoMSkKICAgIC8vICkKICAgIGl0b2IKICAgIHJlcGxhY2UyIDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTgwCiAgICAvLyBzZWxmLmxhYmVsc1tsYWJlbF0gPSBsYWJlbF9kZXNjcmlwdG9yLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgphZGRfb3BlcmF0b3JfdG9fbGFiZWxfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTcyLTE3MwogICAgLy8gIyBuZXcgb3BlcmF0b3IsIGNyZWF0ZSBuZXcgYm94CiAgICAvLyBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0gPSBhcmM0LkR5bmFtaWNBcnJheShhcmM0LlN0cmluZyhsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBieXRlYyA5IC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMiAvLyAweDAwMDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3B1dAogICAgYiBhZGRfb3BlcmF0b3JfdG9fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuaGFzX29wZXJhdG9yX2xhYmVsKG9wZXJhdG9yOiBieXRlcywgbGFiZWw6IGJ5dGVzKSAtPiB1aW50NjQ6Cmhhc19vcGVyYXRvcl9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODItMTgzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgaGFzX29wZXJhdG9yX2xhYmVsKHNlbGYsIG9wZXJhdG9yOiBBY2NvdW50LCBsYWJlbDogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODQKICAgIC8vIGVuc3VyZShsYWJlbC5ieXRlcy5sZW5ndGggPT0gMiwgUygiRVJSOkxFTkdUSCIpKQogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBoYXNfb3BlcmF0b3JfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTg0CiAgICAvLyBlbnN1cmUobGFiZWwuYnl0ZXMubGVuZ3RoID09IDIsIFMoIkVSUjpMRU5HVEgiKSkKICAgIGJ5dGVjIDYgLy8gIkVSUjpMRU5HVEgiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKaGFzX29wZXJhdG9yX2xhYmVsX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODUKICAgIC8vIGlkeCA9IHNlbGYuZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4KG9wZXJhdG9yLCBsYWJlbCkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF9vcGVyYXRvcl9sYWJlbF9pbmRleAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODYKICAgIC8vIHJldHVybiBVSW50NjQoaWR4ICE9IE5PVF9GT1VORF9LRVkgYW5kIGlkeCAhPSBOT1RfRk9VTkRfVkFMVUUpCiAgICBpbnRjIDUgLy8gNDI5NDk2NzI5NgogICAgIT0KICAgIGJ6IGhhc19vcGVyYXRvcl9sYWJlbF9ib29sX2ZhbHNlQDMKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjIDQgLy8gNDI5NDk2NzI5NQogICAgIT0KICAgIGJ6IGhhc19vcGVyYXRvcl9sYWJlbF9ib29sX2ZhbHNlQDMKICAgIGludGNfMCAvLyAxCgpoYXNfb3BlcmF0b3JfbGFiZWxfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gcmV0dXJuIFVJbnQ2NChpZHggIT0gTk9UX0ZPVU5EX0tFWSBhbmQgaWR4ICE9IE5PVF9GT1VORF9WQUxVRSkKICAgIHN3YXAKICAgIHJldHN1YgoKaGFzX29wZXJhdG9yX2xhYmVsX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIGhhc19vcGVyYXRvcl9sYWJlbF9ib29sX21lcmdlQDQKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5yZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbChvcGVyYXRvcjogYnl0ZXMsIGxhYmVsOiBieXRlcykgLT4gdm9pZDoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTg4LTE4OQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWwoc2VsZiwgb3BlcmF0b3I6IEFjY291bnQsIGxhYmVsOiBTdHJpbmcpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMSAvLyAwCiAgICBkdXBuIDQKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gc2VsZi5hZG1pbl9vcl9vcGVyYXRvcl9vbmx5KGxhYmVsKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGFkbWluX29yX29wZXJhdG9yX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTIKICAgIC8vIGVuc3VyZShsYWJlbCBpbiBzZWxmLmxhYmVscywgUygiRVJSOk5PRVhJU1QiKSkKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMjgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTIKICAgIC8vIGVuc3VyZShsYWJlbCBpbiBzZWxmLmxhYmVscywgUygiRVJSOk5PRVhJU1QiKSkKICAgIGJ5dGVjXzIgLy8gIkVSUjpOT0VYSVNUIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMjg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTkzCiAgICAvLyBlbnN1cmUob3BlcmF0b3IgaW4gc2VsZi5vcGVyYXRvcnMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTkzCiAgICAvLyBlbnN1cmUob3BlcmF0b3IgaW4gc2VsZi5vcGVyYXRvcnMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBieXRlY18yIC8vICJFUlI6Tk9FWElTVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDMyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5NS0xOTYKICAgIC8vICMgZW5zdXJlIGxhYmVsIGV4aXN0cyBpbiBvcGVyYXRvcgogICAgLy8gbGFiZWxfaWR4ID0gc2VsZi5nZXRfb3BlcmF0b3JfbGFiZWxfaW5kZXgob3BlcmF0b3IsIGxhYmVsKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5OAogICAgLy8gbGFiZWxfaWR4ICE9IFVJbnQ2NChOT1RfRk9VTkRfVkFMVUUpCiAgICBpbnRjIDQgLy8gNDI5NDk2NzI5NQogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTgtMjAwCiAgICAvLyBsYWJlbF9pZHggIT0gVUludDY0KE5PVF9GT1VORF9WQUxVRSkKICAgIC8vIGFuZCBsYWJlbF9pZHgKICAgIC8vICE9IFVJbnQ2NChOT1RfRk9VTkRfS0VZKSwgICMga2V5IGNoZWNrIHJlZHVuZGFudCwgY2hlY2tlZCBhYm92ZQogICAgYnogcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF9mYWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTk5LTIwMAogICAgLy8gYW5kIGxhYmVsX2lkeAogICAgLy8gIT0gVUludDY0KE5PVF9GT1VORF9LRVkpLCAgIyBrZXkgY2hlY2sgcmVkdW5kYW50LCBjaGVja2VkIGFib3ZlCiAgICBmcmFtZV9kaWcgNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gIT0gVUludDY0KE5PVF9GT1VORF9LRVkpLCAgIyBrZXkgY2hlY2sgcmVkdW5kYW50LCBjaGVja2VkIGFib3ZlCiAgICBpbnRjIDUgLy8gNDI5NDk2NzI5NgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5OS0yMDAKICAgIC8vIGFuZCBsYWJlbF9pZHgKICAgIC8vICE9IFVJbnQ2NChOT1RfRk9VTkRfS0VZKSwgICMga2V5IGNoZWNrIHJlZHVuZGFudCwgY2hlY2tlZCBhYm92ZQogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTgtMjAwCiAgICAvLyBsYWJlbF9pZHggIT0gVUludDY0KE5PVF9GT1VORF9WQUxVRSkKICAgIC8vIGFuZCBsYWJlbF9pZHgKICAgIC8vICE9IFVJbnQ2NChOT1RfRk9VTkRfS0VZKSwgICMga2V5IGNoZWNrIHJlZHVuZGFudCwgY2hlY2tlZCBhYm92ZQogICAgYnogcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF9mYWxzZUAzCiAgICBpbnRjXzAgLy8gMQoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDI0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjAxCiAgICAvLyBTKCJFUlI6Tk9FWElTVCIpLAogICAgYnl0ZWNfMiAvLyAiRVJSOk5PRVhJU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMDQtMjA1CiAgICAvLyAjIGVuc3VyZSBvbmx5IGVtcHR5IGxhYmVscyBjYW4gYmUgbGVmdCBvcGVyYXRvci1sZXNzCiAgICAvLyBsYWJlbF9kZXNjcmlwdG9yID0gc2VsZi5sYWJlbHNbbGFiZWxdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGFiZWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5udW1fb3BlcmF0b3JzID4gMSBvciBsYWJlbF9kZXNjcmlwdG9yLm51bV9hc3NldHMgPT0gMCwKICAgIGV4dHJhY3QgMTIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDEKICAgIGI+CiAgICBibnogcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF90cnVlQDYKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGVjIDQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICBiPT0KICAgIGJ6IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Jvb2xfZmFsc2VANwoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF90cnVlQDY6CiAgICBpbnRjXzAgLy8gMQoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF9tZXJnZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjA4CiAgICAvLyBTKCJFUlI6Tk9FTVBUWSIpLAogICAgYnl0ZWMgOCAvLyAiRVJSOk5PRU1QVFkiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMTIKICAgIC8vIGxhYmVsX2Rlc2NyaXB0b3IubnVtX29wZXJhdG9ycy5uYXRpdmUgLSBVSW50NjQoMSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIxMC0yMTMKICAgIC8vICMgZGVjciBvcGVyYXRvciBjb3VudAogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5udW1fb3BlcmF0b3JzID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgbGFiZWxfZGVzY3JpcHRvci5udW1fb3BlcmF0b3JzLm5hdGl2ZSAtIFVJbnQ2NCgxKQogICAgLy8gKQogICAgaXRvYgogICAgcmVwbGFjZTIgMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMTQKICAgIC8vIHNlbGYubGFiZWxzW2xhYmVsXSA9IGxhYmVsX2Rlc2NyaXB0b3IuY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjE2CiAgICAvLyBpZiBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0ubGVuZ3RoID09IDE6CiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZXJhdG9ycyBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMTcKICAgIC8vIGRlbCBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0KICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICByZXRzdWIKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Vsc2VfYm9keUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMTkKICAgIC8vIG5leHRfbGlzdCA9IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjIwLTIyMwogICAgLy8gIyB3YWxrLCBwdXNoIGV2ZXJ5dGhpbmcgZXhjZXB0IGluZGV4CiAgICAvLyAjIHRoaXMgaW1wbGVtZW50YXRpb24gd2Fsa3MgdHdpY2UgKG9uY2UgaW4gZ2V0X29wZXJhdG9yX2xhYmVsX2luZGV4KQogICAgLy8gIyBjb3VsZCBiZSBtb3JlIGVmZmljaWVudAogICAgLy8gZm9yIGlkeCwgc3RvcmVkX2xhYmVsIGluIHVlbnVtZXJhdGUoc2VsZi5vcGVyYXRvcnNbb3BlcmF0b3JdKToKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDEKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLm9wZXJhdG9ycyBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfYnVyeSA1CiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSA2CgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9mb3JfaGVhZGVyQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIyMC0yMjMKICAgIC8vICMgd2FsaywgcHVzaCBldmVyeXRoaW5nIGV4Y2VwdCBpbmRleAogICAgLy8gIyB0aGlzIGltcGxlbWVudGF0aW9uIHdhbGtzIHR3aWNlIChvbmNlIGluIGdldF9vcGVyYXRvcl9sYWJlbF9pbmRleCkKICAgIC8vICMgY291bGQgYmUgbW9yZSBlZmZpY2llbnQKICAgIC8vIGZvciBpZHgsIHN0b3JlZF9sYWJlbCBpbiB1ZW51bWVyYXRlKHNlbGYub3BlcmF0b3JzW29wZXJhdG9yXSk6CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2ZvckAxNgogICAgZnJhbWVfZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZGlnIDEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGV4dHJhY3QzCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjQKICAgIC8vIGlmIGxhYmVsX2lkeCAhPSBpZHg6CiAgICBmcmFtZV9kaWcgNwogICAgIT0KICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDMKICAgIGJ6IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjUKICAgIC8vIG5leHRfbGlzdC5hcHBlbmQoc3RvcmVkX2xhYmVsKQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzAgLy8gMQogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X2NvbmNhdF9ieXRlX2xlbmd0aF9oZWFkCiAgICBmcmFtZV9idXJ5IDMKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgNgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNgogICAgYiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9mb3JfaGVhZGVyQDExCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9mb3JAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjI3CiAgICAvLyBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0gPSBuZXh0X2xpc3QuY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMgogICAgYm94X3B1dAogICAgcmV0c3ViCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9ib29sX2ZhbHNlQDc6CiAgICBpbnRjXzEgLy8gMAogICAgYiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9ib29sX21lcmdlQDgKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMSAvLyAwCiAgICBiIHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9vcGVyYXRvcl9sYWJlbHMob3BlcmF0b3I6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X29wZXJhdG9yX2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjktMjMwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X29wZXJhdG9yX2xhYmVscyhzZWxmLCBvcGVyYXRvcjogQWNjb3VudCkgLT4gTGFiZWxMaXN0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjMxCiAgICAvLyBpZiBvcGVyYXRvciBpbiBzZWxmLm9wZXJhdG9yczoKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBnZXRfb3BlcmF0b3JfbGFiZWxzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIzMgogICAgLy8gcmV0dXJuIHNlbGYub3BlcmF0b3JzW29wZXJhdG9yXQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5vcGVyYXRvcnMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCmdldF9vcGVyYXRvcl9sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyByZXR1cm4gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCkKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjMzLTIzNAogICAgLy8gIyByZXR1cm4gZW1wdHkgbGlzdAogICAgLy8gcmV0dXJuIGVtcHR5X2xpc3QoKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0X2xhYmVsX2luZGV4KGFzc2V0OiB1aW50NjQsIGxhYmVsOiBieXRlcykgLT4gdWludDY0OgpnZXRfYXNzZXRfbGFiZWxfaW5kZXg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjM2LTIzNwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfYXNzZXRfbGFiZWxfaW5kZXgoc2VsZiwgYXNzZXQ6IEFzc2V0LCBsYWJlbDogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIGludGNfMSAvLyAwCiAgICBkdXAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIzOAogICAgLy8gZW5zdXJlKGxhYmVsLmJ5dGVzLmxlbmd0aCA9PSAyLCBTKCJFUlI6TEVOR1RIIikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaW50Y18yIC8vIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGdldF9hc3NldF9sYWJlbF9pbmRleF9hZnRlcl9pZl9lbHNlQDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjM4CiAgICAvLyBlbnN1cmUobGFiZWwuYnl0ZXMubGVuZ3RoID09IDIsIFMoIkVSUjpMRU5HVEgiKSkKICAgIGJ5dGVjIDYgLy8gIkVSUjpMRU5HVEgiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKZ2V0X2Fzc2V0X2xhYmVsX2luZGV4X2FmdGVyX2lmX2Vsc2VAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjM5CiAgICAvLyBpZiBhc3NldCBub3QgaW4gc2VsZi5hc3NldHM6CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJueiBnZXRfYXNzZXRfbGFiZWxfaW5kZXhfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjQwCiAgICAvLyByZXR1cm4gVUludDY0KE5PVF9GT1VORF9LRVkpCiAgICBpbnRjIDUgLy8gNDI5NDk2NzI5NgogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCmdldF9hc3NldF9sYWJlbF9pbmRleF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjQxCiAgICAvLyBmb3IgaWR4LCBzdG9yZWRfbGFiZWwgaW4gdWVudW1lcmF0ZShzZWxmLmFzc2V0c1thc3NldF0pOgogICAgZnJhbWVfZGlnIDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2J1cnkgMgogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgMwoKZ2V0X2Fzc2V0X2xhYmVsX2luZGV4X2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDEKICAgIC8vIGZvciBpZHgsIHN0b3JlZF9sYWJlbCBpbiB1ZW51bWVyYXRlKHNlbGYuYXNzZXRzW2Fzc2V0XSk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGdldF9hc3NldF9sYWJlbF9pbmRleF9hZnRlcl9mb3JAOAogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gaWYgc3RvcmVkX2xhYmVsID09IGxhYmVsOgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IGdldF9hc3NldF9sYWJlbF9pbmRleF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDMKICAgIC8vIHJldHVybiBpZHgKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X2Fzc2V0X2xhYmVsX2luZGV4X2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAzCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGdldF9hc3NldF9sYWJlbF9pbmRleF9mb3JfaGVhZGVyQDMKCmdldF9hc3NldF9sYWJlbF9pbmRleF9hZnRlcl9mb3JAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDQKICAgIC8vIHJldHVybiBVSW50NjQoTk9UX0ZPVU5EX1ZBTFVFKQogICAgaW50YyA0IC8vIDQyOTQ5NjcyOTUKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2FkZF9sYWJlbF90b19hc3NldChsYWJlbDogYnl0ZXMsIGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6Cl9hZGRfbGFiZWxfdG9fYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjQ2LTI0NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYWRkX2xhYmVsX3RvX2Fzc2V0KHNlbGYsIGxhYmVsOiBTdHJpbmcsIGFzc2V0OiBBc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDgKICAgIC8vIGVuc3VyZShsYWJlbCBpbiBzZWxmLmxhYmVscywgUygiRVJSOk5PRVhJU1QiKSkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IF9hZGRfbGFiZWxfdG9fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0OAogICAgLy8gZW5zdXJlKGxhYmVsIGluIHNlbGYubGFiZWxzLCBTKCJFUlI6Tk9FWElTVCIpKQogICAgYnl0ZWNfMiAvLyAiRVJSOk5PRVhJU1QiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKX2FkZF9sYWJlbF90b19hc3NldF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gaWYgYXNzZXQgaW4gc2VsZi5hc3NldHM6CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9hZGRfbGFiZWxfdG9fYXNzZXRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTIKICAgIC8vIHNlbGYuZ2V0X2Fzc2V0X2xhYmVsX2luZGV4KGFzc2V0LCBsYWJlbCkgPT0gVUludDY0KE5PVF9GT1VORF9WQUxVRSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBnZXRfYXNzZXRfbGFiZWxfaW5kZXgKICAgIGludGMgNCAvLyA0Mjk0OTY3Mjk1CiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBfYWRkX2xhYmVsX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gUygiRVJSOkVYSVNUUyIpLAogICAgYnl0ZWMgNyAvLyAiRVJSOkVYSVNUUyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpfYWRkX2xhYmVsX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTUtMjU2CiAgICAvLyAjIGFkZCBsYWJlbCB0byBhc3NldAogICAgLy8gZXhpc3RpbmcgPSBzZWxmLmFzc2V0c1thc3NldF0uY29weSgpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjU3CiAgICAvLyBleGlzdGluZy5hcHBlbmQoYXJjNC5TdHJpbmcobGFiZWwpKQogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgaW50Y18wIC8vIDEKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfYnl0ZV9sZW5ndGhfaGVhZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI1OAogICAgLy8gc2VsZi5hc3NldHNbYXNzZXRdID0gZXhpc3RpbmcuY29weSgpCiAgICBkaWcgMQogICAgYm94X2RlbAogICAgcG9wCiAgICBib3hfcHV0CgpfYWRkX2xhYmVsX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjMtMjY0CiAgICAvLyAjIGluY3IgYXNzZXQgY291bnQKICAgIC8vIGxhYmVsX2Rlc2NyaXB0b3IgPSBzZWxmLmxhYmVsc1tsYWJlbF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhYmVscyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjYKICAgIC8vIGxhYmVsX2Rlc2NyaXB0b3IubnVtX2Fzc2V0cy5uYXRpdmUgKyBVSW50NjQoMSkKICAgIGR1cAogICAgcHVzaGludCA0IC8vIDQKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI2NS0yNjcKICAgIC8vIGxhYmVsX2Rlc2NyaXB0b3IubnVtX2Fzc2V0cyA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIGxhYmVsX2Rlc2NyaXB0b3IubnVtX2Fzc2V0cy5uYXRpdmUgKyBVSW50NjQoMSkKICAgIC8vICkKICAgIGl0b2IKICAgIHJlcGxhY2UyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjgKICAgIC8vIHNlbGYubGFiZWxzW2xhYmVsXSA9IGxhYmVsX2Rlc2NyaXB0b3IuY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCl9hZGRfbGFiZWxfdG9fYXNzZXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjYwLTI2MQogICAgLy8gIyBuZXcgYXNzZXQsIGNyZWF0ZSBuZXcgYm94CiAgICAvLyBzZWxmLmFzc2V0c1thc3NldF0gPSBhcmM0LkR5bmFtaWNBcnJheShhcmM0LlN0cmluZyhsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBieXRlYyA5IC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBieXRlYyAxMiAvLyAweDAwMDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICBiIF9hZGRfbGFiZWxfdG9fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuYWRkX2xhYmVsX3RvX2Fzc2V0KGxhYmVsOiBieXRlcywgYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKYWRkX2xhYmVsX3RvX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI3MC0yNzEKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFkZF9sYWJlbF90b19hc3NldChzZWxmLCBsYWJlbDogU3RyaW5nLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzIKICAgIC8vIHNlbGYub3BlcmF0b3Jfb25seShsYWJlbCkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBvcGVyYXRvcl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjczCiAgICAvLyBzZWxmLl9hZGRfbGFiZWxfdG9fYXNzZXQobGFiZWwsIGFzc2V0KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2FkZF9sYWJlbF90b19hc3NldAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuYWRkX2xhYmVsX3RvX2Fzc2V0cyhsYWJlbDogYnl0ZXMsIGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmFkZF9sYWJlbF90b19hc3NldHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjc1LTI3OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYWRkX2xhYmVsX3RvX2Fzc2V0cygKICAgIC8vICAgICBzZWxmLCBsYWJlbDogU3RyaW5nLCBhc3NldHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XQogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjc5CiAgICAvLyBzZWxmLm9wZXJhdG9yX29ubHkobGFiZWwpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgb3BlcmF0b3Jfb25seQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gZm9yIF9pLCBhc3NldCBpbiB1ZW51bWVyYXRlKGFzc2V0cyk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmFkZF9sYWJlbF90b19hc3NldHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4MAogICAgLy8gZm9yIF9pLCBhc3NldCBpbiB1ZW51bWVyYXRlKGFzc2V0cyk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGFkZF9sYWJlbF90b19hc3NldHNfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjgxCiAgICAvLyBzZWxmLl9hZGRfbGFiZWxfdG9fYXNzZXQobGFiZWwsIEFzc2V0KGFzc2V0Lm5hdGl2ZSkpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjYWxsc3ViIF9hZGRfbGFiZWxfdG9fYXNzZXQKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgYWRkX2xhYmVsX3RvX2Fzc2V0c19mb3JfaGVhZGVyQDEKCmFkZF9sYWJlbF90b19hc3NldHNfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5yZW1vdmVfbGFiZWxfZnJvbV9hc3NldChsYWJlbDogYnl0ZXMsIGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CnJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4My0yODQKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0KHNlbGYsIGxhYmVsOiBTdHJpbmcsIGFzc2V0OiBBc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18xIC8vIDAKICAgIGR1cG4gMwogICAgYnl0ZWNfMyAvLyAiIgogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjg1CiAgICAvLyBlbnN1cmUobGFiZWwgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDIwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjg1CiAgICAvLyBlbnN1cmUobGFiZWwgaW4gc2VsZi5sYWJlbHMsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBieXRlY18yIC8vICJFUlI6Tk9FWElTVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gc2VsZi5vcGVyYXRvcl9vbmx5KGxhYmVsKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIG9wZXJhdG9yX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyODkKICAgIC8vIGZvdW5kID0gRmFsc2UKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTAKICAgIC8vIGlmIHNlbGYuYXNzZXRzW2Fzc2V0XS5sZW5ndGggPT0gMToKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2V0cyBlbnRyeSBleGlzdHMKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDEKICAgID09CiAgICBieiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gaWYgc2VsZi5hc3NldHNbYXNzZXRdWzBdID09IGxhYmVsOgogICAgZnJhbWVfZGlnIDMKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFzc2V0cyBlbnRyeSBleGlzdHMKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIHN3YXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIGJ6IHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjkyCiAgICAvLyBkZWwgc2VsZi5hc3NldHNbYXNzZXRdCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjkzCiAgICAvLyBmb3VuZCA9IFRydWUKICAgIGludGNfMCAvLyAxCiAgICBmcmFtZV9idXJ5IDYKCnJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgZnJhbWVfZGlnIDYKICAgIGJueiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzA4CiAgICAvLyBlbnN1cmUoZm91bmQsIFMoIkVSUjpOT0VYSVNUIikpCiAgICBieXRlY18yIC8vICJFUlI6Tk9FWElTVCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxMC0zMTEKICAgIC8vICMgZGVjciBhc3NldCBjb3VudAogICAgLy8gbGFiZWxfZGVzY3JpcHRvciA9IHNlbGYubGFiZWxzW2xhYmVsXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGFiZWxzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5udW1fYXNzZXRzLm5hdGl2ZSAtIFVJbnQ2NCgxKQogICAgZHVwCiAgICBwdXNoaW50IDQgLy8gNAogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzEyLTMxNAogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5udW1fYXNzZXRzID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgbGFiZWxfZGVzY3JpcHRvci5udW1fYXNzZXRzLm5hdGl2ZSAtIFVJbnQ2NCgxKQogICAgLy8gKQogICAgaXRvYgogICAgcmVwbGFjZTIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gc2VsZi5sYWJlbHNbbGFiZWxdID0gbGFiZWxfZGVzY3JpcHRvci5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjk1CiAgICAvLyBmb3VuZCA9IEZhbHNlCiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSA2CiAgICBiIHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2lmX2Vsc2VAMTMKCnJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gbmV4dF9saXN0ID0gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCkKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTgtMzAwCiAgICAvLyAjIHdhbGssIHB1c2ggZXZlcnl0aGluZyB0byBuZXcgYm94IGV4Y2VwdCBsYWJlbAogICAgLy8gIyBzYXZlICRmb3VuZCB0byB0aHJvdyBpZiBub3QgZm91bmQKICAgIC8vIGZvciBfaWR4LCBzdG9yZWRfbGFiZWwgaW4gdWVudW1lcmF0ZShzZWxmLmFzc2V0c1thc3NldF0pOgogICAgZnJhbWVfZGlnIDMKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAwCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2J1cnkgNQogICAgaW50Y18xIC8vIDAKICAgIGZyYW1lX2J1cnkgNAoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfZm9yX2hlYWRlckA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI5OC0zMDAKICAgIC8vICMgd2FsaywgcHVzaCBldmVyeXRoaW5nIHRvIG5ldyBib3ggZXhjZXB0IGxhYmVsCiAgICAvLyAjIHNhdmUgJGZvdW5kIHRvIHRocm93IGlmIG5vdCBmb3VuZAogICAgLy8gZm9yIF9pZHgsIHN0b3JlZF9sYWJlbCBpbiB1ZW51bWVyYXRlKHNlbGYuYXNzZXRzW2Fzc2V0XSk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDUKICAgIDwKICAgIGJ6IHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2ZvckAxMgogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGRpZyAxCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMDEKICAgIC8vIGlmIHN0b3JlZF9sYWJlbCAhPSBsYWJlbDoKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgLTIKICAgICE9CiAgICBieiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9lbHNlX2JvZHlAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMwMgogICAgLy8gbmV4dF9saXN0LmFwcGVuZChzdG9yZWRfbGFiZWwpCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMCAvLyAxCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWQKICAgIGZyYW1lX2J1cnkgMQoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2Zvcl9oZWFkZXJANgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfZWxzZV9ib2R5QDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzA0CiAgICAvLyBmb3VuZCA9IFRydWUKICAgIGludGNfMCAvLyAxCiAgICBmcmFtZV9idXJ5IDYKICAgIGIgcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMAoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfZm9yQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMwNgogICAgLy8gc2VsZi5hc3NldHNbYXNzZXRdID0gbmV4dF9saXN0LmNvcHkoKQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgMQogICAgYm94X3B1dAogICAgYiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDEzCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuaGFzX2Fzc2V0X2xhYmVsKGFzc2V0X2lkOiB1aW50NjQsIGxhYmVsOiBieXRlcykgLT4gdWludDY0OgpoYXNfYXNzZXRfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzE3LTMxOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGhhc19hc3NldF9sYWJlbChzZWxmLCBhc3NldF9pZDogVUludDY0LCBsYWJlbDogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMjAKICAgIC8vIGlkeCA9IHNlbGYuZ2V0X2Fzc2V0X2xhYmVsX2luZGV4KGFzc2V0LCBsYWJlbCkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGdldF9hc3NldF9sYWJlbF9pbmRleAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzIxCiAgICAvLyBpZiBpZHggIT0gTk9UX0ZPVU5EX0tFWSBhbmQgaWR4ICE9IE5PVF9GT1VORF9WQUxVRToKICAgIGludGMgNSAvLyA0Mjk0OTY3Mjk2CiAgICAhPQogICAgYnogaGFzX2Fzc2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgZnJhbWVfZGlnIDAKICAgIGludGMgNCAvLyA0Mjk0OTY3Mjk1CiAgICAhPQogICAgYnogaGFzX2Fzc2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyMgogICAgLy8gcmV0dXJuIFVJbnQ2NCgxKQogICAgaW50Y18wIC8vIDEKICAgIHN3YXAKICAgIHJldHN1YgoKaGFzX2Fzc2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMjMKICAgIC8vIHJldHVybiBVSW50NjQoMCkKICAgIGludGNfMSAvLyAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfbGFiZWxzKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyNS0zMjYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfbGFiZWxzKHNlbGYsIGFzc2V0OiBBc3NldCkgLT4gTGFiZWxMaXN0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzI3CiAgICAvLyBpZiBhc3NldCBpbiBzZWxmLmFzc2V0czoKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IGdldF9hc3NldF9sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzI4CiAgICAvLyByZXR1cm4gc2VsZi5hc3NldHNbYXNzZXRdCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRzIGVudHJ5IGV4aXN0cwogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfYXNzZXRfbGFiZWxzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OQogICAgLy8gcmV0dXJuIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyOS0zMzAKICAgIC8vICMgcmV0dXJuIGVtcHR5CiAgICAvLyByZXR1cm4gZW1wdHlfbGlzdCgpCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX2xhYmVscyhhc3NldHM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2Fzc2V0c19sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzMyLTMzNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfbGFiZWxzKAogICAgLy8gICAgIHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdCiAgICAvLyApIC0+IGFyYzQuRHluYW1pY0FycmF5W0xhYmVsTGlzdF06CiAgICBwcm90byAxIDEKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzM2CiAgICAvLyBvdXQgPSBhcmM0LkR5bmFtaWNBcnJheVtMYWJlbExpc3RdKCkKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzM3CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c19sYWJlbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMzNwogICAgLy8gZm9yIF9pLCBhc3NldF9pZCBpbiB1ZW51bWVyYXRlKGFzc2V0cyk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfbGFiZWxzX2FmdGVyX2ZvckA3CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18zIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMzgKICAgIC8vIGFzc2V0ID0gQXNzZXQoYXNzZXRfaWQubmF0aXZlKQogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMzkKICAgIC8vIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzOgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogZ2V0X2Fzc2V0c19sYWJlbHNfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDAKICAgIC8vIG91dC5hcHBlbmQoc2VsZi5hc3NldHNbYXNzZXRdLmNvcHkoKSkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCiAgICBieXRlYyA5IC8vIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMQogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2R5bmFtaWNfZWxlbWVudAogICAgZnJhbWVfYnVyeSAxCgpnZXRfYXNzZXRzX2xhYmVsc19hZnRlcl9pZl9lbHNlQDU6CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgYiBnZXRfYXNzZXRzX2xhYmVsc19mb3JfaGVhZGVyQDEKCmdldF9hc3NldHNfbGFiZWxzX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0MgogICAgLy8gb3V0LmFwcGVuZChlbXB0eV9saXN0KCkpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMQogICAgcHVzaGJ5dGVzIDB4MDAwMjAwMDAKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfZHluYW1pY19lbGVtZW50CiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c19sYWJlbHNfYWZ0ZXJfaWZfZWxzZUA1CgpnZXRfYXNzZXRzX2xhYmVsc19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDMKICAgIC8vIHJldHVybiBvdXQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmxvZ19hc3NldHNfbGFiZWxzKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmxvZ19hc3NldHNfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0NS0zNDYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBsb2dfYXNzZXRzX2xhYmVscyhzZWxmLCBhc3NldHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDcKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpsb2dfYXNzZXRzX2xhYmVsc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzQ3CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogbG9nX2Fzc2V0c19sYWJlbHNfYWZ0ZXJfZm9yQDcKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0OAogICAgLy8gYXNzZXQgPSBBc3NldChhc3NldF9pZC5uYXRpdmUpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0OQogICAgLy8gaWYgYXNzZXQgaW4gc2VsZi5hc3NldHM6CiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBsb2dfYXNzZXRzX2xhYmVsc19lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM1MAogICAgLy8gbG9nKHNlbGYuYXNzZXRzW2Fzc2V0XSkKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCiAgICBsb2cKCmxvZ19hc3NldHNfbGFiZWxzX2FmdGVyX2lmX2Vsc2VANToKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGxvZ19hc3NldHNfbGFiZWxzX2Zvcl9oZWFkZXJAMQoKbG9nX2Fzc2V0c19sYWJlbHNfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKQogICAgYnl0ZWNfMSAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNTIKICAgIC8vIGxvZyhlbXB0eV9saXN0KCkpCiAgICBsb2cKICAgIGIgbG9nX2Fzc2V0c19sYWJlbHNfYWZ0ZXJfaWZfZWxzZUA1Cgpsb2dfYXNzZXRzX2xhYmVsc19hZnRlcl9mb3JANzoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLl9nZXRfYXNzZXRfbWljcm8oYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfbWljcm86CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzYwLTM2MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X2Fzc2V0X21pY3JvKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IEFzc2V0TWljcm86CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjQKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjUKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjMtMzY2CiAgICAvLyByZXR1cm4gQXNzZXRNaWNybygKICAgIC8vICAgICB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIC8vICAgICBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfbWljcm8oYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF9taWNybzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjgtMzY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X21pY3JvKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0TWljcm86CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzAKICAgIC8vIHJldHVybiBzZWxmLl9nZXRfYXNzZXRfbWljcm8oYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9taWNybwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c19taWNybyhhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpnZXRfYXNzZXRzX21pY3JvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3Mi0zNzMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX21pY3JvKHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzc0CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c19taWNyb19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzc0CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZ2V0X2Fzc2V0c19taWNyb19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzUKICAgIC8vIGxvZyhzZWxmLl9nZXRfYXNzZXRfbWljcm8oYXNzZXRfaWQubmF0aXZlKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfbWljcm8KICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBnZXRfYXNzZXRzX21pY3JvX2Zvcl9oZWFkZXJAMQoKZ2V0X2Fzc2V0c19taWNyb19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLl9nZXRfYXNzZXRfbWljcm9fbGFiZWxzKGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfZ2V0X2Fzc2V0X21pY3JvX2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzktMzgwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfbWljcm9fbGFiZWxzKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IEFzc2V0TWljcm9MYWJlbHM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODMKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODQKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODUKICAgIC8vIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX2dldF9hc3NldF9taWNyb19sYWJlbHNfdGVybmFyeV9mYWxzZUAyCiAgICBmcmFtZV9kaWcgMgogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRzIGVudHJ5IGV4aXN0cwoKX2dldF9hc3NldF9taWNyb19sYWJlbHNfdGVybmFyeV9tZXJnZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4Mi0zODYKICAgIC8vIHJldHVybiBBc3NldE1pY3JvTGFiZWxzKAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDUgLy8gNQogICAgKwogICAgYnl0ZWMgMTMgLy8gMHgwMDA1CiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCl9nZXRfYXNzZXRfbWljcm9fbGFiZWxzX3Rlcm5hcnlfZmFsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OQogICAgLy8gcmV0dXJuIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgYiBfZ2V0X2Fzc2V0X21pY3JvX2xhYmVsc190ZXJuYXJ5X21lcmdlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfbWljcm9fbGFiZWxzKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfbWljcm9fbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4OC0zODkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfbWljcm9fbGFiZWxzKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0TWljcm9MYWJlbHM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTAKICAgIC8vIHJldHVybiBzZWxmLl9nZXRfYXNzZXRfbWljcm9fbGFiZWxzKGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfbWljcm9fbGFiZWxzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX21pY3JvX2xhYmVscyhhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpnZXRfYXNzZXRzX21pY3JvX2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTItMzkzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0c19taWNyb19sYWJlbHMoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTQKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX21pY3JvX2xhYmVsc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzk0CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZ2V0X2Fzc2V0c19taWNyb19sYWJlbHNfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzk1CiAgICAvLyBsb2coc2VsZi5fZ2V0X2Fzc2V0X21pY3JvX2xhYmVscyhhc3NldF9pZC5uYXRpdmUpKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2dldF9hc3NldF9taWNyb19sYWJlbHMKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBnZXRfYXNzZXRzX21pY3JvX2xhYmVsc19mb3JfaGVhZGVyQDEKCmdldF9hc3NldHNfbWljcm9fbGFiZWxzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF90aW55KGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfZ2V0X2Fzc2V0X3Rpbnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzk5LTQwMAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X2Fzc2V0X3Rpbnkoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRUaW55OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDAzCiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQwNAogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQwNQogICAgLy8gZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXREZWNpbWFscwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQwMi00MDYKICAgIC8vIHJldHVybiBBc3NldFRpbnkoCiAgICAvLyAgICAgbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIC8vICAgICB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIC8vICAgICBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIC8vICkKICAgIGRpZyAyCiAgICBsZW4KICAgIHB1c2hpbnQgNSAvLyA1CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgYnl0ZWMgMTMgLy8gMHgwMDA1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0X3RpbnkoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF90aW55OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQwOC00MDkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfdGlueShzZWxmLCBhc3NldDogVUludDY0KSAtPiBBc3NldFRpbnk6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTAKICAgIC8vIHJldHVybiBzZWxmLl9nZXRfYXNzZXRfdGlueShhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RpbnkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldHNfdGlueShhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpnZXRfYXNzZXRzX3Rpbnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDEyLTQxMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfdGlueShzZWxmLCBhc3NldHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQxNAogICAgLy8gZm9yIF9pLCBhc3NldF9pZCBpbiB1ZW51bWVyYXRlKGFzc2V0cyk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmdldF9hc3NldHNfdGlueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDE0CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZ2V0X2Fzc2V0c190aW55X2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQxNQogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF90aW55KGFzc2V0X2lkLm5hdGl2ZSkpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RpbnkKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBnZXRfYXNzZXRzX3RpbnlfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX3RpbnlfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzKGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQxOS00MjAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2dldF9hc3NldF90aW55X2xhYmVscyhzZWxmLCBhc3NldF9pZDogVUludDY0KSAtPiBBc3NldFRpbnlMYWJlbHM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MjMKICAgIC8vIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDI0CiAgICAvLyB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFVuaXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDI1CiAgICAvLyBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldERlY2ltYWxzCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDI2CiAgICAvLyBsYWJlbHM9c2VsZi5hc3NldHNbYXNzZXRdLmNvcHkoKSBpZiBhc3NldCBpbiBzZWxmLmFzc2V0cyBlbHNlIGVtcHR5X2xpc3QoKSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9nZXRfYXNzZXRfdGlueV9sYWJlbHNfdGVybmFyeV9mYWxzZUAyCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRzIGVudHJ5IGV4aXN0cwoKX2dldF9hc3NldF90aW55X2xhYmVsc190ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIyLTQyNwogICAgLy8gcmV0dXJuIEFzc2V0VGlueUxhYmVscygKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDcgLy8gNwogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwNwogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgZnJhbWVfZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX2dldF9hc3NldF90aW55X2xhYmVsc190ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKQogICAgYnl0ZWNfMSAvLyAweDAwMDAKICAgIGIgX2dldF9hc3NldF90aW55X2xhYmVsc190ZXJuYXJ5X21lcmdlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGlueV9sYWJlbHMoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF90aW55X2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MjktNDMwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGlueUxhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzMQogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90aW55X2xhYmVscyhhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX3RpbnlfbGFiZWxzKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGlueV9sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMzLTQzNAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfdGlueV9sYWJlbHMoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MzUKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX3RpbnlfbGFiZWxzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MzUKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX3RpbnlfbGFiZWxzX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzNgogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF90aW55X2xhYmVscyhhc3NldF9pZC5uYXRpdmUpKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2dldF9hc3NldF90aW55X2xhYmVscwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfdGlueV9sYWJlbHNfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX3RpbnlfbGFiZWxzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF90ZXh0KGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfZ2V0X2Fzc2V0X3RleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQwLTQ0MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X2Fzc2V0X3RleHQoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRUZXh0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQ0CiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0NgogICAgLy8gdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVUkwKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NDMtNDQ3CiAgICAvLyByZXR1cm4gQXNzZXRUZXh0KAogICAgLy8gICAgIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICAvLyAgICAgdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICAvLyAgICAgdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICAvLyApCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDYgLy8gNgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwNgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGV4dChhc3NldDogdWludDY0KSAtPiBieXRlczoKZ2V0X2Fzc2V0X3RleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQ5LTQ1MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldF90ZXh0KHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGV4dDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ1MQogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90ZXh0KGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfdGV4dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c190ZXh0KGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGV4dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NTMtNDU0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0c190ZXh0KHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDU1CiAgICAvLyBmb3IgX2ksIGFzc2V0X2lkIGluIHVlbnVtZXJhdGUoYXNzZXRzKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c190ZXh0X2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NTUKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX3RleHRfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDU2CiAgICAvLyBsb2coc2VsZi5fZ2V0X2Fzc2V0X3RleHQoYXNzZXRfaWQubmF0aXZlKSkKICAgIGV4dHJhY3RfdWludDY0CiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfdGV4dAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfdGV4dF9mb3JfaGVhZGVyQDEKCmdldF9hc3NldHNfdGV4dF9hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLl9nZXRfYXNzZXRfdGV4dF9sYWJlbHMoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfdGV4dF9sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDYwLTQ2MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X2Fzc2V0X3RleHRfbGFiZWxzKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IEFzc2V0VGV4dExhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NjUKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NjYKICAgIC8vIHVybD1iMnN0cihhc3NldC51cmwpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VVJMCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDY3CiAgICAvLyBsYWJlbHM9c2VsZi5hc3NldHNbYXNzZXRdLmNvcHkoKSBpZiBhc3NldCBpbiBzZWxmLmFzc2V0cyBlbHNlIGVtcHR5X2xpc3QoKSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9nZXRfYXNzZXRfdGV4dF9sYWJlbHNfdGVybmFyeV9mYWxzZUAyCiAgICBmcmFtZV9kaWcgMwogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYXNzZXRzIGVudHJ5IGV4aXN0cwoKX2dldF9hc3NldF90ZXh0X2xhYmVsc190ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDYzLTQ2OAogICAgLy8gcmV0dXJuIEFzc2V0VGV4dExhYmVscygKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIHVybD1iMnN0cihhc3NldC51cmwpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwOAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX2dldF9hc3NldF90ZXh0X2xhYmVsc190ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkKICAgIC8vIHJldHVybiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlN0cmluZ10oKQogICAgYnl0ZWNfMSAvLyAweDAwMDAKICAgIGIgX2dldF9hc3NldF90ZXh0X2xhYmVsc190ZXJuYXJ5X21lcmdlQDMKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGV4dF9sYWJlbHMoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF90ZXh0X2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzAtNDcxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X3RleHRfbGFiZWxzKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGV4dExhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90ZXh0X2xhYmVscyhhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RleHRfbGFiZWxzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX3RleHRfbGFiZWxzKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGV4dF9sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDc0LTQ3NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfdGV4dF9sYWJlbHMoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzYKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX3RleHRfbGFiZWxzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzYKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX3RleHRfbGFiZWxzX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF90ZXh0X2xhYmVscyhhc3NldF9pZC5uYXRpdmUpKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2dldF9hc3NldF90ZXh0X2xhYmVscwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfdGV4dF9sYWJlbHNfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX3RleHRfbGFiZWxzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9zbWFsbChhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF9zbWFsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODEtNDgyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfc21hbGwoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRTbWFsbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4NQogICAgLy8gbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODYKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODcKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODgKICAgIC8vIHRvdGFsPWFyYzQuVUludDY0KGFzc2V0LnRvdGFsKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFRvdGFsCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDg5CiAgICAvLyBoYXNfZnJlZXplPWFyYzQuQm9vbChhc3NldC5mcmVlemUgIT0gR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRGcmVlemUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgIT0KICAgIGJ5dGVjIDEwIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5MAogICAgLy8gaGFzX2NsYXdiYWNrPWFyYzQuQm9vbChhc3NldC5jbGF3YmFjayAhPSBHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENsYXdiYWNrCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBieXRlYyAxMCAvLyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTEKICAgIC8vIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX2dldF9hc3NldF9zbWFsbF90ZXJuYXJ5X2ZhbHNlQDIKICAgIGZyYW1lX2RpZyA2CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCgpfZ2V0X2Fzc2V0X3NtYWxsX3Rlcm5hcnlfbWVyZ2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODQtNDkyCiAgICAvLyByZXR1cm4gQXNzZXRTbWFsbCgKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIHRvdGFsPWFyYzQuVUludDY0KGFzc2V0LnRvdGFsKSwKICAgIC8vICAgICBoYXNfZnJlZXplPWFyYzQuQm9vbChhc3NldC5mcmVlemUgIT0gR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgaGFzX2NsYXdiYWNrPWFyYzQuQm9vbChhc3NldC5jbGF3YmFjayAhPSBHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIC8vICAgICBsYWJlbHM9c2VsZi5hc3NldHNbYXNzZXRdLmNvcHkoKSBpZiBhc3NldCBpbiBzZWxmLmFzc2V0cyBlbHNlIGVtcHR5X2xpc3QoKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAxNiAvLyAxNgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAxMAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgZnJhbWVfZGlnIDIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDUKICAgIGludGNfMSAvLyAwCiAgICBnZXRiaXQKICAgIHB1c2hpbnQgMTA1IC8vIDEwNQogICAgc3dhcAogICAgc2V0Yml0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfZ2V0X2Fzc2V0X3NtYWxsX3Rlcm5hcnlfZmFsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OQogICAgLy8gcmV0dXJuIGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSgpCiAgICBieXRlY18xIC8vIDB4MDAwMAogICAgYiBfZ2V0X2Fzc2V0X3NtYWxsX3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldF9zbWFsbChhc3NldDogdWludDY0KSAtPiBieXRlczoKZ2V0X2Fzc2V0X3NtYWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5NC00OTUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfc21hbGwoc2VsZiwgYXNzZXQ6IFVJbnQ2NCkgLT4gQXNzZXRTbWFsbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF9zbWFsbChhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3NtYWxsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX3NtYWxsKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfc21hbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDk4LTQ5OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfc21hbGwoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MDAKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX3NtYWxsX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MDAKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX3NtYWxsX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUwMQogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF9zbWFsbChhc3NldF9pZC5uYXRpdmUpKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2dldF9hc3NldF9zbWFsbAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfc21hbGxfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX3NtYWxsX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9mdWxsKGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfZ2V0X2Fzc2V0X2Z1bGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTA1LTUwNgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZ2V0X2Fzc2V0X2Z1bGwoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRGdWxsOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUwOAogICAgLy8gcmVzZXJ2ZV9hY2N0ID0gQWNjb3VudChhc3NldC5yZXNlcnZlLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0UmVzZXJ2ZQogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTEKICAgIC8vIGlmIHJlc2VydmVfYWNjdC5pc19vcHRlZF9pbihhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTAtNTEyCiAgICAvLyBhc3NldC5iYWxhbmNlKHJlc2VydmVfYWNjdCkKICAgIC8vIGlmIHJlc2VydmVfYWNjdC5pc19vcHRlZF9pbihhc3NldCkKICAgIC8vIGVsc2UgVUludDY0KDApCiAgICBieiBfZ2V0X2Fzc2V0X2Z1bGxfdGVybmFyeV9mYWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTEwCiAgICAvLyBhc3NldC5iYWxhbmNlKHJlc2VydmVfYWNjdCkKICAgIGZyYW1lX2RpZyAxNAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IG9wdGVkIGludG8gYXNzZXQKCl9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTE1CiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTE2CiAgICAvLyB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFVuaXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTcKICAgIC8vIHVybD1iMnN0cihhc3NldC51cmwpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VVJMCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICBmcmFtZV9idXJ5IDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTgKICAgIC8vIHRvdGFsPWFyYzQuVUludDY0KGFzc2V0LnRvdGFsKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFRvdGFsCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTkKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIGZyYW1lX2J1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyMAogICAgLy8gY3JlYXRvcj1hcmM0LkFkZHJlc3MoYXNzZXQuY3JlYXRvciksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDExCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIxCiAgICAvLyBtYW5hZ2VyPWFyYzQuQWRkcmVzcyhhc3NldC5tYW5hZ2VyKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE1hbmFnZXIKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMTIKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MjIKICAgIC8vIGZyZWV6ZT1hcmM0LkFkZHJlc3MoYXNzZXQuZnJlZXplKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldEZyZWV6ZQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxMwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyMwogICAgLy8gY2xhd2JhY2s9YXJjNC5BZGRyZXNzKGFzc2V0LmNsYXdiYWNrKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENsYXdiYWNrCiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDkKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MjQKICAgIC8vIHJlc2VydmU9YXJjNC5BZGRyZXNzKGFzc2V0LnJlc2VydmUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0UmVzZXJ2ZQogICAgc3dhcAogICAgZnJhbWVfYnVyeSAxMAogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyNQogICAgLy8gZGVmYXVsdF9mcm96ZW49YXJjNC5Cb29sKGFzc2V0LmRlZmF1bHRfZnJvemVuKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldERlZmF1bHRGcm96ZW4KICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGJ5dGVjIDEwIC8vIDB4MDAKICAgIGludGNfMSAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTI3CiAgICAvLyBtZXRhZGF0YV9oYXNoPWFyYzQuRHluYW1pY0J5dGVzKGFzc2V0Lm1ldGFkYXRhX2hhc2gpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TWV0YWRhdGFIYXNoCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTI2CiAgICAvLyByZXNlcnZlX2JhbGFuY2U9YXJjNC5VSW50NjQocmVzZXJ2ZV9iYWxhbmNlKSwKICAgIGl0b2IKICAgIGZyYW1lX2J1cnkgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyOAogICAgLy8gbGFiZWxzPXNlbGYuYXNzZXRzW2Fzc2V0XS5jb3B5KCkgaWYgYXNzZXQgaW4gc2VsZi5hc3NldHMgZWxzZSBlbXB0eV9saXN0KCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGR1cAogICAgZnJhbWVfYnVyeSA1CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X2ZhbHNlQDUKICAgIGZyYW1lX2RpZyA1CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hc3NldHMgZW50cnkgZXhpc3RzCgpfZ2V0X2Fzc2V0X2Z1bGxfdGVybmFyeV9tZXJnZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUxNC01MjkKICAgIC8vIHJldHVybiBBc3NldEZ1bGwoCiAgICAvLyAgICAgbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIC8vICAgICB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIC8vICAgICB1cmw9YjJzdHIoYXNzZXQudXJsKSwKICAgIC8vICAgICB0b3RhbD1hcmM0LlVJbnQ2NChhc3NldC50b3RhbCksCiAgICAvLyAgICAgZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoYXNzZXQuY3JlYXRvciksCiAgICAvLyAgICAgbWFuYWdlcj1hcmM0LkFkZHJlc3MoYXNzZXQubWFuYWdlciksCiAgICAvLyAgICAgZnJlZXplPWFyYzQuQWRkcmVzcyhhc3NldC5mcmVlemUpLAogICAgLy8gICAgIGNsYXdiYWNrPWFyYzQuQWRkcmVzcyhhc3NldC5jbGF3YmFjayksCiAgICAvLyAgICAgcmVzZXJ2ZT1hcmM0LkFkZHJlc3MoYXNzZXQucmVzZXJ2ZSksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49YXJjNC5Cb29sKGFzc2V0LmRlZmF1bHRfZnJvemVuKSwKICAgIC8vICAgICByZXNlcnZlX2JhbGFuY2U9YXJjNC5VSW50NjQocmVzZXJ2ZV9iYWxhbmNlKSwKICAgIC8vICAgICBtZXRhZGF0YV9oYXNoPWFyYzQuRHluYW1pY0J5dGVzKGFzc2V0Lm1ldGFkYXRhX2hhc2gpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLmFzc2V0c1thc3NldF0uY29weSgpIGlmIGFzc2V0IGluIHNlbGYuYXNzZXRzIGVsc2UgZW1wdHlfbGlzdCgpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDE4OCAvLyAxODgKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwYmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgY292ZXIgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgZnJhbWVfZGlnIDcKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDExCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAxMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMTMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDkKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDEwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgZnJhbWVfZGlnIDgKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfZ2V0X2Fzc2V0X2Z1bGxfdGVybmFyeV9mYWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyByZXR1cm4gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5TdHJpbmddKCkKICAgIGJ5dGVjXzEgLy8gMHgwMDAwCiAgICBiIF9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X21lcmdlQDYKCl9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTEyCiAgICAvLyBlbHNlIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGIgX2dldF9hc3NldF9mdWxsX3Rlcm5hcnlfbWVyZ2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldF9mdWxsKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfZnVsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzEtNTMyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X2Z1bGwoc2VsZiwgYXNzZXQ6IFVJbnQ2NCkgLT4gQXNzZXRGdWxsOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMzCiAgICAvLyByZXR1cm4gc2VsZi5fZ2V0X2Fzc2V0X2Z1bGwoYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9mdWxsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX2Z1bGwoYXNzZXRzOiBieXRlcykgLT4gdm9pZDoKZ2V0X2Fzc2V0c19mdWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzNS01MzYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX2Z1bGwoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzcKICAgIC8vIGZvciBfaSwgYXNzZXRfaWQgaW4gdWVudW1lcmF0ZShhc3NldHMpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX2Z1bGxfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzNwogICAgLy8gZm9yIF9pLCBhc3NldF9pZCBpbiB1ZW51bWVyYXRlKGFzc2V0cyk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfZnVsbF9hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18zIC8vIDgKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzgKICAgIC8vIGxvZyhzZWxmLl9nZXRfYXNzZXRfZnVsbChhc3NldF9pZC5uYXRpdmUpKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2dldF9hc3NldF9mdWxsCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c19mdWxsX2Zvcl9oZWFkZXJAMQoKZ2V0X2Fzc2V0c19mdWxsX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"bareActions":{"create":["NoOp"],"call":["DeleteApplication","UpdateApplication"]}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"arcs":[],"name":"AssetLabeling","structs":{"LabelDescriptor":[{"name":"name","type":"string"},{"name":"url","type":"string"},{"name":"numAssets","type":"uint64"},{"name":"numOperators","type":"uint64"}],"AssetMicro":[{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"}],"AssetMicroLabels":[{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"labels","type":"string[]"}],"AssetTiny":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"}],"AssetTinyLabels":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"labels","type":"string[]"}],"AssetText":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"}],"AssetTextLabels":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"},{"name":"labels","type":"string[]"}],"AssetSmall":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"decimals","type":"uint8"},{"name":"total","type":"uint64"},{"name":"hasFreeze","type":"bool"},{"name":"hasClawback","type":"bool"},{"name":"labels","type":"string[]"}],"AssetFull":[{"name":"name","type":"string"},{"name":"unitName","type":"string"},{"name":"url","type":"string"},{"name":"total","type":"uint64"},{"name":"decimals","type":"uint8"},{"name":"creator","type":"address"},{"name":"manager","type":"address"},{"name":"freeze","type":"address"},{"name":"clawback","type":"address"},{"name":"reserve","type":"address"},{"name":"defaultFrozen","type":"bool"},{"name":"metadataHash","type":"byte[]"},{"name":"reserveBalance","type":"uint64"},{"name":"labels","type":"string[]"}]},"methods":[{"name":"change_admin","args":[{"name":"new_admin","type":"account"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label","args":[{"name":"id","type":"string"},{"name":"name","type":"string"},{"name":"url","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_label","args":[{"name":"id","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"change_label","args":[{"name":"id","type":"string"},{"name":"name","type":"string"},{"name":"url","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_label","args":[{"name":"id","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_label","args":[{"name":"id","type":"string"}],"returns":{"type":"(string,string,uint64,uint64)","struct":"LabelDescriptor"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_labels","args":[{"name":"ids","type":"string[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"add_operator_to_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_operator_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_operator_from_label","args":[{"name":"operator","type":"account"},{"name":"label","type":"string"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"get_operator_labels","args":[{"name":"operator","type":"account"}],"returns":{"type":"string[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label_to_asset","args":[{"name":"label","type":"string"},{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"add_label_to_assets","args":[{"name":"label","type":"string"},{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"remove_label_from_asset","args":[{"name":"label","type":"string"},{"name":"asset","type":"asset"}],"returns":{"type":"void"},"events":[],"actions":{"create":[],"call":["NoOp"]}},{"name":"has_asset_label","args":[{"name":"asset_id","type":"uint64"},{"name":"label","type":"string"}],"returns":{"type":"uint64"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_labels","args":[{"name":"asset","type":"asset"}],"returns":{"type":"string[]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"string[][]"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"log_assets_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_micro","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,uint8)","struct":"AssetMicro"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_micro","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_micro_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,uint8,string[])","struct":"AssetMicroLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_micro_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_tiny","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8)","struct":"AssetTiny"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_tiny","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_tiny_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8,string[])","struct":"AssetTinyLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_tiny_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_text","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string)","struct":"AssetText"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_text","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_text_labels","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string,string[])","struct":"AssetTextLabels"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_text_labels","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_small","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,uint8,uint64,bool,bool,string[])","struct":"AssetSmall"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_small","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_asset_full","args":[{"name":"asset","type":"uint64"}],"returns":{"type":"(string,string,string,uint64,uint8,address,address,address,address,address,bool,byte[],uint64,string[])","struct":"AssetFull"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}},{"name":"get_assets_full","args":[{"name":"assets","type":"uint64[]"}],"returns":{"type":"void"},"events":[],"readonly":true,"actions":{"create":[],"call":["NoOp"]}}],"state":{"schema":{"global":{"ints":0,"bytes":1},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"key":"YWRtaW4=","keyType":"AVMString","valueType":"AVMBytes"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fX2FsZ29weV9lbnRyeXBvaW50X3dpdGhfaW5pdCgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxIDAgMiA4CiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgMHggMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0ICJhZG1pbiIgMHg0NTUyNTIzYTRjNDU0ZTQ3NTQ0OCAweDAwMDAwMDAwMDAwMDAwMDAgMHg0NTUyNTIzYTQ1NTg0OTUzNTQ1MyAweDQ1NTI1MjNhNGU0ZjQ1NGQ1MDU0NTkgMHgwMDAyIDB4MDAwMCAweDAwIDB4NDU1MjUyM2E1NTRlNDE1NTU0NDggMHgwMDAxIDB4MDAwNQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExOQogICAgLy8gc2VsZi5hZG1pbiA9IFR4bi5zZW5kZXIKICAgIGJ5dGVjXzMgLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDM5CiAgICBwdXNoYnl0ZXNzIDB4OGYwZDdkOGUgMHgzM2EyZTJmNyAweGI3MmJiNzhmIDB4OTc2Y2RlNjQgMHgxN2U2OTFhZSAweDc2NjVkMmI0IDB4NzI1NjE2ZTcgMHhmYWMxY2YxYiAweDZmZDgxNDhjIDB4YjRjNTBiOWYgMHhhMmRkMjI0NyAweGEzN2RlYTExIDB4MTM1YWIyMWUgMHg2OGYxOGVmYSAweDk3ZjQwYThhIDB4YzJlZDc0M2YgMHhhNjdmMDNjMiAweDk3YTMyMTIzIDB4YWFlZTBjNjEgMHhiNmMzOWY2OCAweDYzNWJlMzYyIDB4NzA5M2IxMGQgMHg3MGFjOTlhZCAweGQ5YTJiZDljIDB4NzZjNjUyOGUgMHg1MWY3N2JmZiAweDIwZDlmMjRjIDB4NTU0MGI4MGEgMHgwNzEwZTVjNCAweDZmMTdjZGQ1IDB4N2E0Y2U0YjkgMHgzNjZjNTFhZiAweDM0YTQ4ZmJjIDB4MDNiYTk4ZGIgLy8gbWV0aG9kICJjaGFuZ2VfYWRtaW4oYWNjb3VudCl2b2lkIiwgbWV0aG9kICJhZGRfbGFiZWwoc3RyaW5nLHN0cmluZyxzdHJpbmcpdm9pZCIsIG1ldGhvZCAiaGFzX2xhYmVsKHN0cmluZyl1aW50NjQiLCBtZXRob2QgImNoYW5nZV9sYWJlbChzdHJpbmcsc3RyaW5nLHN0cmluZyl2b2lkIiwgbWV0aG9kICJyZW1vdmVfbGFiZWwoc3RyaW5nKXZvaWQiLCBtZXRob2QgImdldF9sYWJlbChzdHJpbmcpKHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImxvZ19sYWJlbHMoc3RyaW5nW10pdm9pZCIsIG1ldGhvZCAiYWRkX29wZXJhdG9yX3RvX2xhYmVsKGFjY291bnQsc3RyaW5nKXZvaWQiLCBtZXRob2QgImhhc19vcGVyYXRvcl9sYWJlbChhY2NvdW50LHN0cmluZyl1aW50NjQiLCBtZXRob2QgInJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsKGFjY291bnQsc3RyaW5nKXZvaWQiLCBtZXRob2QgImdldF9vcGVyYXRvcl9sYWJlbHMoYWNjb3VudClzdHJpbmdbXSIsIG1ldGhvZCAiYWRkX2xhYmVsX3RvX2Fzc2V0KHN0cmluZyxhc3NldCl2b2lkIiwgbWV0aG9kICJhZGRfbGFiZWxfdG9fYXNzZXRzKHN0cmluZyx1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJyZW1vdmVfbGFiZWxfZnJvbV9hc3NldChzdHJpbmcsYXNzZXQpdm9pZCIsIG1ldGhvZCAiaGFzX2Fzc2V0X2xhYmVsKHVpbnQ2NCxzdHJpbmcpdWludDY0IiwgbWV0aG9kICJnZXRfYXNzZXRfbGFiZWxzKGFzc2V0KXN0cmluZ1tdIiwgbWV0aG9kICJnZXRfYXNzZXRzX2xhYmVscyh1aW50NjRbXSlzdHJpbmdbXVtdIiwgbWV0aG9kICJsb2dfYXNzZXRzX2xhYmVscyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfbWljcm8odWludDY0KShzdHJpbmcsdWludDgpIiwgbWV0aG9kICJnZXRfYXNzZXRzX21pY3JvKHVpbnQ2NFtdKXZvaWQiLCBtZXRob2QgImdldF9hc3NldF9taWNyb19sYWJlbHModWludDY0KShzdHJpbmcsdWludDgsc3RyaW5nW10pIiwgbWV0aG9kICJnZXRfYXNzZXRzX21pY3JvX2xhYmVscyh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfdGlueSh1aW50NjQpKHN0cmluZyxzdHJpbmcsdWludDgpIiwgbWV0aG9kICJnZXRfYXNzZXRzX3RpbnkodWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzKHVpbnQ2NCkoc3RyaW5nLHN0cmluZyx1aW50OCxzdHJpbmdbXSkiLCBtZXRob2QgImdldF9hc3NldHNfdGlueV9sYWJlbHModWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X3RleHQodWludDY0KShzdHJpbmcsc3RyaW5nLHN0cmluZykiLCBtZXRob2QgImdldF9hc3NldHNfdGV4dCh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfdGV4dF9sYWJlbHModWludDY0KShzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmdbXSkiLCBtZXRob2QgImdldF9hc3NldHNfdGV4dF9sYWJlbHModWludDY0W10pdm9pZCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X3NtYWxsKHVpbnQ2NCkoc3RyaW5nLHN0cmluZyx1aW50OCx1aW50NjQsYm9vbCxib29sLHN0cmluZ1tdKSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c19zbWFsbCh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJnZXRfYXNzZXRfZnVsbCh1aW50NjQpKHN0cmluZyxzdHJpbmcsc3RyaW5nLHVpbnQ2NCx1aW50OCxhZGRyZXNzLGFkZHJlc3MsYWRkcmVzcyxhZGRyZXNzLGFkZHJlc3MsYm9vbCxieXRlW10sdWludDY0LHN0cmluZ1tdKSIsIG1ldGhvZCAiZ2V0X2Fzc2V0c19mdWxsKHVpbnQ2NFtdKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NoYW5nZV9hZG1pbl9yb3V0ZUA1IG1haW5fYWRkX2xhYmVsX3JvdXRlQDYgbWFpbl9oYXNfbGFiZWxfcm91dGVANyBtYWluX2NoYW5nZV9sYWJlbF9yb3V0ZUA4IG1haW5fcmVtb3ZlX2xhYmVsX3JvdXRlQDkgbWFpbl9nZXRfbGFiZWxfcm91dGVAMTAgbWFpbl9sb2dfbGFiZWxzX3JvdXRlQDExIG1haW5fYWRkX29wZXJhdG9yX3RvX2xhYmVsX3JvdXRlQDEyIG1haW5faGFzX29wZXJhdG9yX2xhYmVsX3JvdXRlQDEzIG1haW5fcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfcm91dGVAMTQgbWFpbl9nZXRfb3BlcmF0b3JfbGFiZWxzX3JvdXRlQDE1IG1haW5fYWRkX2xhYmVsX3RvX2Fzc2V0X3JvdXRlQDE2IG1haW5fYWRkX2xhYmVsX3RvX2Fzc2V0c19yb3V0ZUAxNyBtYWluX3JlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X3JvdXRlQDE4IG1haW5faGFzX2Fzc2V0X2xhYmVsX3JvdXRlQDE5IG1haW5fZ2V0X2Fzc2V0X2xhYmVsc19yb3V0ZUAyMCBtYWluX2dldF9hc3NldHNfbGFiZWxzX3JvdXRlQDIxIG1haW5fbG9nX2Fzc2V0c19sYWJlbHNfcm91dGVAMjIgbWFpbl9nZXRfYXNzZXRfbWljcm9fcm91dGVAMjMgbWFpbl9nZXRfYXNzZXRzX21pY3JvX3JvdXRlQDI0IG1haW5fZ2V0X2Fzc2V0X21pY3JvX2xhYmVsc19yb3V0ZUAyNSBtYWluX2dldF9hc3NldHNfbWljcm9fbGFiZWxzX3JvdXRlQDI2IG1haW5fZ2V0X2Fzc2V0X3Rpbnlfcm91dGVAMjcgbWFpbl9nZXRfYXNzZXRzX3Rpbnlfcm91dGVAMjggbWFpbl9nZXRfYXNzZXRfdGlueV9sYWJlbHNfcm91dGVAMjkgbWFpbl9nZXRfYXNzZXRzX3RpbnlfbGFiZWxzX3JvdXRlQDMwIG1haW5fZ2V0X2Fzc2V0X3RleHRfcm91dGVAMzEgbWFpbl9nZXRfYXNzZXRzX3RleHRfcm91dGVAMzIgbWFpbl9nZXRfYXNzZXRfdGV4dF9sYWJlbHNfcm91dGVAMzMgbWFpbl9nZXRfYXNzZXRzX3RleHRfbGFiZWxzX3JvdXRlQDM0IG1haW5fZ2V0X2Fzc2V0X3NtYWxsX3JvdXRlQDM1IG1haW5fZ2V0X2Fzc2V0c19zbWFsbF9yb3V0ZUAzNiBtYWluX2dldF9hc3NldF9mdWxsX3JvdXRlQDM3IG1haW5fZ2V0X2Fzc2V0c19mdWxsX3JvdXRlQDM4CgptYWluX2FmdGVyX2lmX2Vsc2VANDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzEgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfZnVsbF9yb3V0ZUAzODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo2MDEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjYwMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX2Z1bGwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X2Z1bGxfcm91dGVAMzc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTk3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1OTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X2Z1bGwKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c19zbWFsbF9yb3V0ZUAzNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NjEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU2MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX3NtYWxsCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF9zbWFsbF9yb3V0ZUAzNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU1NwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRfc21hbGwKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c190ZXh0X2xhYmVsc19yb3V0ZUAzNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzNQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX3RleHRfbGFiZWxzCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF90ZXh0X2xhYmVsc19yb3V0ZUAzMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzMQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRfdGV4dF9sYWJlbHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0c190ZXh0X3JvdXRlQDMyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUxMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTEyCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfdGV4dAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfdGV4dF9yb3V0ZUAzMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MDgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUwOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRfdGV4dAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRzX3RpbnlfbGFiZWxzX3JvdXRlQDMwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ5MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfdGlueV9sYWJlbHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzX3JvdXRlQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDg2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF90aW55X2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRzX3Rpbnlfcm91dGVAMjg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDY3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NjcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0c190aW55CiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF90aW55X3JvdXRlQDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ2MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDYzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF90aW55CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldHNfbWljcm9fbGFiZWxzX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQ1CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfbWljcm9fbGFiZWxzCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9hc3NldF9taWNyb19sYWJlbHNfcm91dGVAMjU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NDEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X21pY3JvX2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRzX21pY3JvX3JvdXRlQDI0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDIzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldHNfbWljcm8KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Fzc2V0X21pY3JvX3JvdXRlQDIzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQxOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDE5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9hc3NldF9taWNybwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9sb2dfYXNzZXRzX2xhYmVsc19yb3V0ZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTUKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM5NQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBsb2dfYXNzZXRzX2xhYmVscwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRzX2xhYmVsc19yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYXNzZXRzX2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfYXNzZXRfbGFiZWxzX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozODIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oYXNfYXNzZXRfbGFiZWxfcm91dGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGhhc19hc3NldF9sYWJlbAogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDAKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzQwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYWRkX2xhYmVsX3RvX2Fzc2V0c19yb3V0ZUAxNzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMjMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9sYWJlbF90b19hc3NldHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYWRkX2xhYmVsX3RvX2Fzc2V0X3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBhZGRfbGFiZWxfdG9fYXNzZXQKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X29wZXJhdG9yX2xhYmVsc19yb3V0ZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyODkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyODkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X29wZXJhdG9yX2xhYmVscwogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oYXNfb3BlcmF0b3JfbGFiZWxfcm91dGVAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjQ5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0OQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBoYXNfb3BlcmF0b3JfbGFiZWwKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYWRkX29wZXJhdG9yX3RvX2xhYmVsX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIyNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9vcGVyYXRvcl90b19sYWJlbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9sb2dfbGFiZWxzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTg4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGxvZ19sYWJlbHMKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2xhYmVsX3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE3CiAgICAvLyBjbGFzcyBBc3NldExhYmVsaW5nKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfbGFiZWwKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVtb3ZlX2xhYmVsX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTcyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNzIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZW1vdmVfbGFiZWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hhbmdlX2xhYmVsX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTYyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNoYW5nZV9sYWJlbAogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9oYXNfbGFiZWxfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgaGFzX2xhYmVsCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2FkZF9sYWJlbF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE0NAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTcKICAgIC8vIGNsYXNzIEFzc2V0TGFiZWxpbmcoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNDQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBhZGRfbGFiZWwKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hhbmdlX2FkbWluX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTM5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzkKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjaGFuZ2VfYWRtaW4KICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDM5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNwogICAgLy8gY2xhc3MgQXNzZXRMYWJlbGluZyhBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgc3dpdGNoIG1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANDIgbWFpbl9hZnRlcl9pZl9lbHNlQDQzIG1haW5fYWZ0ZXJfaWZfZWxzZUA0MyBtYWluX2FmdGVyX2lmX2Vsc2VANDMgbWFpbl91cGRhdGVANDAgbWFpbl9kZWxldGVANDEKICAgIGIgbWFpbl9hZnRlcl9pZl9lbHNlQDQzCgptYWluX2RlbGV0ZUA0MToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzEKICAgIC8vIEBhcmM0LmJhcmVtZXRob2QoYWxsb3dfYWN0aW9ucz0oIkRlbGV0ZUFwcGxpY2F0aW9uIiwpKQogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVANDA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTI3CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9KCJVcGRhdGVBcHBsaWNhdGlvbiIsKSkKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fX19hbGdvcHlfZGVmYXVsdF9jcmVhdGVANDI6CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfcG9wX2J5dGVfbGVuZ3RoX2hlYWQoYXJyYXk6IGJ5dGVzKSAtPiBieXRlcywgYnl0ZXM6CmR5bmFtaWNfYXJyYXlfcG9wX2J5dGVfbGVuZ3RoX2hlYWQ6CiAgICBwcm90byAxIDIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgZHVwCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZHVwCiAgICBkaWcgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBsZW4KICAgIGRpZyAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkaWcgMgogICAgaW50Y18xIC8vIDAKICAgIGRpZyA1CiAgICBzdWJzdHJpbmczCiAgICB1bmNvdmVyIDQKICAgIGludGNfMiAvLyAyCiAgICArCiAgICB1bmNvdmVyIDQKICAgIHN3YXAKICAgIHVuY292ZXIgNAogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBkaWcgMgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgaW50Y18xIC8vIDAKICAgIGNhbGxzdWIgcmVjYWxjdWxhdGVfaGVhZF9mb3JfZWxlbWVudHNfd2l0aF9ieXRlX2xlbmd0aF9oZWFkCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWQoYXJyYXk6IGJ5dGVzLCBuZXdfaXRlbXNfYnl0ZXM6IGJ5dGVzLCBuZXdfaXRlbXNfY291bnQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmR5bmFtaWNfYXJyYXlfY29uY2F0X2J5dGVfbGVuZ3RoX2hlYWQ6CiAgICBwcm90byAzIDEKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGZyYW1lX2RpZyAtMQogICAgKwogICAgc3dhcAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBkaWcgMQogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18yIC8vIDIKICAgIGRpZyAzCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBiemVybwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgZnJhbWVfZGlnIC0zCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBpbnRjXzEgLy8gMAogICAgY2FsbHN1YiByZWNhbGN1bGF0ZV9oZWFkX2Zvcl9lbGVtZW50c193aXRoX2J5dGVfbGVuZ3RoX2hlYWQKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gX3B1eWFfbGliLmFyYzQuZHluYW1pY19hcnJheV9yZXBsYWNlX2J5dGVfbGVuZ3RoX2hlYWQoYXJyYXk6IGJ5dGVzLCBuZXdfaXRlbTogYnl0ZXMsIGluZGV4OiB1aW50NjQpIC0+IGJ5dGVzOgpkeW5hbWljX2FycmF5X3JlcGxhY2VfYnl0ZV9sZW5ndGhfaGVhZDoKICAgIHByb3RvIDMgMQogICAgZnJhbWVfZGlnIC0zCiAgICBzdWJzdHJpbmcgMCAyCiAgICBkdXAKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMQogICAgZGlnIDIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgKwogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGRpZyAyCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAzCiAgICBzdWJzdHJpbmczCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgZGlnIDIKICAgIGxlbgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcmVjYWxjdWxhdGVfaGVhZF9mb3JfZWxlbWVudHNfd2l0aF9ieXRlX2xlbmd0aF9oZWFkCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi5hcmM0LnJlY2FsY3VsYXRlX2hlYWRfZm9yX2VsZW1lbnRzX3dpdGhfYnl0ZV9sZW5ndGhfaGVhZChhcnJheV9oZWFkX2FuZF90YWlsOiBieXRlcywgbGVuZ3RoOiB1aW50NjQsIHN0YXJ0X2F0X2luZGV4OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWNhbGN1bGF0ZV9oZWFkX2Zvcl9lbGVtZW50c193aXRoX2J5dGVfbGVuZ3RoX2hlYWQ6CiAgICBwcm90byAzIDEKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18yIC8vIDIKICAgICoKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzIgLy8gMgogICAgKgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIHNlbGVjdAoKcmVjYWxjdWxhdGVfaGVhZF9mb3JfZWxlbWVudHNfd2l0aF9ieXRlX2xlbmd0aF9oZWFkX2Zvcl9oZWFkZXJAMToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogcmVjYWxjdWxhdGVfaGVhZF9mb3JfZWxlbWVudHNfd2l0aF9ieXRlX2xlbmd0aF9oZWFkX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIHJlcGxhY2UzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgLTMKICAgIGRpZyAxCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18yIC8vIDIKICAgICsKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiByZWNhbGN1bGF0ZV9oZWFkX2Zvcl9lbGVtZW50c193aXRoX2J5dGVfbGVuZ3RoX2hlYWRfZm9yX2hlYWRlckAxCgpyZWNhbGN1bGF0ZV9oZWFkX2Zvcl9lbGVtZW50c193aXRoX2J5dGVfbGVuZ3RoX2hlYWRfYWZ0ZXJfZm9yQDQ6CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LmZpbmRfbGFiZWwobGFiZWxzOiBieXRlcywgbGFiZWw6IGJ5dGVzKSAtPiB1aW50NjQsIHVpbnQ2NDoKZmluZF9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3My03NAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBmaW5kX2xhYmVsKGxhYmVsczogQnl0ZXMsIGxhYmVsOiBCeXRlcykgLT4gdHVwbGVbYm9vbCwgVUludDY0XToKICAgIHByb3RvIDIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojc1LTc2CiAgICAvLyAjIGNvbXBhcmUgbGFiZWwgYnl0ZXMgYXQgYSBmaXhlZCBzdHJpZGUgaW5zdGVhZCBvZiBkZWNvZGluZyBlYWNoIGFyYzQuU3RyaW5nCiAgICAvLyBjb3VudCA9IG9wLmV4dHJhY3RfdWludDE2KGxhYmVscywgMCkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NzcKICAgIC8vIGZvciBpZHggaW4gdXJhbmdlKGNvdW50KToKICAgIGludGNfMSAvLyAwCgpmaW5kX2xhYmVsX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3NwogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UoY291bnQpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBmaW5kX2xhYmVsX2FmdGVyX2ZvckA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTktNjMKICAgIC8vICMgYnl0ZSBvZmZzZXQgb2YgbGFiZWwgaWR4IGluIGFuIGVuY29kZWQgTGFiZWxMaXN0IGhvbGRpbmcgY291bnQgbGFiZWxzLgogICAgLy8gIyBldmVyeSBzdG9yZWQgbGFiZWwgaXMgMiBieXRlcyBsb25nIChlbmZvcmNlZCBieSBhZGRfbGFiZWwpLCBzbyBhZnRlciB0aGUgdWludDE2CiAgICAvLyAjIGNvdW50IGFuZCB0aGUgMi1ieXRlIGhlYWQgb2Zmc2V0cyB0aGUgdGFpbCBpcyBhIGRlbnNlIHJ1biBvZiA0LWJ5dGUgZWxlbWVudHM6CiAgICAvLyAjIHVpbnQxNiBsZW5ndGggcHJlZml4ICsgMiBsYWJlbCBieXRlcwogICAgLy8gcmV0dXJuIGNvdW50ICogMiArIDQgKyBpZHggKiA0CiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18yIC8vIDIKICAgICoKICAgIHB1c2hpbnQgNCAvLyA0CiAgICArCiAgICBmcmFtZV9kaWcgMQogICAgcHVzaGludCA0IC8vIDQKICAgICoKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3OAogICAgLy8gaWYgb3AuZXh0cmFjdChsYWJlbHMsIGxhYmVsX29mZnNldChjb3VudCwgaWR4KSwgMikgPT0gbGFiZWw6CiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGludGNfMiAvLyAyCiAgICBleHRyYWN0MwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYnogZmluZF9sYWJlbF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3OQogICAgLy8gcmV0dXJuIFRydWUsIGlkeAogICAgaW50Y18wIC8vIDEKICAgIGZyYW1lX2RpZyAxCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgpmaW5kX2xhYmVsX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo3NwogICAgLy8gZm9yIGlkeCBpbiB1cmFuZ2UoY291bnQpOgogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZmluZF9sYWJlbF9mb3JfaGVhZGVyQDEKCmZpbmRfbGFiZWxfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODAKICAgIC8vIHJldHVybiBGYWxzZSwgVUludDY0KDApCiAgICBpbnRjXzEgLy8gMAogICAgZHVwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LmIyc3RyKGI6IGJ5dGVzKSAtPiBieXRlczoKYjJzdHI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODktOTAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgYjJzdHIoYjogQnl0ZXMpIC0+IGFyYzQuU3RyaW5nOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTEtOTMKICAgIC8vICMgYXNzZXQgbmFtZSwgdW5pdCBuYW1lIGFuZCB1cmwgYXJlIGF0IG1vc3QgMzIsIDggYW5kIDk2IGJ5dGVzLCBzbyB0aGUgbGVuZ3RoCiAgICAvLyAjIGFsd2F5cyBmaXRzIHRoZSB1aW50MTYgcHJlZml4LiBwcmVmaXggdGhlIHJhdyBieXRlcyBkaXJlY3RseSwgbm8gU3RyaW5nIHJvdW5kLXRyaXAKICAgIC8vIHJldHVybiBhcmM0LlN0cmluZy5mcm9tX2J5dGVzKG9wLmV4dHJhY3Qob3AuaXRvYihiLmxlbmd0aCksIDYsIDIpICsgYikKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5nZXRfbGFiZWxfY291bnRlcihsYWJlbDogYnl0ZXMsIG9mZnNldDogdWludDY0KSAtPiB1aW50NjQ6CmdldF9sYWJlbF9jb3VudGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwMi0xMDUKICAgIC8vICMgcmVhZC93cml0ZSBhIHNpbmdsZSBMYWJlbERlc2NyaXB0b3IgY291bnRlciBpbiBwbGFjZSwgd2l0aG91dCBkZWNvZGluZyB0aGUgc3RydWN0CiAgICAvLyAjIGxhYmVscyBoYXMgbm8ga2V5IHByZWZpeDogdGhlIGJveCBrZXkgaXMgdGhlIGxhYmVsIGlkCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9sYWJlbF9jb3VudGVyKGxhYmVsOiBCeXRlcywgb2Zmc2V0OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vICMgdGhlIHJlYWQgZG91YmxlcyBhcyB0aGUgbGFiZWwgZXhpc3RlbmNlIGNoZWNrLCBzbyBjYWxsZXJzIHByb2JlIHRoZSBib3ggb25jZQogICAgLy8gZGVzY3JpcHRvcl9ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChsYWJlbCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBnZXRfbGFiZWxfY291bnRlcl9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMDgKICAgIC8vIGVuc3VyZShleGlzdHMsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKZ2V0X2xhYmVsX2NvdW50ZXJfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGRlc2NyaXB0b3JfYnl0ZXMsIG9mZnNldCkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy51cGRhdGUoKSAtPiB2b2lkOgp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTI5CiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5kZWxldGUoKSAtPiB2b2lkOgpkZWxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTMzCiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5hZG1pbl9vbmx5KCkgLT4gdm9pZDoKYWRtaW5fb25seToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzcKICAgIC8vIGVuc3VyZShUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4sIEJ5dGVzKEVSUl9VTkFVVEgpKQogICAgdHhuIFNlbmRlcgogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzMgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogYWRtaW5fb25seV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzcKICAgIC8vIGVuc3VyZShUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4sIEJ5dGVzKEVSUl9VTkFVVEgpKQogICAgYnl0ZWMgMTEgLy8gMHg0NTUyNTIzYTU1NGU0MTU1NTQ0OAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmFkbWluX29ubHlfYWZ0ZXJfaWZfZWxzZUAzOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuY2hhbmdlX2FkbWluKG5ld19hZG1pbjogYnl0ZXMpIC0+IHZvaWQ6CmNoYW5nZV9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMzktMTQwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjaGFuZ2VfYWRtaW4oc2VsZiwgbmV3X2FkbWluOiBBY2NvdW50KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQxCiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQyCiAgICAvLyBzZWxmLmFkbWluID0gbmV3X2FkbWluCiAgICBieXRlY18zIC8vICJhZG1pbiIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkZF9sYWJlbChpZDogYnl0ZXMsIG5hbWU6IGJ5dGVzLCB1cmw6IGJ5dGVzKSAtPiB2b2lkOgphZGRfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQ0LTE0NQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYWRkX2xhYmVsKHNlbGYsIGlkOiBTdHJpbmcsIG5hbWU6IFN0cmluZywgdXJsOiBTdHJpbmcpIC0+IE5vbmU6ICAjIG5vcWEgQTAwMgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQ2CiAgICAvLyBzZWxmLmFkbWluX29ubHkoKQogICAgY2FsbHN1YiBhZG1pbl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQ3LTE0OAogICAgLy8gIyBsZW5ndGggZmlyc3Q6IG5vIHN0b3JlZCBsYWJlbCBjYW4gaGF2ZSBhbm90aGVyIGxlbmd0aCwgc28gc2tpcCB0aGUgYm94IHByb2JlCiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIEJ5dGVzKEVSUl9MRU5HVEgpKQogICAgZnJhbWVfZGlnIC0zCiAgICBsZW4KICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBhZGRfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQ3LTE0OAogICAgLy8gIyBsZW5ndGggZmlyc3Q6IG5vIHN0b3JlZCBsYWJlbCBjYW4gaGF2ZSBhbm90aGVyIGxlbmd0aCwgc28gc2tpcCB0aGUgYm94IHByb2JlCiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIEJ5dGVzKEVSUl9MRU5HVEgpKQogICAgYnl0ZWMgNCAvLyAweDQ1NTI1MjNhNGM0NTRlNDc1NDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYWRkX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNDkKICAgIC8vIGVuc3VyZShpZCBub3QgaW4gc2VsZi5sYWJlbHMsIEJ5dGVzKEVSUl9FWElTVFMpKQogICAgZnJhbWVfZGlnIC0zCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBieiBhZGRfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTQ5CiAgICAvLyBlbnN1cmUoaWQgbm90IGluIHNlbGYubGFiZWxzLCBCeXRlcyhFUlJfRVhJU1RTKSkKICAgIGJ5dGVjIDYgLy8gMHg0NTUyNTIzYTQ1NTg0OTUzNTQ1MwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmFkZF9sYWJlbF9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTUxCiAgICAvLyBhcmM0LlN0cmluZyhuYW1lKSwKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTIKICAgIC8vIGFyYzQuU3RyaW5nKHVybCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTUwLTE1NQogICAgLy8gc2VsZi5sYWJlbHNbaWRdID0gTGFiZWxEZXNjcmlwdG9yKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKG5hbWUpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHVybCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBkaWcgMQogICAgbGVuCiAgICBwdXNoaW50IDIwIC8vIDIwCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAxNAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTUzCiAgICAvLyBhcmM0LlVJbnQ2NCgwKSwKICAgIGJ5dGVjIDUgLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTUwLTE1NQogICAgLy8gc2VsZi5sYWJlbHNbaWRdID0gTGFiZWxEZXNjcmlwdG9yKAogICAgLy8gICAgIGFyYzQuU3RyaW5nKG5hbWUpLAogICAgLy8gICAgIGFyYzQuU3RyaW5nKHVybCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgYXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTQKICAgIC8vIGFyYzQuVUludDY0KDApLAogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNTAtMTU1CiAgICAvLyBzZWxmLmxhYmVsc1tpZF0gPSBMYWJlbERlc2NyaXB0b3IoCiAgICAvLyAgICAgYXJjNC5TdHJpbmcobmFtZSksCiAgICAvLyAgICAgYXJjNC5TdHJpbmcodXJsKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuaGFzX2xhYmVsKGlkOiBieXRlcykgLT4gdWludDY0OgpoYXNfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTU3LTE1OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGhhc19sYWJlbChzZWxmLCBpZDogU3RyaW5nKSAtPiBVSW50NjQ6ICAjIG5vcWEgQTAwMgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTU5CiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIEJ5dGVzKEVSUl9MRU5HVEgpKQogICAgZnJhbWVfZGlnIC0xCiAgICBsZW4KICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBoYXNfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTU5CiAgICAvLyBlbnN1cmUoaWQuYnl0ZXMubGVuZ3RoID09IDIsIEJ5dGVzKEVSUl9MRU5HVEgpKQogICAgYnl0ZWMgNCAvLyAweDQ1NTI1MjNhNGM0NTRlNDc1NDQ4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKaGFzX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjAKICAgIC8vIHJldHVybiBVSW50NjQoaWQgaW4gc2VsZi5sYWJlbHMpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuY2hhbmdlX2xhYmVsKGlkOiBieXRlcywgbmFtZTogYnl0ZXMsIHVybDogYnl0ZXMpIC0+IHZvaWQ6CmNoYW5nZV9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjItMTYzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjaGFuZ2VfbGFiZWwoc2VsZiwgaWQ6IFN0cmluZywgbmFtZTogU3RyaW5nLCB1cmw6IFN0cmluZykgLT4gTm9uZTogICMgbm9xYSBBMDAyCiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjQKICAgIC8vIHNlbGYuYWRtaW5fb25seSgpCiAgICBjYWxsc3ViIGFkbWluX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNjUKICAgIC8vIGRlc2NyaXB0b3JfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoaWQuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogY2hhbmdlX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE2NgogICAgLy8gZW5zdXJlKGV4aXN0cywgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgYnl0ZWNfMiAvLyAweDQ1NTI1MjNhNGU0ZjQ1NTg0OTUzNTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpjaGFuZ2VfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gbGFiZWxfZGVzY3JpcHRvci5uYW1lID0gYXJjNC5TdHJpbmcobmFtZSkKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGludGNfMSAvLyAwCiAgICBkaWcgMgogICAgZXh0cmFjdDMKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAzCiAgICBsZW4KICAgIHVuY292ZXIgNAogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgdW5jb3ZlciAyCiAgICBkaWcgNAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgLQogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gMgogICAgZXh0cmFjdF91aW50MTYKICAgICsKICAgIHN3YXAKICAgIC0KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICByZXBsYWNlMiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTY5CiAgICAvLyBsYWJlbF9kZXNjcmlwdG9yLnVybCA9IGFyYzQuU3RyaW5nKHVybCkKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gMgogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMgogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gc2VsZi5sYWJlbHNbaWRdID0gbGFiZWxfZGVzY3JpcHRvci5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMwogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLnJlbW92ZV9sYWJlbChpZDogYnl0ZXMpIC0+IHZvaWQ6CnJlbW92ZV9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNzItMTczCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZW1vdmVfbGFiZWwoc2VsZiwgaWQ6IFN0cmluZykgLT4gTm9uZTogICMgbm9xYSBBMDAyCiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNzQKICAgIC8vIHNlbGYuYWRtaW5fb25seSgpCiAgICBjYWxsc3ViIGFkbWluX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNzUKICAgIC8vIGRlc2NyaXB0b3JfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQoaWQuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVtb3ZlX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gZW5zdXJlKGV4aXN0cywgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgYnl0ZWNfMiAvLyAweDQ1NTI1MjNhNGU0ZjQ1NTg0OTUzNTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE3OAogICAgLy8gZW5zdXJlKGxhYmVsX2Rlc2NyaXB0b3IubnVtX29wZXJhdG9ycyA9PSAwLCBCeXRlcyhFUlJfTk9FTVBUWSkpCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAxMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTc4CiAgICAvLyBlbnN1cmUobGFiZWxfZGVzY3JpcHRvci5udW1fb3BlcmF0b3JzID09IDAsIEJ5dGVzKEVSUl9OT0VNUFRZKSkKICAgIGJ5dGVjIDcgLy8gMHg0NTUyNTIzYTRlNGY0NTRkNTA1NDU5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX2xhYmVsX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxNzkKICAgIC8vIGVuc3VyZShsYWJlbF9kZXNjcmlwdG9yLm51bV9hc3NldHMgPT0gMCwgQnl0ZXMoRVJSX05PRU1QVFkpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWMgNSAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGI9PQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiByZW1vdmVfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAxMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE3OQogICAgLy8gZW5zdXJlKGxhYmVsX2Rlc2NyaXB0b3IubnVtX2Fzc2V0cyA9PSAwLCBCeXRlcyhFUlJfTk9FTVBUWSkpCiAgICBieXRlYyA3IC8vIDB4NDU1MjUyM2E0ZTRmNDU0ZDUwNTQ1OQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCnJlbW92ZV9sYWJlbF9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE4MAogICAgLy8gZGVsIHNlbGYubGFiZWxzW2lkXQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9sYWJlbChpZDogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTgyLTE4MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9sYWJlbChzZWxmLCBpZDogU3RyaW5nKSAtPiBMYWJlbERlc2NyaXB0b3I6ICAjIG5vcWEgQTAwMgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTg0CiAgICAvLyBkZXNjcmlwdG9yX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGlkLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGdldF9sYWJlbF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODUKICAgIC8vIGVuc3VyZShleGlzdHMsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKZ2V0X2xhYmVsX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODYKICAgIC8vIHJldHVybiBMYWJlbERlc2NyaXB0b3IuZnJvbV9ieXRlcyhkZXNjcmlwdG9yX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmxvZ19sYWJlbHMoaWRzOiBieXRlcykgLT4gdm9pZDoKbG9nX2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxODgtMTg5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbG9nX2xhYmVscyhzZWxmLCBpZHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuU3RyaW5nXSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTAKICAgIC8vIGZvciBfaWR4LCBsYWJlbF9pZCBpbiB1ZW51bWVyYXRlKGlkcyk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmxvZ19sYWJlbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gZm9yIF9pZHgsIGxhYmVsX2lkIGluIHVlbnVtZXJhdGUoaWRzKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogbG9nX2xhYmVsc19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTEKICAgIC8vIGRlc2NyaXB0b3JfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQobGFiZWxfaWQubmF0aXZlLmJ5dGVzKQogICAgZXh0cmFjdCAyIDAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBpZiBub3QgY29uZDoKICAgIGJueiBsb2dfbGFiZWxzX2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gZW5zdXJlKGV4aXN0cywgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgYnl0ZWNfMiAvLyAweDQ1NTI1MjNhNGU0ZjQ1NTg0OTUzNTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpsb2dfbGFiZWxzX2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTMKICAgIC8vIGxvZyhkZXNjcmlwdG9yX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIGxvZwogICAgZnJhbWVfZGlnIDIKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgbG9nX2xhYmVsc19mb3JfaGVhZGVyQDEKCmxvZ19sYWJlbHNfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5hZG1pbl9vcl9vcGVyYXRvcl9vbmx5KGxhYmVsOiBieXRlcykgLT4gdm9pZDoKYWRtaW5fb3Jfb3BlcmF0b3Jfb25seToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxOTktMjAwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGFkbWluX29yX29wZXJhdG9yX29ubHkoc2VsZiwgbGFiZWw6IFN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gc2VuZGVyID0gVHhuLnNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjAyCiAgICAvLyBpZiBzZW5kZXIgPT0gc2VsZi5hZG1pbjoKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18zIC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBieiBhZG1pbl9vcl9vcGVyYXRvcl9vbmx5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gcmV0dXJuCiAgICByZXRzdWIKCmFkbWluX29yX29wZXJhdG9yX29ubHlfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIwNAogICAgLy8gc2VsZi5vcGVyYXRvcl9vbmx5KHNlbmRlciwgbGFiZWwpCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIG9wZXJhdG9yX29ubHkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLm9wZXJhdG9yX29ubHkob3BlcmF0b3I6IGJ5dGVzLCBsYWJlbDogYnl0ZXMpIC0+IHZvaWQ6Cm9wZXJhdG9yX29ubHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjA2LTIwNwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBvcGVyYXRvcl9vbmx5KHNlbGYsIG9wZXJhdG9yOiBBY2NvdW50LCBsYWJlbDogU3RyaW5nKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjA4CiAgICAvLyBlbnN1cmUoc2VsZi5vcGVyYXRvcl9oYXNfbGFiZWwob3BlcmF0b3IsIGxhYmVsKSwgQnl0ZXMoRVJSX1VOQVVUSCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBvcGVyYXRvcl9oYXNfbGFiZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogb3BlcmF0b3Jfb25seV9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMDgKICAgIC8vIGVuc3VyZShzZWxmLm9wZXJhdG9yX2hhc19sYWJlbChvcGVyYXRvciwgbGFiZWwpLCBCeXRlcyhFUlJfVU5BVVRIKSkKICAgIGJ5dGVjIDExIC8vIDB4NDU1MjUyM2E1NTRlNDE1NTU0NDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpvcGVyYXRvcl9vbmx5X2FmdGVyX2lmX2Vsc2VAMzoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLm9wZXJhdG9yX2hhc19sYWJlbChvcGVyYXRvcjogYnl0ZXMsIGxhYmVsOiBieXRlcykgLT4gdWludDY0OgpvcGVyYXRvcl9oYXNfbGFiZWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjEwLTIxMQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBvcGVyYXRvcl9oYXNfbGFiZWwoc2VsZiwgb3BlcmF0b3I6IEFjY291bnQsIGxhYmVsOiBTdHJpbmcpIC0+IGJvb2w6CiAgICBwcm90byAyIDEKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIxNgogICAgLy8gX2xlbmd0aCwgZXhpc3RzID0gb3AuQm94Lmxlbmd0aChvcGVyYXRvcl9rZXkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiBvcGVyYXRvcl9oYXNfbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjE4CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKb3BlcmF0b3JfaGFzX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMTkKICAgIC8vIGNvdW50ID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChvcGVyYXRvcl9rZXksIDAsIDIpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzEgLy8gMAogICAgaW50Y18yIC8vIDIKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjAKICAgIC8vIGZvciBpZHggaW4gdXJhbmdlKGNvdW50KToKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDEKCm9wZXJhdG9yX2hhc19sYWJlbF9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShjb3VudCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IG9wZXJhdG9yX2hhc19sYWJlbF9hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU5LTYzCiAgICAvLyAjIGJ5dGUgb2Zmc2V0IG9mIGxhYmVsIGlkeCBpbiBhbiBlbmNvZGVkIExhYmVsTGlzdCBob2xkaW5nIGNvdW50IGxhYmVscy4KICAgIC8vICMgZXZlcnkgc3RvcmVkIGxhYmVsIGlzIDIgYnl0ZXMgbG9uZyAoZW5mb3JjZWQgYnkgYWRkX2xhYmVsKSwgc28gYWZ0ZXIgdGhlIHVpbnQxNgogICAgLy8gIyBjb3VudCBhbmQgdGhlIDItYnl0ZSBoZWFkIG9mZnNldHMgdGhlIHRhaWwgaXMgYSBkZW5zZSBydW4gb2YgNC1ieXRlIGVsZW1lbnRzOgogICAgLy8gIyB1aW50MTYgbGVuZ3RoIHByZWZpeCArIDIgbGFiZWwgYnl0ZXMKICAgIC8vIHJldHVybiBjb3VudCAqIDIgKyA0ICsgaWR4ICogNAogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBwdXNoaW50IDQgLy8gNAogICAgKwogICAgZnJhbWVfZGlnIDEKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAqCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjIxCiAgICAvLyBpZiBvcC5Cb3guZXh0cmFjdChvcGVyYXRvcl9rZXksIGxhYmVsX29mZnNldChjb3VudCwgaWR4KSwgMikgPT0gbGFiZWxfa2V5OgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBpbnRjXzIgLy8gMgogICAgYm94X2V4dHJhY3QKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIGJ6IG9wZXJhdG9yX2hhc19sYWJlbF9hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjIKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnRjXzAgLy8gMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCm9wZXJhdG9yX2hhc19sYWJlbF9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjIwCiAgICAvLyBmb3IgaWR4IGluIHVyYW5nZShjb3VudCk6CiAgICBmcmFtZV9kaWcgMQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBvcGVyYXRvcl9oYXNfbGFiZWxfZm9yX2hlYWRlckAzCgpvcGVyYXRvcl9oYXNfbGFiZWxfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjIzCiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkZF9vcGVyYXRvcl90b19sYWJlbChvcGVyYXRvcjogYnl0ZXMsIGxhYmVsOiBieXRlcykgLT4gdm9pZDoKYWRkX29wZXJhdG9yX3RvX2xhYmVsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIyNS0yMjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIGFkZF9vcGVyYXRvcl90b19sYWJlbChzZWxmLCBvcGVyYXRvcjogQWNjb3VudCwgbGFiZWw6IFN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gc2VsZi5hZG1pbl9vcl9vcGVyYXRvcl9vbmx5KGxhYmVsKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGFkbWluX29yX29wZXJhdG9yX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMjktMjMyCiAgICAvLyAjIGZpbmlzaCB3aXRoIHRoZSBsYWJlbCBib3ggYmVmb3JlIHRvdWNoaW5nIHRoZSBvcGVyYXRvciBib3gKICAgIC8vICMgYSBkdXBsaWNhdGUgYmVsb3cgZmFpbHMgdGhlIHR4biwgcmV2ZXJ0aW5nIHRoaXMgd3JpdGUgdG9vCiAgICAvLyAjIGluY3JlbWVudCBsYWJlbCBvcGVyYXRvcnMsIGZhaWxpbmcgaWYgdGhlIGxhYmVsIGRvZXMgbm90IGV4aXN0CiAgICAvLyBudW1fb3BlcmF0b3JzID0gZ2V0X2xhYmVsX2NvdW50ZXIobGFiZWxfa2V5LCBVSW50NjQoTlVNX09QRVJBVE9SU19PRkZTRVQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICBjYWxsc3ViIGdldF9sYWJlbF9jb3VudGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjMzCiAgICAvLyBzZXRfbGFiZWxfY291bnRlcihsYWJlbF9rZXksIFVJbnQ2NChOVU1fT1BFUkFUT1JTX09GRlNFVCksIG51bV9vcGVyYXRvcnMgKyAxKQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGxhYmVsLCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjMzCiAgICAvLyBzZXRfbGFiZWxfY291bnRlcihsYWJlbF9rZXksIFVJbnQ2NChOVU1fT1BFUkFUT1JTX09GRlNFVCksIG51bV9vcGVyYXRvcnMgKyAxKQogICAgcHVzaGludCAxMiAvLyAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNAogICAgLy8gb3AuQm94LnJlcGxhY2UobGFiZWwsIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjM1LTIzNgogICAgLy8gIyBjaGVjayBpZiBvcGVyYXRvciBleGlzdHMgYWxyZWFkeQogICAgLy8gZXhpc3RpbmdfYnl0ZXMsIGV4aXN0cyA9IG9wLkJveC5nZXQob3BlcmF0b3IuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyMzcKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGFkZF9vcGVyYXRvcl90b19sYWJlbF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBmb3VuZCwgX2lkeCA9IGZpbmRfbGFiZWwobGFiZWxzLCBsYWJlbCkKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZmluZF9sYWJlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYnogYWRkX29wZXJhdG9yX3RvX2xhYmVsX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjIzOC0yMzkKICAgIC8vICMgZXhpc3Rpbmcgb3BlcmF0b3IsIGNoZWNrIGZvciBkdXBsaWNhdGUKICAgIC8vIGVuc3VyZShub3QgY29udGFpbnNfbGFiZWwoZXhpc3RpbmdfYnl0ZXMsIGxhYmVsX2tleSksIEJ5dGVzKEVSUl9FWElTVFMpKQogICAgYnl0ZWMgNiAvLyAweDQ1NTI1MjNhNDU1ODQ5NTM1NDUzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKYWRkX29wZXJhdG9yX3RvX2xhYmVsX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDMKICAgIC8vIGV4aXN0aW5nLmFwcGVuZChhcmM0LlN0cmluZyhsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgaW50Y18wIC8vIDEKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfYnl0ZV9sZW5ndGhfaGVhZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0NAogICAgLy8gc2VsZi5vcGVyYXRvcnNbb3BlcmF0b3JdID0gZXhpc3RpbmcuY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCmFkZF9vcGVyYXRvcl90b19sYWJlbF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNDYtMjQ3CiAgICAvLyAjIG5ldyBvcGVyYXRvciwgY3JlYXRlIG5ldyBib3gKICAgIC8vIHNlbGYub3BlcmF0b3JzW29wZXJhdG9yXSA9IGFyYzQuRHluYW1pY0FycmF5KGFyYzQuU3RyaW5nKGxhYmVsKSkKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJ5dGVjIDggLy8gMHgwMDAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDEyIC8vIDB4MDAwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9kZWwKICAgIHBvcAogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5oYXNfb3BlcmF0b3JfbGFiZWwob3BlcmF0b3I6IGJ5dGVzLCBsYWJlbDogYnl0ZXMpIC0+IHVpbnQ2NDoKaGFzX29wZXJhdG9yX2xhYmVsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI0OS0yNTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBoYXNfb3BlcmF0b3JfbGFiZWwoc2VsZiwgb3BlcmF0b3I6IEFjY291bnQsIGxhYmVsOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gZW5zdXJlKGxhYmVsLmJ5dGVzLmxlbmd0aCA9PSAyLCBCeXRlcyhFUlJfTEVOR1RIKSkKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogaGFzX29wZXJhdG9yX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gZW5zdXJlKGxhYmVsLmJ5dGVzLmxlbmd0aCA9PSAyLCBCeXRlcyhFUlJfTEVOR1RIKSkKICAgIGJ5dGVjIDQgLy8gMHg0NTUyNTIzYTRjNDU0ZTQ3NTQ0OAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCmhhc19vcGVyYXRvcl9sYWJlbF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjUyCiAgICAvLyByZXR1cm4gVUludDY0KHNlbGYub3BlcmF0b3JfaGFzX2xhYmVsKG9wZXJhdG9yLCBsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBvcGVyYXRvcl9oYXNfbGFiZWwKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsKG9wZXJhdG9yOiBieXRlcywgbGFiZWw6IGJ5dGVzKSAtPiB2b2lkOgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTQtMjU1CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbChzZWxmLCBvcGVyYXRvcjogQWNjb3VudCwgbGFiZWw6IFN0cmluZykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgaW50Y18xIC8vIDAKICAgIGJ5dGVjXzEgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI1NgogICAgLy8gc2VsZi5hZG1pbl9vcl9vcGVyYXRvcl9vbmx5KGxhYmVsKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGFkbWluX29yX29wZXJhdG9yX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNTktMjYwCiAgICAvLyAjIGZhaWxzIGlmIHRoZSBsYWJlbCBkb2VzIG5vdCBleGlzdAogICAgLy8gbnVtX29wZXJhdG9ycyA9IGdldF9sYWJlbF9jb3VudGVyKGxhYmVsX2tleSwgVUludDY0KE5VTV9PUEVSQVRPUlNfT0ZGU0VUKSkKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCAxMiAvLyAxMgogICAgY2FsbHN1YiBnZXRfbGFiZWxfY291bnRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gbGFiZWxzX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KG9wZXJhdG9yLmJ5dGVzKQogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjIKICAgIC8vIGVuc3VyZShleGlzdHMsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjUKICAgIC8vIGlmIGxhYmVscy5sZW5ndGggPT0gMToKICAgIGZyYW1lX2RpZyA1CiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGJ6IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjY2LTI2NwogICAgLy8gIyBzaW5nbGUgbGFiZWw6IGNvbXBhcmUgaW4gcGxhY2UgYW5kIGRyb3AgdGhlIGJveCwgbm8gc2NhbgogICAgLy8gZW5zdXJlKGxhYmVsc1swXSA9PSBsYWJlbCwgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgZnJhbWVfZGlnIDUKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMwogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI2Ni0yNjcKICAgIC8vICMgc2luZ2xlIGxhYmVsOiBjb21wYXJlIGluIHBsYWNlIGFuZCBkcm9wIHRoZSBib3gsIG5vIHNjYW4KICAgIC8vIGVuc3VyZShsYWJlbHNbMF0gPT0gbGFiZWwsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAyMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNjgKICAgIC8vIGRlbCBzZWxmLm9wZXJhdG9yc1tvcGVyYXRvcl0KICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjgyCiAgICAvLyBudW1fb3BlcmF0b3JzID4gMQogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMCAvLyAxCiAgICA+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjgyLTI4MwogICAgLy8gbnVtX29wZXJhdG9ycyA+IDEKICAgIC8vIG9yIGdldF9sYWJlbF9jb3VudGVyKGxhYmVsX2tleSwgVUludDY0KE5VTV9BU1NFVFNfT0ZGU0VUKSkgPT0gMCwKICAgIGJueiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9ib29sX3RydWVANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4MwogICAgLy8gb3IgZ2V0X2xhYmVsX2NvdW50ZXIobGFiZWxfa2V5LCBVSW50NjQoTlVNX0FTU0VUU19PRkZTRVQpKSA9PSAwLAogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDQgLy8gNAogICAgY2FsbHN1YiBnZXRfbGFiZWxfY291bnRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4Mi0yODMKICAgIC8vIG51bV9vcGVyYXRvcnMgPiAxCiAgICAvLyBvciBnZXRfbGFiZWxfY291bnRlcihsYWJlbF9rZXksIFVJbnQ2NChOVU1fQVNTRVRTX09GRlNFVCkpID09IDAsCiAgICBibnogcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYm9vbF9mYWxzZUA4CgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9ib29sX3RydWVANzoKICAgIGludGNfMCAvLyAxCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9ib29sX21lcmdlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyODQKICAgIC8vIEJ5dGVzKEVSUl9OT0VNUFRZKSwKICAgIGJ5dGVjIDcgLy8gMHg0NTUyNTIzYTRlNGY0NTRkNTA1NDU5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyODYtMjg3CiAgICAvLyAjIGRlY3Igb3BlcmF0b3IgY291bnQKICAgIC8vIHNldF9sYWJlbF9jb3VudGVyKGxhYmVsX2tleSwgVUludDY0KE5VTV9PUEVSQVRPUlNfT0ZGU0VUKSwgbnVtX29wZXJhdG9ycyAtIDEpCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18wIC8vIDEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGxhYmVsLCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mjg2LTI4NwogICAgLy8gIyBkZWNyIG9wZXJhdG9yIGNvdW50CiAgICAvLyBzZXRfbGFiZWxfY291bnRlcihsYWJlbF9rZXksIFVJbnQ2NChOVU1fT1BFUkFUT1JTX09GRlNFVCksIG51bV9vcGVyYXRvcnMgLSAxKQogICAgcHVzaGludCAxMiAvLyAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNAogICAgLy8gb3AuQm94LnJlcGxhY2UobGFiZWwsIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Jvb2xfZmFsc2VAODoKICAgIGludGNfMSAvLyAwCiAgICBiIHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2Jvb2xfbWVyZ2VAOQoKcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MjcwLTI3MQogICAgLy8gIyBlbnN1cmUgbGFiZWwgZXhpc3RzIGluIG9wZXJhdG9yCiAgICAvLyBmb3VuZCwgbGFiZWxfaWR4ID0gZmluZF9sYWJlbChsYWJlbHNfYnl0ZXMsIGxhYmVsX2tleSkKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZmluZF9sYWJlbAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzIKICAgIC8vIGVuc3VyZShmb3VuZCwgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgYnl0ZWNfMiAvLyAweDQ1NTI1MjNhNGU0ZjQ1NTg0OTUzNTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpyZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI3My0yNzQKICAgIC8vICMgbGFiZWxzIGFyZSB1bm9yZGVyZWQ6IG1vdmUgdGhlIGxhc3QgbGFiZWwgaW50byB0aGUgcmVtb3ZlZCBzbG90LCB0cnVuY2F0ZQogICAgLy8gbGFzdF9pZHggPSBsYWJlbHMubGVuZ3RoIC0gMQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI3NQogICAgLy8gaWYgbGFiZWxfaWR4ICE9IGxhc3RfaWR4OgogICAgZnJhbWVfZGlnIDEKICAgICE9CiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfYnVyeSAwCiAgICBieiByZW1vdmVfb3BlcmF0b3JfZnJvbV9sYWJlbF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzYKICAgIC8vIGxhYmVsc1tsYWJlbF9pZHhdID0gbGFiZWxzW2xhc3RfaWR4XQogICAgZnJhbWVfZGlnIDUKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfcmVwbGFjZV9ieXRlX2xlbmd0aF9oZWFkCiAgICBmcmFtZV9idXJ5IDAKCnJlbW92ZV9vcGVyYXRvcl9mcm9tX2xhYmVsX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzcKICAgIC8vIF9sYXN0ID0gbGFiZWxzLnBvcCgpCiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3BvcF9ieXRlX2xlbmd0aF9oZWFkCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyNzgKICAgIC8vIHNlbGYub3BlcmF0b3JzW29wZXJhdG9yXSA9IGxhYmVscy5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2RlbAogICAgcG9wCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIGIgcmVtb3ZlX29wZXJhdG9yX2Zyb21fbGFiZWxfYWZ0ZXJfaWZfZWxzZUA1CgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X29wZXJhdG9yX2xhYmVscyhvcGVyYXRvcjogYnl0ZXMpIC0+IGJ5dGVzOgpnZXRfb3BlcmF0b3JfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI4OS0yOTAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfb3BlcmF0b3JfbGFiZWxzKHNlbGYsIG9wZXJhdG9yOiBBY2NvdW50KSAtPiBMYWJlbExpc3Q6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTEKICAgIC8vIGxhYmVsc19ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChvcGVyYXRvci5ieXRlcykKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI5MgogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X29wZXJhdG9yX2xhYmVsc19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTMKICAgIC8vIHJldHVybiBMYWJlbExpc3QuZnJvbV9ieXRlcyhsYWJlbHNfYnl0ZXMpCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgcmV0c3ViCgpnZXRfb3BlcmF0b3JfbGFiZWxzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTQtMjk1CiAgICAvLyAjIHJldHVybiBlbXB0eSBsaXN0CiAgICAvLyByZXR1cm4gTGFiZWxMaXN0LmZyb21fYnl0ZXMoRU1QVFlfTEFCRUxfTElTVCkKICAgIGJ5dGVjIDkgLy8gMHgwMDAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fYWRkX2xhYmVsX3RvX2Fzc2V0KGxhYmVsOiBieXRlcywgYXNzZXQ6IHVpbnQ2NCkgLT4gdm9pZDoKX2FkZF9sYWJlbF90b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToyOTctMjk4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hZGRfbGFiZWxfdG9fYXNzZXQoc2VsZiwgbGFiZWw6IFN0cmluZywgYXNzZXQ6IEFzc2V0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBpbnRjXzEgLy8gMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTgKICAgIC8vIF92LCBleGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9jcmVhdG9yKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IF9hZGRfbGFiZWxfdG9fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjI5OS0zMDAKICAgIC8vICMgY2FsbGVycyBjaGVjayB0aGF0IGxhYmVsIGV4aXN0cyBhbmQgdXBkYXRlIGl0cyBudW1fYXNzZXRzCiAgICAvLyBlbnN1cmUobm90IGFzc2V0X2lzX2RlbGV0ZWQoYXNzZXQuaWQpLCBCeXRlcyhFUlJfTk9FWElTVCkpCiAgICBieXRlY18yIC8vIDB4NDU1MjUyM2E0ZTRmNDU1ODQ5NTM1NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBsb2cobXNnKQogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQKICAgIC8vIG9wLmVycigpCiAgICBlcnIKCl9hZGRfbGFiZWxfdG9fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMDEKICAgIC8vIGV4aXN0aW5nX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KG9wLml0b2IoYXNzZXQuaWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgYm94X2dldAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzAyCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBfYWRkX2xhYmVsX3RvX2Fzc2V0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6ODUKICAgIC8vIGZvdW5kLCBfaWR4ID0gZmluZF9sYWJlbChsYWJlbHMsIGxhYmVsKQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBmaW5kX2xhYmVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBieiBfYWRkX2xhYmVsX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMwMy0zMDQKICAgIC8vICMgZXhpc3RpbmcgYXNzZXQsIGNoZWNrIGZvciBkdXBsaWNhdGUKICAgIC8vIGVuc3VyZShub3QgY29udGFpbnNfbGFiZWwoZXhpc3RpbmdfYnl0ZXMsIGxhYmVsLmJ5dGVzKSwgQnl0ZXMoRVJSX0VYSVNUUykpCiAgICBieXRlYyA2IC8vIDB4NDU1MjUyM2E0NTU4NDk1MzU0NTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpfYWRkX2xhYmVsX3RvX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMDcKICAgIC8vIGV4aXN0aW5nLmFwcGVuZChhcmM0LlN0cmluZyhsYWJlbCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgaW50Y18wIC8vIDEKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9jb25jYXRfYnl0ZV9sZW5ndGhfaGVhZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMwOAogICAgLy8gc2VsZi5hc3NldHNbYXNzZXRdID0gZXhpc3RpbmcuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKX2FkZF9sYWJlbF90b19hc3NldF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMTAtMzExCiAgICAvLyAjIG5ldyBhc3NldCwgY3JlYXRlIG5ldyBib3gKICAgIC8vIHNlbGYuYXNzZXRzW2Fzc2V0XSA9IGFyYzQuRHluYW1pY0FycmF5KGFyYzQuU3RyaW5nKGxhYmVsKSkKICAgIGZyYW1lX2RpZyAtMgogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGJ5dGVjIDggLy8gMHgwMDAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJ5dGVjIDEyIC8vIDB4MDAwMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmFkZF9sYWJlbF90b19hc3NldChsYWJlbDogYnl0ZXMsIGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CmFkZF9sYWJlbF90b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMTMtMzE0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfbGFiZWxfdG9fYXNzZXQoc2VsZiwgbGFiZWw6IFN0cmluZywgYXNzZXQ6IEFzc2V0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzE1CiAgICAvLyBzZWxmLm9wZXJhdG9yX29ubHkoVHhuLnNlbmRlciwgbGFiZWwpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgb3BlcmF0b3Jfb25seQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMxNi0zMTcKICAgIC8vICMgZmFpbHMgaWYgdGhlIGxhYmVsIGRvZXMgbm90IGV4aXN0CiAgICAvLyBudW1fYXNzZXRzID0gZ2V0X2xhYmVsX2NvdW50ZXIobGFiZWwuYnl0ZXMsIFVJbnQ2NChOVU1fQVNTRVRTX09GRlNFVCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIHB1c2hpbnQgNCAvLyA0CiAgICBjYWxsc3ViIGdldF9sYWJlbF9jb3VudGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzE4CiAgICAvLyBzZWxmLl9hZGRfbGFiZWxfdG9fYXNzZXQobGFiZWwsIGFzc2V0KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2FkZF9sYWJlbF90b19hc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMyMC0zMjEKICAgIC8vICMgaW5jciBhc3NldCBjb3VudAogICAgLy8gc2V0X2xhYmVsX2NvdW50ZXIobGFiZWwuYnl0ZXMsIFVJbnQ2NChOVU1fQVNTRVRTX09GRlNFVCksIG51bV9hc3NldHMgKyAxKQogICAgaW50Y18wIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGxhYmVsLCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzIwLTMyMQogICAgLy8gIyBpbmNyIGFzc2V0IGNvdW50CiAgICAvLyBzZXRfbGFiZWxfY291bnRlcihsYWJlbC5ieXRlcywgVUludDY0KE5VTV9BU1NFVFNfT0ZGU0VUKSwgbnVtX2Fzc2V0cyArIDEpCiAgICBwdXNoaW50IDQgLy8gNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNAogICAgLy8gb3AuQm94LnJlcGxhY2UobGFiZWwsIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5hZGRfbGFiZWxfdG9fYXNzZXRzKGxhYmVsOiBieXRlcywgYXNzZXRzOiBieXRlcykgLT4gdm9pZDoKYWRkX2xhYmVsX3RvX2Fzc2V0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMjMtMzI2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfbGFiZWxfdG9fYXNzZXRzKAogICAgLy8gICAgIHNlbGYsIGxhYmVsOiBTdHJpbmcsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMjcKICAgIC8vIHNlbGYub3BlcmF0b3Jfb25seShUeG4uc2VuZGVyLCBsYWJlbCkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBvcGVyYXRvcl9vbmx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzI4LTMyOQogICAgLy8gIyBmYWlscyBpZiB0aGUgbGFiZWwgZG9lcyBub3QgZXhpc3QKICAgIC8vIG51bV9hc3NldHMgPSBnZXRfbGFiZWxfY291bnRlcihsYWJlbC5ieXRlcywgVUludDY0KE5VTV9BU1NFVFNfT0ZGU0VUKSkKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCA0IC8vIDQKICAgIGNhbGxzdWIgZ2V0X2xhYmVsX2NvdW50ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMzAtMzMxCiAgICAvLyAjIHJlYWQgdGhlIGlkcyBkaXJlY3RseSBpbnN0ZWFkIG9mIGRlY29kaW5nIGFuIGFyYzQuVUludDY0IHBlciBlbGVtZW50CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmFkZF9sYWJlbF90b19hc3NldHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMzMC0zMzEKICAgIC8vICMgcmVhZCB0aGUgaWRzIGRpcmVjdGx5IGluc3RlYWQgb2YgZGVjb2RpbmcgYW4gYXJjNC5VSW50NjQgcGVyIGVsZW1lbnQKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogYWRkX2xhYmVsX3RvX2Fzc2V0c19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY4LTcwCiAgICAvLyAjIGlkIGlkeCBvZiBhbiBlbmNvZGVkIHVpbnQ2NFtdOiBwYWNrZWQgdWludDY0cyBhZnRlciB0aGUgdWludDE2IGxlbmd0aCBwcmVmaXguCiAgICAvLyAjIGxvb3BzIHJ1biB0byB0aGUgbGVuZ3RoIHByZWZpeCwgc28gYSBwYXlsb2FkIHNob3J0ZXIgdGhhbiBpdCBmYWlscyB0aGUgZXh0cmFjdAogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGFzc2V0cywgMiArIGlkeCAqIDgpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMzIKICAgIC8vIHNlbGYuX2FkZF9sYWJlbF90b19hc3NldChsYWJlbCwgQXNzZXQoYXNzZXRfaWRfYXQoYXNzZXRzLmJ5dGVzLCBpKSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNhbGxzdWIgX2FkZF9sYWJlbF90b19hc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjMzMC0zMzEKICAgIC8vICMgcmVhZCB0aGUgaWRzIGRpcmVjdGx5IGluc3RlYWQgb2YgZGVjb2RpbmcgYW4gYXJjNC5VSW50NjQgcGVyIGVsZW1lbnQKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgYWRkX2xhYmVsX3RvX2Fzc2V0c19mb3JfaGVhZGVyQDEKCmFkZF9sYWJlbF90b19hc3NldHNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzM3CiAgICAvLyBsYWJlbC5ieXRlcywgVUludDY0KE5VTV9BU1NFVFNfT0ZGU0VUKSwgbnVtX2Fzc2V0cyArIGFzc2V0cy5sZW5ndGgKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNAogICAgLy8gb3AuQm94LnJlcGxhY2UobGFiZWwsIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozMzcKICAgIC8vIGxhYmVsLmJ5dGVzLCBVSW50NjQoTlVNX0FTU0VUU19PRkZTRVQpLCBudW1fYXNzZXRzICsgYXNzZXRzLmxlbmd0aAogICAgcHVzaGludCA0IC8vIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weToxMTQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGxhYmVsLCBvZmZzZXQsIG9wLml0b2IodmFsdWUpKQogICAgdW5jb3ZlciAyCiAgICBib3hfcmVwbGFjZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcucmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXQobGFiZWw6IGJ5dGVzLCBhc3NldDogdWludDY0KSAtPiB2b2lkOgpyZW1vdmVfbGFiZWxfZnJvbV9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDAtMzQxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldChzZWxmLCBsYWJlbDogU3RyaW5nLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMSAvLyAwCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDItMzQzCiAgICAvLyAjIGZhaWxzIGlmIHRoZSBsYWJlbCBkb2VzIG5vdCBleGlzdAogICAgLy8gbnVtX2Fzc2V0cyA9IGdldF9sYWJlbF9jb3VudGVyKGxhYmVsLmJ5dGVzLCBVSW50NjQoTlVNX0FTU0VUU19PRkZTRVQpKQogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDQgLy8gNAogICAgY2FsbHN1YiBnZXRfbGFiZWxfY291bnRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gc2VsZi5vcGVyYXRvcl9vbmx5KFR4bi5zZW5kZXIsIGxhYmVsKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIG9wZXJhdG9yX29ubHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDcKICAgIC8vIGxhYmVsc19ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChvcC5pdG9iKGFzc2V0LmlkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZHVwCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2lmX2Vsc2VAMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNDgKICAgIC8vIGVuc3VyZShleGlzdHMsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNTEKICAgIC8vIGlmIGxhYmVscy5sZW5ndGggPT0gMToKICAgIGZyYW1lX2RpZyA2CiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgZnJhbWVfYnVyeSAzCiAgICBpbnRjXzAgLy8gMQogICAgPT0KICAgIGJ6IHJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzUyLTM1MwogICAgLy8gIyBzaW5nbGUgbGFiZWw6IGNvbXBhcmUgaW4gcGxhY2UgYW5kIGRyb3AgdGhlIGJveCwgbm8gcmVidWlsZAogICAgLy8gZW5zdXJlKGxhYmVsc1swXSA9PSBsYWJlbCwgQnl0ZXMoRVJSX05PRVhJU1QpKQogICAgZnJhbWVfZGlnIDYKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMwogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBleHRyYWN0MwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAtMgogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM1Mi0zNTMKICAgIC8vICMgc2luZ2xlIGxhYmVsOiBjb21wYXJlIGluIHBsYWNlIGFuZCBkcm9wIHRoZSBib3gsIG5vIHJlYnVpbGQKICAgIC8vIGVuc3VyZShsYWJlbHNbMF0gPT0gbGFiZWwsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNTQKICAgIC8vIGRlbCBzZWxmLmFzc2V0c1thc3NldF0KICAgIGZyYW1lX2RpZyA1CiAgICBib3hfZGVsCiAgICBwb3AKCnJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjUtMzY2CiAgICAvLyAjIGRlY3IgYXNzZXQgY291bnQKICAgIC8vIHNldF9sYWJlbF9jb3VudGVyKGxhYmVsLmJ5dGVzLCBVSW50NjQoTlVNX0FTU0VUU19PRkZTRVQpLCBudW1fYXNzZXRzIC0gMSkKICAgIGZyYW1lX2RpZyA0CiAgICBpbnRjXzAgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjExNAogICAgLy8gb3AuQm94LnJlcGxhY2UobGFiZWwsIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjUtMzY2CiAgICAvLyAjIGRlY3IgYXNzZXQgY291bnQKICAgIC8vIHNldF9sYWJlbF9jb3VudGVyKGxhYmVsLmJ5dGVzLCBVSW50NjQoTlVNX0FTU0VUU19PRkZTRVQpLCBudW1fYXNzZXRzIC0gMSkKICAgIHB1c2hpbnQgNCAvLyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MTE0CiAgICAvLyBvcC5Cb3gucmVwbGFjZShsYWJlbCwgb2Zmc2V0LCBvcC5pdG9iKHZhbHVlKSkKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzU2CiAgICAvLyBmb3VuZCwgbGFiZWxfaWR4ID0gZmluZF9sYWJlbChsYWJlbHNfYnl0ZXMsIGxhYmVsLmJ5dGVzKQogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBmaW5kX2xhYmVsCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MgogICAgLy8gaWYgbm90IGNvbmQ6CiAgICBibnogcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzU3CiAgICAvLyBlbnN1cmUoZm91bmQsIEJ5dGVzKEVSUl9OT0VYSVNUKSkKICAgIGJ5dGVjXzIgLy8gMHg0NTUyNTIzYTRlNGY0NTU4NDk1MzU0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMKICAgIC8vIGxvZyhtc2cpCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NAogICAgLy8gb3AuZXJyKCkKICAgIGVycgoKcmVtb3ZlX2xhYmVsX2Zyb21fYXNzZXRfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM1OC0zNTkKICAgIC8vICMgbGFiZWxzIGFyZSB1bm9yZGVyZWQ6IG1vdmUgdGhlIGxhc3QgbGFiZWwgaW50byB0aGUgcmVtb3ZlZCBzbG90LCB0cnVuY2F0ZQogICAgLy8gbGFzdF9pZHggPSBsYWJlbHMubGVuZ3RoIC0gMQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMCAvLyAxCiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM2MAogICAgLy8gaWYgbGFiZWxfaWR4ICE9IGxhc3RfaWR4OgogICAgZnJhbWVfZGlnIDEKICAgICE9CiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfYnVyeSAwCiAgICBieiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjEKICAgIC8vIGxhYmVsc1tsYWJlbF9pZHhdID0gbGFiZWxzW2xhc3RfaWR4XQogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGZyYW1lX2RpZyAzCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZXh0cmFjdDMKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfcmVwbGFjZV9ieXRlX2xlbmd0aF9oZWFkCiAgICBmcmFtZV9idXJ5IDAKCnJlbW92ZV9sYWJlbF9mcm9tX2Fzc2V0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjIKICAgIC8vIF9sYXN0ID0gbGFiZWxzLnBvcCgpCiAgICBmcmFtZV9kaWcgMAogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3BvcF9ieXRlX2xlbmd0aF9oZWFkCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjMKICAgIC8vIHNlbGYuYXNzZXRzW2Fzc2V0XSA9IGxhYmVscy5jb3B5KCkKICAgIGZyYW1lX2RpZyA1CiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgc3dhcAogICAgYm94X3B1dAogICAgYiByZW1vdmVfbGFiZWxfZnJvbV9hc3NldF9hZnRlcl9pZl9lbHNlQDUKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5oYXNfYXNzZXRfbGFiZWwoYXNzZXRfaWQ6IHVpbnQ2NCwgbGFiZWw6IGJ5dGVzKSAtPiB1aW50NjQ6Cmhhc19hc3NldF9sYWJlbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNjgtMzY5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgaGFzX2Fzc2V0X2xhYmVsKHNlbGYsIGFzc2V0X2lkOiBVSW50NjQsIGxhYmVsOiBTdHJpbmcpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgaW50Y18xIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzAKICAgIC8vIGVuc3VyZShsYWJlbC5ieXRlcy5sZW5ndGggPT0gMiwgQnl0ZXMoRVJSX0xFTkdUSCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgaW50Y18yIC8vIDIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIKICAgIC8vIGlmIG5vdCBjb25kOgogICAgYm56IGhhc19hc3NldF9sYWJlbF9hZnRlcl9pZl9lbHNlQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzAKICAgIC8vIGVuc3VyZShsYWJlbC5ieXRlcy5sZW5ndGggPT0gMiwgQnl0ZXMoRVJSX0xFTkdUSCkpCiAgICBieXRlYyA0IC8vIDB4NDU1MjUyM2E0YzQ1NGU0NzU0NDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MwogICAgLy8gbG9nKG1zZykKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0CiAgICAvLyBvcC5lcnIoKQogICAgZXJyCgpoYXNfYXNzZXRfbGFiZWxfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3MQogICAgLy8gbGFiZWxzX2J5dGVzLCBleGlzdHMgPSBvcC5Cb3guZ2V0KG9wLml0b2IoYXNzZXRfaWQpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzIKICAgIC8vIHJldHVybiBVSW50NjQoZXhpc3RzIGFuZCBjb250YWluc19sYWJlbChsYWJlbHNfYnl0ZXMsIGxhYmVsLmJ5dGVzKSkKICAgIGJ6IGhhc19hc3NldF9sYWJlbF9ib29sX2ZhbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo4NQogICAgLy8gZm91bmQsIF9pZHggPSBmaW5kX2xhYmVsKGxhYmVscywgbGFiZWwpCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGZpbmRfbGFiZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3MgogICAgLy8gcmV0dXJuIFVJbnQ2NChleGlzdHMgYW5kIGNvbnRhaW5zX2xhYmVsKGxhYmVsc19ieXRlcywgbGFiZWwuYnl0ZXMpKQogICAgYnogaGFzX2Fzc2V0X2xhYmVsX2Jvb2xfZmFsc2VAMwogICAgaW50Y18wIC8vIDEKCmhhc19hc3NldF9sYWJlbF9ib29sX21lcmdlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzcyCiAgICAvLyByZXR1cm4gVUludDY0KGV4aXN0cyBhbmQgY29udGFpbnNfbGFiZWwobGFiZWxzX2J5dGVzLCBsYWJlbC5ieXRlcykpCiAgICBzd2FwCiAgICByZXRzdWIKCmhhc19hc3NldF9sYWJlbF9ib29sX2ZhbHNlQDM6CiAgICBpbnRjXzEgLy8gMAogICAgYiBoYXNfYXNzZXRfbGFiZWxfYm9vbF9tZXJnZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9sYWJlbHMoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3NC0zNzUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2dldF9hc3NldF9sYWJlbHMoc2VsZiwgYXNzZXQ6IEFzc2V0KSAtPiBMYWJlbExpc3Q6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozNzYKICAgIC8vIGxhYmVsc19ieXRlcywgZXhpc3RzID0gb3AuQm94LmdldChvcC5pdG9iKGFzc2V0LmlkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3NwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogX2dldF9hc3NldF9sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzc4CiAgICAvLyByZXR1cm4gTGFiZWxMaXN0LmZyb21fYnl0ZXMobGFiZWxzX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKX2dldF9hc3NldF9sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM3OS0zODAKICAgIC8vICMgcmV0dXJuIGVtcHR5CiAgICAvLyByZXR1cm4gTGFiZWxMaXN0LmZyb21fYnl0ZXMoRU1QVFlfTEFCRUxfTElTVCkKICAgIGJ5dGVjIDkgLy8gMHgwMDAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfbGFiZWxzKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4Mi0zODMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfbGFiZWxzKHNlbGYsIGFzc2V0OiBBc3NldCkgLT4gTGFiZWxMaXN0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6Mzg0CiAgICAvLyByZXR1cm4gc2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X2xhYmVscwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c19sYWJlbHMoYXNzZXRzOiBieXRlcykgLT4gYnl0ZXM6CmdldF9hc3NldHNfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM4Ni0zODkKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX2xhYmVscygKICAgIC8vICAgICBzZWxmLCBhc3NldHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XQogICAgLy8gKSAtPiBhcmM0LkR5bmFtaWNBcnJheVtMYWJlbExpc3RdOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzEgLy8gMAogICAgZHVwbiAyCiAgICBieXRlY18xIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTAKICAgIC8vIG91dCA9IGFyYzQuRHluYW1pY0FycmF5W0xhYmVsTGlzdF0oKQogICAgYnl0ZWMgOSAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTEKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c19sYWJlbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM5MQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiBnZXRfYXNzZXRzX2xhYmVsc19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY4LTcwCiAgICAvLyAjIGlkIGlkeCBvZiBhbiBlbmNvZGVkIHVpbnQ2NFtdOiBwYWNrZWQgdWludDY0cyBhZnRlciB0aGUgdWludDE2IGxlbmd0aCBwcmVmaXguCiAgICAvLyAjIGxvb3BzIHJ1biB0byB0aGUgbGVuZ3RoIHByZWZpeCwgc28gYSBwYXlsb2FkIHNob3J0ZXIgdGhhbiBpdCBmYWlscyB0aGUgZXh0cmFjdAogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGFzc2V0cywgMiArIGlkeCAqIDgpCiAgICBmcmFtZV9kaWcgOQogICAgaW50Y18zIC8vIDgKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzkyCiAgICAvLyBvdXQuYXBwZW5kKHNlbGYuX2dldF9hc3NldF9sYWJlbHMoQXNzZXQoYXNzZXRfaWRfYXQoYXNzZXRzLmJ5dGVzLCBpKSkpKQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X2xhYmVscwogICAgYnl0ZWMgOCAvLyAweDAwMDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAyCiAgICBmcmFtZV9kaWcgNwogICAgZHVwCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cAogICAgY292ZXIgMgogICAgZnJhbWVfYnVyeSAzCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfYnVyeSAwCiAgICBieXRlY18xIC8vIDB4CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMiAvLyAyCiAgICAqCiAgICBmcmFtZV9idXJ5IDYKICAgIGludGNfMSAvLyAwCiAgICBmcmFtZV9idXJ5IDQKCmdldF9hc3NldHNfbGFiZWxzX2Zvcl9oZWFkZXJAODoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNgogICAgPAogICAgYnogZ2V0X2Fzc2V0c19sYWJlbHNfYWZ0ZXJfZm9yQDEwCiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGdldF9hc3NldHNfbGFiZWxzX2Zvcl9oZWFkZXJAOAoKZ2V0X2Fzc2V0c19sYWJlbHNfYWZ0ZXJfZm9yQDEwOgogICAgZnJhbWVfZGlnIDAKICAgIGxlbgogICAgZnJhbWVfYnVyeSA1CiAgICBpbnRjXzEgLy8gMAogICAgZnJhbWVfYnVyeSA0CgpnZXRfYXNzZXRzX2xhYmVsc19mb3JfaGVhZGVyQDExOgogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMiAvLyAyCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX2xhYmVsc19hZnRlcl9mb3JAMTMKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIDUKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZ2V0X2Fzc2V0c19sYWJlbHNfZm9yX2hlYWRlckAxMQoKZ2V0X2Fzc2V0c19sYWJlbHNfYWZ0ZXJfZm9yQDEzOgogICAgZnJhbWVfZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTIKICAgIC8vIG91dC5hcHBlbmQoc2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhBc3NldChhc3NldF9pZF9hdChhc3NldHMuYnl0ZXMsIGkpKSkpCiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgNgogICAgZnJhbWVfZGlnIDUKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gMgogICAgc3dhcAogICAgc3Vic3RyaW5nMwogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTEKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSA5CiAgICBiIGdldF9hc3NldHNfbGFiZWxzX2Zvcl9oZWFkZXJAMQoKZ2V0X2Fzc2V0c19sYWJlbHNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6MzkzCiAgICAvLyByZXR1cm4gb3V0CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5sb2dfYXNzZXRzX2xhYmVscyhhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpsb2dfYXNzZXRzX2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTUtMzk2CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgbG9nX2Fzc2V0c19sYWJlbHMoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTcKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKbG9nX2Fzc2V0c19sYWJlbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM5NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBsb2dfYXNzZXRzX2xhYmVsc19hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY4LTcwCiAgICAvLyAjIGlkIGlkeCBvZiBhbiBlbmNvZGVkIHVpbnQ2NFtdOiBwYWNrZWQgdWludDY0cyBhZnRlciB0aGUgdWludDE2IGxlbmd0aCBwcmVmaXguCiAgICAvLyAjIGxvb3BzIHJ1biB0byB0aGUgbGVuZ3RoIHByZWZpeCwgc28gYSBwYXlsb2FkIHNob3J0ZXIgdGhhbiBpdCBmYWlscyB0aGUgZXh0cmFjdAogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGFzc2V0cywgMiArIGlkeCAqIDgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTozOTgKICAgIC8vIGxvZyhzZWxmLl9nZXRfYXNzZXRfbGFiZWxzKEFzc2V0KGFzc2V0X2lkX2F0KGFzc2V0cy5ieXRlcywgaSkpKSkKICAgIGNhbGxzdWIgX2dldF9hc3NldF9sYWJlbHMKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjM5NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBsb2dfYXNzZXRzX2xhYmVsc19mb3JfaGVhZGVyQDEKCmxvZ19hc3NldHNfbGFiZWxzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9taWNybyhhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF9taWNybzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MDktNDEwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfbWljcm8oc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRNaWNybzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBfdiwgZXhpc3RzID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfY3JlYXRvcihhc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQxMQogICAgLy8gaWYgYXNzZXRfaXNfZGVsZXRlZChhc3NldF9pZCk6CiAgICBibnogX2dldF9hc3NldF9taWNyb19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTIKICAgIC8vIHJldHVybiBBc3NldE1pY3JvLmZyb21fYnl0ZXMoYiIiKQogICAgYnl0ZWNfMSAvLyAweAogICAgcmV0c3ViCgpfZ2V0X2Fzc2V0X21pY3JvX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTUKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTYKICAgIC8vIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBpbnRjXzMgLy8gOAogICAgPD0KICAgIGFzc2VydCAvLyBvdmVyZmxvdwogICAgZXh0cmFjdCA3IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTQtNDE3CiAgICAvLyByZXR1cm4gQXNzZXRNaWNybygKICAgIC8vICAgICB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIC8vICAgICBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDAwMDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfbWljcm8oYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF9taWNybzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MTktNDIwCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X21pY3JvKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0TWljcm86CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0MjEKICAgIC8vIHJldHVybiBzZWxmLl9nZXRfYXNzZXRfbWljcm8oYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9taWNybwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c19taWNybyhhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpnZXRfYXNzZXRzX21pY3JvOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyMy00MjQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX21pY3JvKHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDI1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmdldF9hc3NldHNfbWljcm9fZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyNQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX21pY3JvX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NjgtNzAKICAgIC8vICMgaWQgaWR4IG9mIGFuIGVuY29kZWQgdWludDY0W106IHBhY2tlZCB1aW50NjRzIGFmdGVyIHRoZSB1aW50MTYgbGVuZ3RoIHByZWZpeC4KICAgIC8vICMgbG9vcHMgcnVuIHRvIHRoZSBsZW5ndGggcHJlZml4LCBzbyBhIHBheWxvYWQgc2hvcnRlciB0aGFuIGl0IGZhaWxzIHRoZSBleHRyYWN0CiAgICAvLyByZXR1cm4gb3AuZXh0cmFjdF91aW50NjQoYXNzZXRzLCAyICsgaWR4ICogOCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQyNgogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF9taWNybyhhc3NldF9pZF9hdChhc3NldHMuYnl0ZXMsIGkpKSkKICAgIGNhbGxzdWIgX2dldF9hc3NldF9taWNybwogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDI1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfbWljcm9fZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX21pY3JvX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9taWNyb19sYWJlbHMoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfbWljcm9fbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzMC00MzEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2dldF9hc3NldF9taWNyb19sYWJlbHMoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRNaWNyb0xhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBfdiwgZXhpc3RzID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfY3JlYXRvcihhc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzMgogICAgLy8gaWYgYXNzZXRfaXNfZGVsZXRlZChhc3NldF9pZCk6CiAgICBibnogX2dldF9hc3NldF9taWNyb19sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDMzCiAgICAvLyByZXR1cm4gQXNzZXRNaWNyb0xhYmVscy5mcm9tX2J5dGVzKGIiIikKICAgIGJ5dGVjXzEgLy8gMHgKICAgIHJldHN1YgoKX2dldF9hc3NldF9taWNyb19sYWJlbHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzNgogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzNwogICAgLy8gZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXREZWNpbWFscwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQzOAogICAgLy8gbGFiZWxzPXNlbGYuX2dldF9hc3NldF9sYWJlbHMoYXNzZXQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfbGFiZWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDM1LTQzOQogICAgLy8gcmV0dXJuIEFzc2V0TWljcm9MYWJlbHMoCiAgICAvLyAgICAgdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICAvLyAgICAgZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICAvLyAgICAgbGFiZWxzPXNlbGYuX2dldF9hc3NldF9sYWJlbHMoYXNzZXQpLAogICAgLy8gKQogICAgZGlnIDIKICAgIGxlbgogICAgcHVzaGludCA1IC8vIDUKICAgICsKICAgIGJ5dGVjIDEzIC8vIDB4MDAwNQogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldF9taWNyb19sYWJlbHMoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF9taWNyb19sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQxLTQ0MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldF9taWNyb19sYWJlbHMoc2VsZiwgYXNzZXQ6IFVJbnQ2NCkgLT4gQXNzZXRNaWNyb0xhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0MwogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF9taWNyb19sYWJlbHMoYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9taWNyb19sYWJlbHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldHNfbWljcm9fbGFiZWxzKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfbWljcm9fbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0NS00NDYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX21pY3JvX2xhYmVscyhzZWxmLCBhc3NldHM6IGFyYzQuRHluYW1pY0FycmF5W2FyYzQuVUludDY0XSkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMSAvLyAwCgpnZXRfYXNzZXRzX21pY3JvX2xhYmVsc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDQ3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfbWljcm9fbGFiZWxzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NjgtNzAKICAgIC8vICMgaWQgaWR4IG9mIGFuIGVuY29kZWQgdWludDY0W106IHBhY2tlZCB1aW50NjRzIGFmdGVyIHRoZSB1aW50MTYgbGVuZ3RoIHByZWZpeC4KICAgIC8vICMgbG9vcHMgcnVuIHRvIHRoZSBsZW5ndGggcHJlZml4LCBzbyBhIHBheWxvYWQgc2hvcnRlciB0aGFuIGl0IGZhaWxzIHRoZSBleHRyYWN0CiAgICAvLyByZXR1cm4gb3AuZXh0cmFjdF91aW50NjQoYXNzZXRzLCAyICsgaWR4ICogOCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ0OAogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF9taWNyb19sYWJlbHMoYXNzZXRfaWRfYXQoYXNzZXRzLmJ5dGVzLCBpKSkpCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfbWljcm9fbGFiZWxzCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NDcKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c19taWNyb19sYWJlbHNfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX21pY3JvX2xhYmVsc19hZnRlcl9mb3JANDoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLl9nZXRfYXNzZXRfdGlueShhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF90aW55OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ1Mi00NTMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2dldF9hc3NldF90aW55KHNlbGYsIGFzc2V0X2lkOiBVSW50NjQpIC0+IEFzc2V0VGlueToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBfdiwgZXhpc3RzID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfY3JlYXRvcihhc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ1NAogICAgLy8gaWYgYXNzZXRfaXNfZGVsZXRlZChhc3NldF9pZCk6CiAgICBibnogX2dldF9hc3NldF90aW55X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ1NQogICAgLy8gcmV0dXJuIEFzc2V0VGlueS5mcm9tX2J5dGVzKGIiIikKICAgIGJ5dGVjXzEgLy8gMHgKICAgIHJldHN1YgoKX2dldF9hc3NldF90aW55X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NTgKICAgIC8vIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDU5CiAgICAvLyB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFVuaXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDYwCiAgICAvLyBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldERlY2ltYWxzCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDU3LTQ2MQogICAgLy8gcmV0dXJuIEFzc2V0VGlueSgKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gKQogICAgZGlnIDIKICAgIGxlbgogICAgcHVzaGludCA1IC8vIDUKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBieXRlYyAxMyAvLyAweDAwMDUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGlueShhc3NldDogdWludDY0KSAtPiBieXRlczoKZ2V0X2Fzc2V0X3Rpbnk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDYzLTQ2NAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldF90aW55KHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGlueToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90aW55KGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfdGlueQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c190aW55KGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGlueToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NjctNDY4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0c190aW55KHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDY5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmdldF9hc3NldHNfdGlueV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDY5CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfdGlueV9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY4LTcwCiAgICAvLyAjIGlkIGlkeCBvZiBhbiBlbmNvZGVkIHVpbnQ2NFtdOiBwYWNrZWQgdWludDY0cyBhZnRlciB0aGUgdWludDE2IGxlbmd0aCBwcmVmaXguCiAgICAvLyAjIGxvb3BzIHJ1biB0byB0aGUgbGVuZ3RoIHByZWZpeCwgc28gYSBwYXlsb2FkIHNob3J0ZXIgdGhhbiBpdCBmYWlscyB0aGUgZXh0cmFjdAogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGFzc2V0cywgMiArIGlkeCAqIDgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzAKICAgIC8vIGxvZyhzZWxmLl9nZXRfYXNzZXRfdGlueShhc3NldF9pZF9hdChhc3NldHMuYnl0ZXMsIGkpKSkKICAgIGNhbGxzdWIgX2dldF9hc3NldF90aW55CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NjkKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c190aW55X2Zvcl9oZWFkZXJAMQoKZ2V0X2Fzc2V0c190aW55X2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF90aW55X2xhYmVscyhhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF90aW55X2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0NzQtNDc1CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfdGlueV9sYWJlbHMoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRUaW55TGFiZWxzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTgKICAgIC8vIF92LCBleGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9jcmVhdG9yKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDc2CiAgICAvLyBpZiBhc3NldF9pc19kZWxldGVkKGFzc2V0X2lkKToKICAgIGJueiBfZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ3NwogICAgLy8gcmV0dXJuIEFzc2V0VGlueUxhYmVscy5mcm9tX2J5dGVzKGIiIikKICAgIGJ5dGVjXzEgLy8gMHgKICAgIHJldHN1YgoKX2dldF9hc3NldF90aW55X2xhYmVsc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDgwCiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4MgogICAgLy8gZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXREZWNpbWFscwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4MwogICAgLy8gbGFiZWxzPXNlbGYuX2dldF9hc3NldF9sYWJlbHMoYXNzZXQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfbGFiZWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDc5LTQ4NAogICAgLy8gcmV0dXJuIEFzc2V0VGlueUxhYmVscygKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLl9nZXRfYXNzZXRfbGFiZWxzKGFzc2V0KSwKICAgIC8vICkKICAgIGRpZyAzCiAgICBsZW4KICAgIHB1c2hpbnQgNyAvLyA3CiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBwdXNoYnl0ZXMgMHgwMDA3CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA0CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGlueV9sYWJlbHMoYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF9hc3NldF90aW55X2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0ODYtNDg3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzKHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGlueUxhYmVsczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90aW55X2xhYmVscyhhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX3RpbnlfbGFiZWxzKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGlueV9sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkwLTQ5MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfdGlueV9sYWJlbHMoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTIKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c190aW55X2xhYmVsc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfdGlueV9sYWJlbHNfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo2OC03MAogICAgLy8gIyBpZCBpZHggb2YgYW4gZW5jb2RlZCB1aW50NjRbXTogcGFja2VkIHVpbnQ2NHMgYWZ0ZXIgdGhlIHVpbnQxNiBsZW5ndGggcHJlZml4LgogICAgLy8gIyBsb29wcyBydW4gdG8gdGhlIGxlbmd0aCBwcmVmaXgsIHNvIGEgcGF5bG9hZCBzaG9ydGVyIHRoYW4gaXQgZmFpbHMgdGhlIGV4dHJhY3QKICAgIC8vIHJldHVybiBvcC5leHRyYWN0X3VpbnQ2NChhc3NldHMsIDIgKyBpZHggKiA4KQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NDkzCiAgICAvLyBsb2coc2VsZi5fZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzKGFzc2V0X2lkX2F0KGFzc2V0cy5ieXRlcywgaSkpKQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3RpbnlfbGFiZWxzCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTIKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c190aW55X2xhYmVsc19mb3JfaGVhZGVyQDEKCmdldF9hc3NldHNfdGlueV9sYWJlbHNfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fZ2V0X2Fzc2V0X3RleHQoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfdGV4dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTctNDk4CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfdGV4dChzZWxmLCBhc3NldF9pZDogVUludDY0KSAtPiBBc3NldFRleHQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo5OAogICAgLy8gX3YsIGV4aXN0cyA9IG9wLkFzc2V0UGFyYW1zR2V0LmFzc2V0X2NyZWF0b3IoYXNzZXRfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo0OTkKICAgIC8vIGlmIGFzc2V0X2lzX2RlbGV0ZWQoYXNzZXRfaWQpOgogICAgYm56IF9nZXRfYXNzZXRfdGV4dF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MDAKICAgIC8vIHJldHVybiBBc3NldFRleHQuZnJvbV9ieXRlcyhiIiIpCiAgICBieXRlY18xIC8vIDB4CiAgICByZXRzdWIKCl9nZXRfYXNzZXRfdGV4dF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTAzCiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUwNAogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUwNQogICAgLy8gdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVUkwKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MDItNTA2CiAgICAvLyByZXR1cm4gQXNzZXRUZXh0KAogICAgLy8gICAgIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICAvLyAgICAgdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICAvLyAgICAgdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICAvLyApCiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDYgLy8gNgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwNgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRfdGV4dChhc3NldDogdWludDY0KSAtPiBieXRlczoKZ2V0X2Fzc2V0X3RleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTA4LTUwOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldF90ZXh0KHNlbGYsIGFzc2V0OiBVSW50NjQpIC0+IEFzc2V0VGV4dDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUxMAogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF90ZXh0KGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9nZXRfYXNzZXRfdGV4dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c190ZXh0KGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfdGV4dDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTItNTEzCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0c190ZXh0KHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTE0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmdldF9hc3NldHNfdGV4dF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTE0CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfdGV4dF9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjY4LTcwCiAgICAvLyAjIGlkIGlkeCBvZiBhbiBlbmNvZGVkIHVpbnQ2NFtdOiBwYWNrZWQgdWludDY0cyBhZnRlciB0aGUgdWludDE2IGxlbmd0aCBwcmVmaXguCiAgICAvLyAjIGxvb3BzIHJ1biB0byB0aGUgbGVuZ3RoIHByZWZpeCwgc28gYSBwYXlsb2FkIHNob3J0ZXIgdGhhbiBpdCBmYWlscyB0aGUgZXh0cmFjdAogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KGFzc2V0cywgMiArIGlkeCAqIDgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnRjXzMgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTUKICAgIC8vIGxvZyhzZWxmLl9nZXRfYXNzZXRfdGV4dChhc3NldF9pZF9hdChhc3NldHMuYnl0ZXMsIGkpKSkKICAgIGNhbGxzdWIgX2dldF9hc3NldF90ZXh0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTQKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c190ZXh0X2Zvcl9oZWFkZXJAMQoKZ2V0X2Fzc2V0c190ZXh0X2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF90ZXh0X2xhYmVscyhhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF90ZXh0X2xhYmVsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MTktNTIwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfdGV4dF9sYWJlbHMoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRUZXh0TGFiZWxzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTgKICAgIC8vIF92LCBleGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9jcmVhdG9yKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTIxCiAgICAvLyBpZiBhc3NldF9pc19kZWxldGVkKGFzc2V0X2lkKToKICAgIGJueiBfZ2V0X2Fzc2V0X3RleHRfbGFiZWxzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyMgogICAgLy8gcmV0dXJuIEFzc2V0VGV4dExhYmVscy5mcm9tX2J5dGVzKGIiIikKICAgIGJ5dGVjXzEgLy8gMHgKICAgIHJldHN1YgoKX2dldF9hc3NldF90ZXh0X2xhYmVsc19hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTI1CiAgICAvLyBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyNgogICAgLy8gdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVbml0TmFtZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgY2FsbHN1YiBiMnN0cgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyNwogICAgLy8gdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRVUkwKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MjgKICAgIC8vIGxhYmVscz1zZWxmLl9nZXRfYXNzZXRfbGFiZWxzKGFzc2V0KSwKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X2xhYmVscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUyNC01MjkKICAgIC8vIHJldHVybiBBc3NldFRleHRMYWJlbHMoCiAgICAvLyAgICAgbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIC8vICAgICB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIC8vICAgICB1cmw9YjJzdHIoYXNzZXQudXJsKSwKICAgIC8vICAgICBsYWJlbHM9c2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhhc3NldCksCiAgICAvLyApCiAgICBkaWcgMwogICAgbGVuCiAgICBpbnRjXzMgLy8gOAogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgcHVzaGJ5dGVzIDB4MDAwOAogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgNAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBkaWcgMwogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0X3RleHRfbGFiZWxzKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfdGV4dF9sYWJlbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTMxLTUzMgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldF90ZXh0X2xhYmVscyhzZWxmLCBhc3NldDogVUludDY0KSAtPiBBc3NldFRleHRMYWJlbHM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1MzMKICAgIC8vIHJldHVybiBzZWxmLl9nZXRfYXNzZXRfdGV4dF9sYWJlbHMoYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF90ZXh0X2xhYmVscwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuZ2V0X2Fzc2V0c190ZXh0X2xhYmVscyhhc3NldHM6IGJ5dGVzKSAtPiB2b2lkOgpnZXRfYXNzZXRzX3RleHRfbGFiZWxzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzNS01MzYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX3RleHRfbGFiZWxzKHNlbGYsIGFzc2V0czogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdKSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTM3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMSAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18xIC8vIDAKCmdldF9hc3NldHNfdGV4dF9sYWJlbHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzNwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBnZXRfYXNzZXRzX3RleHRfbGFiZWxzX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NjgtNzAKICAgIC8vICMgaWQgaWR4IG9mIGFuIGVuY29kZWQgdWludDY0W106IHBhY2tlZCB1aW50NjRzIGFmdGVyIHRoZSB1aW50MTYgbGVuZ3RoIHByZWZpeC4KICAgIC8vICMgbG9vcHMgcnVuIHRvIHRoZSBsZW5ndGggcHJlZml4LCBzbyBhIHBheWxvYWQgc2hvcnRlciB0aGFuIGl0IGZhaWxzIHRoZSBleHRyYWN0CiAgICAvLyByZXR1cm4gb3AuZXh0cmFjdF91aW50NjQoYXNzZXRzLCAyICsgaWR4ICogOCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjUzOAogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF90ZXh0X2xhYmVscyhhc3NldF9pZF9hdChhc3NldHMuYnl0ZXMsIGkpKSkKICAgIGNhbGxzdWIgX2dldF9hc3NldF90ZXh0X2xhYmVscwogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTM3CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAxCiAgICBiIGdldF9hc3NldHNfdGV4dF9sYWJlbHNfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX3RleHRfbGFiZWxzX2FmdGVyX2ZvckA0OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFzc2V0X2xhYmVsaW5nLmNvbnRyYWN0LkFzc2V0TGFiZWxpbmcuX2dldF9hc3NldF9zbWFsbChhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKX2dldF9hc3NldF9zbWFsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NDItNTQzCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfc21hbGwoc2VsZiwgYXNzZXRfaWQ6IFVJbnQ2NCkgLT4gQXNzZXRTbWFsbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBfdiwgZXhpc3RzID0gb3AuQXNzZXRQYXJhbXNHZXQuYXNzZXRfY3JlYXRvcihhc3NldF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENyZWF0b3IKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU0NAogICAgLy8gaWYgYXNzZXRfaXNfZGVsZXRlZChhc3NldF9pZCk6CiAgICBibnogX2dldF9hc3NldF9zbWFsbF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NDUKICAgIC8vIHJldHVybiBBc3NldFNtYWxsLmZyb21fYnl0ZXMoYiIiKQogICAgYnl0ZWNfMSAvLyAweAogICAgcmV0c3ViCgpfZ2V0X2Fzc2V0X3NtYWxsX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NDgKICAgIC8vIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTQ5CiAgICAvLyB1bml0X25hbWU9YjJzdHIoYXNzZXQudW5pdF9uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldFVuaXROYW1lCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTUwCiAgICAvLyBkZWNpbWFscz1hcmM0LlVJbnQ4KGFzc2V0LmRlY2ltYWxzKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldERlY2ltYWxzCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18zIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTUxCiAgICAvLyB0b3RhbD1hcmM0LlVJbnQ2NChhc3NldC50b3RhbCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRUb3RhbAogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU1MgogICAgLy8gaGFzX2ZyZWV6ZT1hcmM0LkJvb2woYXNzZXQuZnJlZXplICE9IEdsb2JhbC56ZXJvX2FkZHJlc3MpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RnJlZXplCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgICE9CiAgICBieXRlYyAxMCAvLyAweDAwCiAgICBpbnRjXzEgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NTMKICAgIC8vIGhhc19jbGF3YmFjaz1hcmM0LkJvb2woYXNzZXQuY2xhd2JhY2sgIT0gR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDbGF3YmFjawogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYnl0ZWMgMTAgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTU0CiAgICAvLyBsYWJlbHM9c2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhhc3NldCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9sYWJlbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NDctNTU1CiAgICAvLyByZXR1cm4gQXNzZXRTbWFsbCgKICAgIC8vICAgICBuYW1lPWIyc3RyKGFzc2V0Lm5hbWUpLAogICAgLy8gICAgIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIHRvdGFsPWFyYzQuVUludDY0KGFzc2V0LnRvdGFsKSwKICAgIC8vICAgICBoYXNfZnJlZXplPWFyYzQuQm9vbChhc3NldC5mcmVlemUgIT0gR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgaGFzX2NsYXdiYWNrPWFyYzQuQm9vbChhc3NldC5jbGF3YmFjayAhPSBHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIC8vICAgICBsYWJlbHM9c2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhhc3NldCksCiAgICAvLyApCiAgICBkaWcgNgogICAgbGVuCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBwdXNoYnl0ZXMgMHgwMDEwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyA3CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgdW5jb3ZlciA2CiAgICBjb25jYXQKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBpbnRjXzEgLy8gMAogICAgZ2V0Yml0CiAgICBwdXNoaW50IDEwNSAvLyAxMDUKICAgIHN3YXAKICAgIHNldGJpdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldF9zbWFsbChhc3NldDogdWludDY0KSAtPiBieXRlczoKZ2V0X2Fzc2V0X3NtYWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU1Ny01NTgKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRfc21hbGwoc2VsZiwgYXNzZXQ6IFVJbnQ2NCkgLT4gQXNzZXRTbWFsbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU1OQogICAgLy8gcmV0dXJuIHNlbGYuX2dldF9hc3NldF9zbWFsbChhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3NtYWxsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX3NtYWxsKGFzc2V0czogYnl0ZXMpIC0+IHZvaWQ6CmdldF9hc3NldHNfc21hbGw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTYxLTU2MgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hc3NldHNfc21hbGwoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NjMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c19zbWFsbF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTYzCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoYXNzZXRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGdldF9hc3NldHNfc21hbGxfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo2OC03MAogICAgLy8gIyBpZCBpZHggb2YgYW4gZW5jb2RlZCB1aW50NjRbXTogcGFja2VkIHVpbnQ2NHMgYWZ0ZXIgdGhlIHVpbnQxNiBsZW5ndGggcHJlZml4LgogICAgLy8gIyBsb29wcyBydW4gdG8gdGhlIGxlbmd0aCBwcmVmaXgsIHNvIGEgcGF5bG9hZCBzaG9ydGVyIHRoYW4gaXQgZmFpbHMgdGhlIGV4dHJhY3QKICAgIC8vIHJldHVybiBvcC5leHRyYWN0X3VpbnQ2NChhc3NldHMsIDIgKyBpZHggKiA4KQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgaW50Y18zIC8vIDgKICAgICoKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTY0CiAgICAvLyBsb2coc2VsZi5fZ2V0X2Fzc2V0X3NtYWxsKGFzc2V0X2lkX2F0KGFzc2V0cy5ieXRlcywgaSkpKQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X3NtYWxsCiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NjMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGludGNfMCAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZ2V0X2Fzc2V0c19zbWFsbF9mb3JfaGVhZGVyQDEKCmdldF9hc3NldHNfc21hbGxfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5fZ2V0X2Fzc2V0X2Z1bGwoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9nZXRfYXNzZXRfZnVsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NjgtNTY5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9nZXRfYXNzZXRfZnVsbChzZWxmLCBhc3NldF9pZDogVUludDY0KSAtPiBBc3NldEZ1bGw6CiAgICBwcm90byAxIDEKICAgIGludGNfMSAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6OTgKICAgIC8vIF92LCBleGlzdHMgPSBvcC5Bc3NldFBhcmFtc0dldC5hc3NldF9jcmVhdG9yKGFzc2V0X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0Q3JlYXRvcgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcwCiAgICAvLyBpZiBhc3NldF9pc19kZWxldGVkKGFzc2V0X2lkKToKICAgIGJueiBfZ2V0X2Fzc2V0X2Z1bGxfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTcxCiAgICAvLyByZXR1cm4gQXNzZXRGdWxsLmZyb21fYnl0ZXMoYiIiKQogICAgYnl0ZWNfMSAvLyAweAogICAgc3dhcAogICAgcmV0c3ViCgpfZ2V0X2Fzc2V0X2Z1bGxfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3My01NzQKICAgIC8vICMgcmVhZCByZXNlcnZlIG9uY2UsIHJldXNlZCBmb3IgdGhlIGJhbGFuY2UgbG9va3VwIGFuZCB0aGUgc3RydWN0IGZpZWxkCiAgICAvLyByZXNlcnZlX2FjY3QgPSBhc3NldC5yZXNlcnZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRSZXNlcnZlCiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMAogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3NwogICAgLy8gaWYgcmVzZXJ2ZV9hY2N0LmlzX29wdGVkX2luKGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU3Ni01NzgKICAgIC8vIGFzc2V0LmJhbGFuY2UocmVzZXJ2ZV9hY2N0KQogICAgLy8gaWYgcmVzZXJ2ZV9hY2N0LmlzX29wdGVkX2luKGFzc2V0KQogICAgLy8gZWxzZSBVSW50NjQoMCkKICAgIGJ6IF9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X2ZhbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1NzYKICAgIC8vIGFzc2V0LmJhbGFuY2UocmVzZXJ2ZV9hY2N0KQogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CgpfZ2V0X2Fzc2V0X2Z1bGxfdGVybmFyeV9tZXJnZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU4MQogICAgLy8gbmFtZT1iMnN0cihhc3NldC5uYW1lKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1ODIKICAgIC8vIHVuaXRfbmFtZT1iMnN0cihhc3NldC51bml0X25hbWUpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VW5pdE5hbWUKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGNhbGxzdWIgYjJzdHIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1ODMKICAgIC8vIHVybD1iMnN0cihhc3NldC51cmwpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0VVJMCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBjYWxsc3ViIGIyc3RyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTg0CiAgICAvLyB0b3RhbD1hcmM0LlVJbnQ2NChhc3NldC50b3RhbCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRUb3RhbAogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU4NQogICAgLy8gZGVjaW1hbHM9YXJjNC5VSW50OChhc3NldC5kZWNpbWFscyksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXREZWNpbWFscwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaXRvYgogICAgZHVwCiAgICBiaXRsZW4KICAgIGludGNfMyAvLyA4CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU4NgogICAgLy8gY3JlYXRvcj1hcmM0LkFkZHJlc3MoYXNzZXQuY3JlYXRvciksCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXRDcmVhdG9yCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTg3CiAgICAvLyBtYW5hZ2VyPWFyYzQuQWRkcmVzcyhhc3NldC5tYW5hZ2VyKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldE1hbmFnZXIKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1ODgKICAgIC8vIGZyZWV6ZT1hcmM0LkFkZHJlc3MoYXNzZXQuZnJlZXplKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldEZyZWV6ZQogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU4OQogICAgLy8gY2xhd2JhY2s9YXJjNC5BZGRyZXNzKGFzc2V0LmNsYXdiYWNrKSwKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfcGFyYW1zX2dldCBBc3NldENsYXdiYWNrCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTkxCiAgICAvLyBkZWZhdWx0X2Zyb3plbj1hcmM0LkJvb2woYXNzZXQuZGVmYXVsdF9mcm96ZW4pLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVmYXVsdEZyb3plbgogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgYnl0ZWMgMTAgLy8gMHgwMAogICAgaW50Y18xIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTkzCiAgICAvLyBtZXRhZGF0YV9oYXNoPWFyYzQuRHluYW1pY0J5dGVzKGFzc2V0Lm1ldGFkYXRhX2hhc2gpLAogICAgZnJhbWVfZGlnIC0xCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0TWV0YWRhdGFIYXNoCiAgICBhc3NlcnQgLy8gYXNzZXQgZXhpc3RzCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjU5MgogICAgLy8gcmVzZXJ2ZV9iYWxhbmNlPWFyYzQuVUludDY0KHJlc2VydmVfYmFsYW5jZSksCiAgICB1bmNvdmVyIDExCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTk0CiAgICAvLyBsYWJlbHM9c2VsZi5fZ2V0X2Fzc2V0X2xhYmVscyhhc3NldCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9sYWJlbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1ODAtNTk1CiAgICAvLyByZXR1cm4gQXNzZXRGdWxsKAogICAgLy8gICAgIG5hbWU9YjJzdHIoYXNzZXQubmFtZSksCiAgICAvLyAgICAgdW5pdF9uYW1lPWIyc3RyKGFzc2V0LnVuaXRfbmFtZSksCiAgICAvLyAgICAgdXJsPWIyc3RyKGFzc2V0LnVybCksCiAgICAvLyAgICAgdG90YWw9YXJjNC5VSW50NjQoYXNzZXQudG90YWwpLAogICAgLy8gICAgIGRlY2ltYWxzPWFyYzQuVUludDgoYXNzZXQuZGVjaW1hbHMpLAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKGFzc2V0LmNyZWF0b3IpLAogICAgLy8gICAgIG1hbmFnZXI9YXJjNC5BZGRyZXNzKGFzc2V0Lm1hbmFnZXIpLAogICAgLy8gICAgIGZyZWV6ZT1hcmM0LkFkZHJlc3MoYXNzZXQuZnJlZXplKSwKICAgIC8vICAgICBjbGF3YmFjaz1hcmM0LkFkZHJlc3MoYXNzZXQuY2xhd2JhY2spLAogICAgLy8gICAgIHJlc2VydmU9YXJjNC5BZGRyZXNzKHJlc2VydmVfYWNjdCksCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49YXJjNC5Cb29sKGFzc2V0LmRlZmF1bHRfZnJvemVuKSwKICAgIC8vICAgICByZXNlcnZlX2JhbGFuY2U9YXJjNC5VSW50NjQocmVzZXJ2ZV9iYWxhbmNlKSwKICAgIC8vICAgICBtZXRhZGF0YV9oYXNoPWFyYzQuRHluYW1pY0J5dGVzKGFzc2V0Lm1ldGFkYXRhX2hhc2gpLAogICAgLy8gICAgIGxhYmVscz1zZWxmLl9nZXRfYXNzZXRfbGFiZWxzKGFzc2V0KSwKICAgIC8vICkKICAgIGRpZyAxMgogICAgbGVuCiAgICBwdXNoaW50IDE4OCAvLyAxODgKICAgICsKICAgIGR1cAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHB1c2hieXRlcyAweDAwYmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZGlnIDEzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGRpZyAxMgogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKICAgIHVuY292ZXIgMTEKICAgIGNvbmNhdAogICAgdW5jb3ZlciAxMAogICAgY29uY2F0CiAgICB1bmNvdmVyIDkKICAgIGNvbmNhdAogICAgdW5jb3ZlciA4CiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIDAKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIGRpZyAxCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICBkaWcgNAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgY29uY2F0CiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgdW5jb3ZlciA0CiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICByZXRzdWIKCl9nZXRfYXNzZXRfZnVsbF90ZXJuYXJ5X2ZhbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTc4CiAgICAvLyBlbHNlIFVJbnQ2NCgwKQogICAgaW50Y18xIC8vIDAKICAgIGIgX2dldF9hc3NldF9mdWxsX3Rlcm5hcnlfbWVyZ2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hc3NldF9sYWJlbGluZy5jb250cmFjdC5Bc3NldExhYmVsaW5nLmdldF9hc3NldF9mdWxsKGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfYXNzZXRfZnVsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo1OTctNTk4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2Fzc2V0X2Z1bGwoc2VsZiwgYXNzZXQ6IFVJbnQ2NCkgLT4gQXNzZXRGdWxsOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NTk5CiAgICAvLyByZXR1cm4gc2VsZi5fZ2V0X2Fzc2V0X2Z1bGwoYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2dldF9hc3NldF9mdWxsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYXNzZXRfbGFiZWxpbmcuY29udHJhY3QuQXNzZXRMYWJlbGluZy5nZXRfYXNzZXRzX2Z1bGwoYXNzZXRzOiBieXRlcykgLT4gdm9pZDoKZ2V0X2Fzc2V0c19mdWxsOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjYwMS02MDIKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfYXNzZXRzX2Z1bGwoc2VsZiwgYXNzZXRzOiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0pIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo2MDMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18xIC8vIDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnRjXzEgLy8gMAoKZ2V0X2Fzc2V0c19mdWxsX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hc3NldF9sYWJlbGluZy9jb250cmFjdC5weTo2MDMKICAgIC8vIGZvciBpIGluIHVyYW5nZShhc3NldHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgMAogICAgPAogICAgYnogZ2V0X2Fzc2V0c19mdWxsX2FmdGVyX2ZvckA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYXNzZXRfbGFiZWxpbmcvY29udHJhY3QucHk6NjgtNzAKICAgIC8vICMgaWQgaWR4IG9mIGFuIGVuY29kZWQgdWludDY0W106IHBhY2tlZCB1aW50NjRzIGFmdGVyIHRoZSB1aW50MTYgbGVuZ3RoIHByZWZpeC4KICAgIC8vICMgbG9vcHMgcnVuIHRvIHRoZSBsZW5ndGggcHJlZml4LCBzbyBhIHBheWxvYWQgc2hvcnRlciB0aGFuIGl0IGZhaWxzIHRoZSBleHRyYWN0CiAgICAvLyByZXR1cm4gb3AuZXh0cmFjdF91aW50NjQoYXNzZXRzLCAyICsgaWR4ICogOCkKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGludGNfMyAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjYwNAogICAgLy8gbG9nKHNlbGYuX2dldF9hc3NldF9mdWxsKGFzc2V0X2lkX2F0KGFzc2V0cy5ieXRlcywgaSkpKQogICAgY2FsbHN1YiBfZ2V0X2Fzc2V0X2Z1bGwKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fzc2V0X2xhYmVsaW5nL2NvbnRyYWN0LnB5OjYwMwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFzc2V0cy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgYiBnZXRfYXNzZXRzX2Z1bGxfZm9yX2hlYWRlckAxCgpnZXRfYXNzZXRzX2Z1bGxfYWZ0ZXJfZm9yQDQ6CiAgICByZXRzdWIK","clear":"I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"},"bareActions":{"create":["NoOp"],"call":["DeleteApplication","UpdateApplication"]}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
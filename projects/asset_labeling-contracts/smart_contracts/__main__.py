@@ -98,6 +98,8 @@ def build(output_dir: Path, contract_path: Path) -> Path:
         "python",
         str(contract_path.resolve()),
         f"--out-dir={output_dir}",
+        # O2 adds constant block and inlining passes on top of the default O1
+        "--optimization-level=2",
         "--no-output-arc32",
         "--output-arc56",
         "--output-source-map",
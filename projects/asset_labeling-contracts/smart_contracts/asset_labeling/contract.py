@@ -13,6 +13,7 @@ from algopy import (
     op,
     subroutine,
     uenumerate,
+    urange,
 )
 from algopy.arc4 import abimethod
 
@@ -27,31 +28,69 @@ from .types import (
     AssetTinyLabels,
     LabelDescriptor,
     LabelList,
-    S,
 )
 
-# constants used to return from index-finding functions. zero is a truthy return, so:
-NOT_FOUND_KEY = (
-    2**32
-)  # magic constant for "list not found" (e.g. box key missing entirely)
-NOT_FOUND_VALUE = 2**32 - 1  # magic constant for "value not found in list"
+# error messages logged by ensure before failing
+ERR_UNAUTH = b"ERR:UNAUTH"
+ERR_EXISTS = b"ERR:EXISTS"
+ERR_NOEXIST = b"ERR:NOEXIST"
+ERR_LENGTH = b"ERR:LENGTH"
+ERR_NOEMPTY = b"ERR:NOEMPTY"
 
+# encoded empty LabelList: uint16 length 0, no elements
+EMPTY_LABEL_LIST = b"\x00\x00"
 
-@subroutine
-def ensure(cond: bool, msg: String) -> None:  # noqa: FBT001
+# byte offsets of the uint64 LabelDescriptor counters. name and url are dynamic, so
+# the head only holds their 2-byte offsets and the counters sit at fixed positions
+NUM_ASSETS_OFFSET = 4
+NUM_OPERATORS_OFFSET = 12
+
+
+# inlined: called several times per method, a callsub/retsub per check adds up
+@subroutine(inline=True)
+def ensure(cond: bool, msg: Bytes) -> None:  # noqa: FBT001
     if not cond:
         log(msg)
         op.err()
 
 
+@subroutine(inline=True)
+def label_offset(count: UInt64, idx: UInt64) -> UInt64:
+    # byte offset of label idx in an encoded LabelList holding count labels.
+    # every stored label is 2 bytes long (enforced by add_label), so after the uint16
+    # count and the 2-byte head offsets the tail is a dense run of 4-byte elements:
+    # uint16 length prefix + 2 label bytes
+    return count * 2 + 4 + idx * 4
+
+
+@subroutine(inline=True)
+def asset_id_at(assets: Bytes, idx: UInt64) -> UInt64:
+    # id idx of an encoded uint64[]: packed uint64s after the uint16 length prefix.
+    # loops run to the length prefix, so a payload shorter than it fails the extract
+    return op.extract_uint64(assets, 2 + idx * 8)
+
+
 @subroutine
-def empty_list() -> LabelList:
-    return arc4.DynamicArray[arc4.String]()
+def find_label(labels: Bytes, label: Bytes) -> tuple[bool, UInt64]:
+    # compare label bytes at a fixed stride instead of decoding each arc4.String
+    count = op.extract_uint16(labels, 0)
+    for idx in urange(count):
+        if op.extract(labels, label_offset(count, idx), 2) == label:
+            return True, idx
+    return False, UInt64(0)
+
+
+@subroutine
+def contains_label(labels: Bytes, label: Bytes) -> bool:
+    found, _idx = find_label(labels, label)
+    return found
 
 
 @subroutine
 def b2str(b: Bytes) -> arc4.String:
-    return arc4.String(String.from_bytes(b))
+    # asset name, unit name and url are at most 32, 8 and 96 bytes, so the length
+    # always fits the uint16 prefix. prefix the raw bytes directly, no String round-trip
+    return arc4.String.from_bytes(op.extract(op.itob(b.length), 6, 2) + b)
 
 
 @subroutine
@@ -60,9 +99,26 @@ def asset_is_deleted(asset_id: UInt64) -> bool:
     return not exists
 
 
+# read/write a single LabelDescriptor counter in place, without decoding the struct
+# labels has no key prefix: the box key is the label id
+@subroutine
+def get_label_counter(label: Bytes, offset: UInt64) -> UInt64:
+    # the read doubles as the label existence check, so callers probe the box once
+    descriptor_bytes, exists = op.Box.get(label)
+    ensure(exists, Bytes(ERR_NOEXIST))
+    return op.extract_uint64(descriptor_bytes, offset)
+
+
+@subroutine
+def set_label_counter(label: Bytes, offset: UInt64, value: UInt64) -> None:
+    op.Box.replace(label, offset, op.itob(value))
+
+
 class AssetLabeling(ARC4Contract):
     def __init__(self) -> None:
         self.admin = Txn.sender
+        # no key prefixes: reads go through op.Box.get on the raw key, because maybe()
+        # can't unpack mutable ARC-4 values, and the label counters are patched in place
         self.labels = BoxMap(String, LabelDescriptor, key_prefix=b"")
         # TODO does this need to be an asset? Uint64 could be better
         self.assets = BoxMap(Asset, LabelList, key_prefix=b"")
@@ -78,7 +134,7 @@ class AssetLabeling(ARC4Contract):
 
     @subroutine
     def admin_only(self) -> None:
-        ensure(Txn.sender == self.admin, S("ERR:UNAUTH"))
+        ensure(Txn.sender == self.admin, Bytes(ERR_UNAUTH))
 
     @abimethod()
     def change_admin(self, new_admin: Account) -> None:
@@ -88,8 +144,9 @@ class AssetLabeling(ARC4Contract):
     @abimethod()
     def add_label(self, id: String, name: String, url: String) -> None:  # noqa A002
         self.admin_only()
-        ensure(id not in self.labels, S("ERR:EXISTS"))
-        ensure(id.bytes.length == 2, S("ERR:LENGTH"))
+        # length first: no stored label can have another length, so skip the box probe
+        ensure(id.bytes.length == 2, Bytes(ERR_LENGTH))
+        ensure(id not in self.labels, Bytes(ERR_EXISTS))
         self.labels[id] = LabelDescriptor(
             arc4.String(name),
             arc4.String(url),
@@ -99,14 +156,15 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def has_label(self, id: String) -> UInt64:  # noqa A002
-        ensure(id.bytes.length == 2, S("ERR:LENGTH"))
+        ensure(id.bytes.length == 2, Bytes(ERR_LENGTH))
         return UInt64(id in self.labels)
 
     @abimethod()
     def change_label(self, id: String, name: String, url: String) -> None:  # noqa A002
         self.admin_only()
-        ensure(id in self.labels, S("ERR:NOEXIST"))
-        label_descriptor = self.labels[id].copy()
+        descriptor_bytes, exists = op.Box.get(id.bytes)
+        ensure(exists, Bytes(ERR_NOEXIST))
+        label_descriptor = LabelDescriptor.from_bytes(descriptor_bytes)
         label_descriptor.name = arc4.String(name)
         label_descriptor.url = arc4.String(url)
         self.labels[id] = label_descriptor.copy()
@@ -114,20 +172,25 @@ class AssetLabeling(ARC4Contract):
     @abimethod()
     def remove_label(self, id: String) -> None:  # noqa A002
         self.admin_only()
-        ensure(id in self.labels, S("ERR:NOEXIST"))
-        ensure(self.labels[id].num_operators == 0, S("ERR:NOEMPTY"))
-        ensure(self.labels[id].num_assets == 0, S("ERR:NOEMPTY"))
+        descriptor_bytes, exists = op.Box.get(id.bytes)
+        ensure(exists, Bytes(ERR_NOEXIST))
+        label_descriptor = LabelDescriptor.from_bytes(descriptor_bytes)
+        ensure(label_descriptor.num_operators == 0, Bytes(ERR_NOEMPTY))
+        ensure(label_descriptor.num_assets == 0, Bytes(ERR_NOEMPTY))
         del self.labels[id]
 
     @abimethod(readonly=True)
     def get_label(self, id: String) -> LabelDescriptor:  # noqa A002
-        ensure(id in self.labels, S("ERR:NOEXIST"))
-        return self.labels[id]
+        descriptor_bytes, exists = op.Box.get(id.bytes)
+        ensure(exists, Bytes(ERR_NOEXIST))
+        return LabelDescriptor.from_bytes(descriptor_bytes)
 
     @abimethod(readonly=True)
     def log_labels(self, ids: arc4.DynamicArray[arc4.String]) -> None:
         for _idx, label_id in uenumerate(ids):
-            log(self.labels[label_id.native])
+            descriptor_bytes, exists = op.Box.get(label_id.native.bytes)
+            ensure(exists, Bytes(ERR_NOEXIST))
+            log(descriptor_bytes)
 
     # TODO change label names?
 
@@ -135,232 +198,211 @@ class AssetLabeling(ARC4Contract):
 
     @subroutine
     def admin_or_operator_only(self, label: String) -> None:
-        if Txn.sender == self.admin:
+        sender = Txn.sender
+        if sender == self.admin:
             return
-        self.operator_only(label)
+        self.operator_only(sender, label)
 
     @subroutine
-    def operator_only(self, label: String) -> None:
-        operator_index = self.get_operator_label_index(Txn.sender, label)
-        ensure(
-            operator_index != UInt64(NOT_FOUND_KEY)
-            and operator_index != UInt64(NOT_FOUND_VALUE),
-            S("ERR:UNAUTH"),
-        )
+    def operator_only(self, operator: Account, label: String) -> None:
+        ensure(self.operator_has_label(operator, label), Bytes(ERR_UNAUTH))
 
     @subroutine
-    def get_operator_label_index(self, operator: Account, label: String) -> UInt64:
-        if operator not in self.operators:
-            return UInt64(NOT_FOUND_KEY)
-        for idx, stored_label in uenumerate(self.operators[operator]):
-            if stored_label == label:
-                return idx
-        return UInt64(NOT_FOUND_VALUE)
+    def operator_has_label(self, operator: Account, label: String) -> bool:
+        # read the operator box piecewise (same layout as find_label) so an early hit
+        # only touches the bytes up to it. operators has no key prefix: key = address
+        operator_key = operator.bytes
+        label_key = label.bytes
+        _length, exists = op.Box.length(operator_key)
+        if not exists:
+            return False
+        count = op.btoi(op.Box.extract(operator_key, 0, 2))
+        for idx in urange(count):
+            if op.Box.extract(operator_key, label_offset(count, idx), 2) == label_key:
+                return True
+        return False
 
     @abimethod()
     def add_operator_to_label(self, operator: Account, label: String) -> None:
         self.admin_or_operator_only(label)
-        ensure(label in self.labels, S("ERR:NOEXIST"))
+        label_key = label.bytes
+        # finish with the label box before touching the operator box
+        # a duplicate below fails the txn, reverting this write too
+        # increment label operators, failing if the label does not exist
+        num_operators = get_label_counter(label_key, UInt64(NUM_OPERATORS_OFFSET))
+        set_label_counter(label_key, UInt64(NUM_OPERATORS_OFFSET), num_operators + 1)
+
         # check if operator exists already
-        if operator in self.operators:
+        existing_bytes, exists = op.Box.get(operator.bytes)
+        if exists:
             # existing operator, check for duplicate
-            ensure(
-                self.get_operator_label_index(operator, label)
-                == UInt64(NOT_FOUND_VALUE),
-                S("ERR:EXISTS"),
-            )
-
-            # add label to operator
-            existing = self.operators[operator].copy()
+            ensure(not contains_label(existing_bytes, label_key), Bytes(ERR_EXISTS))
+
+            # add label to operator, reusing the list read above
+            existing = LabelList.from_bytes(existing_bytes)
             existing.append(arc4.String(label))
             self.operators[operator] = existing.copy()
         else:
             # new operator, create new box
             self.operators[operator] = arc4.DynamicArray(arc4.String(label))
 
-        # increment label operators
-        label_descriptor = self.labels[label].copy()
-        label_descriptor.num_operators = arc4.UInt64(
-            label_descriptor.num_operators.native + UInt64(1)
-        )
-        self.labels[label] = label_descriptor.copy()
-
     @abimethod(readonly=True)
     def has_operator_label(self, operator: Account, label: String) -> UInt64:
-        ensure(label.bytes.length == 2, S("ERR:LENGTH"))
-        idx = self.get_operator_label_index(operator, label)
-        return UInt64(idx != NOT_FOUND_KEY and idx != NOT_FOUND_VALUE)
+        ensure(label.bytes.length == 2, Bytes(ERR_LENGTH))
+        return UInt64(self.operator_has_label(operator, label))
 
     @abimethod()
     def remove_operator_from_label(self, operator: Account, label: String) -> None:
         self.admin_or_operator_only(label)
+        label_key = label.bytes
 
-        ensure(label in self.labels, S("ERR:NOEXIST"))
-        ensure(operator in self.operators, S("ERR:NOEXIST"))
+        # fails if the label does not exist
+        num_operators = get_label_counter(label_key, UInt64(NUM_OPERATORS_OFFSET))
+        labels_bytes, exists = op.Box.get(operator.bytes)
+        ensure(exists, Bytes(ERR_NOEXIST))
+        labels = LabelList.from_bytes(labels_bytes)
 
-        # ensure label exists in operator
-        label_idx = self.get_operator_label_index(operator, label)
-        ensure(
-            label_idx != UInt64(NOT_FOUND_VALUE)
-            and label_idx
-            != UInt64(NOT_FOUND_KEY),  # key check redundant, checked above
-            S("ERR:NOEXIST"),
-        )
+        if labels.length == 1:
+            # single label: compare in place and drop the box, no scan
+            ensure(labels[0] == label, Bytes(ERR_NOEXIST))
+            del self.operators[operator]
+        else:
+            # ensure label exists in operator
+            found, label_idx = find_label(labels_bytes, label_key)
+            ensure(found, Bytes(ERR_NOEXIST))
+            # labels are unordered: move the last label into the removed slot, truncate
+            last_idx = labels.length - 1
+            if label_idx != last_idx:
+                labels[label_idx] = labels[last_idx]
+            _last = labels.pop()
+            self.operators[operator] = labels.copy()
 
         # ensure only empty labels can be left operator-less
-        label_descriptor = self.labels[label].copy()
         ensure(
-            label_descriptor.num_operators > 1 or label_descriptor.num_assets == 0,
-            S("ERR:NOEMPTY"),
+            num_operators > 1
+            or get_label_counter(label_key, UInt64(NUM_ASSETS_OFFSET)) == 0,
+            Bytes(ERR_NOEMPTY),
         )
         # decr operator count
-        label_descriptor.num_operators = arc4.UInt64(
-            label_descriptor.num_operators.native - UInt64(1)
-        )
-        self.labels[label] = label_descriptor.copy()
-
-        if self.operators[operator].length == 1:
-            del self.operators[operator]
-        else:
-            next_list = arc4.DynamicArray[arc4.String]()
-            # walk, push everything except index
-            # this implementation walks twice (once in get_operator_label_index)
-            # could be more efficient
-            for idx, stored_label in uenumerate(self.operators[operator]):
-                if label_idx != idx:
-                    next_list.append(stored_label)
-
-            self.operators[operator] = next_list.copy()
+        set_label_counter(label_key, UInt64(NUM_OPERATORS_OFFSET), num_operators - 1)
 
     @abimethod(readonly=True)
     def get_operator_labels(self, operator: Account) -> LabelList:
-        if operator in self.operators:
-            return self.operators[operator]
+        labels_bytes, exists = op.Box.get(operator.bytes)
+        if exists:
+            return LabelList.from_bytes(labels_bytes)
         # return empty list
-        return empty_list()
-
-    @subroutine
-    def get_asset_label_index(self, asset: Asset, label: String) -> UInt64:
-        ensure(label.bytes.length == 2, S("ERR:LENGTH"))
-        if asset not in self.assets:
-            return UInt64(NOT_FOUND_KEY)
-        for idx, stored_label in uenumerate(self.assets[asset]):
-            if stored_label == label:
-                return idx
-        return UInt64(NOT_FOUND_VALUE)
+        return LabelList.from_bytes(EMPTY_LABEL_LIST)
 
     @subroutine
     def _add_label_to_asset(self, label: String, asset: Asset) -> None:
-        ensure(not asset_is_deleted(asset.id), S("ERR:NOEXIST"))
-        ensure(label in self.labels, S("ERR:NOEXIST"))
-        if asset in self.assets:
-            # existing operator, check for duplicate
-            ensure(
-                self.get_asset_label_index(asset, label) == UInt64(NOT_FOUND_VALUE),
-                S("ERR:EXISTS"),
-            )
-            # add label to asset
-            existing = self.assets[asset].copy()
+        # callers check that label exists and update its num_assets
+        ensure(not asset_is_deleted(asset.id), Bytes(ERR_NOEXIST))
+        existing_bytes, exists = op.Box.get(op.itob(asset.id))
+        if exists:
+            # existing asset, check for duplicate
+            ensure(not contains_label(existing_bytes, label.bytes), Bytes(ERR_EXISTS))
+            # add label to asset, reusing the list read above
+            existing = LabelList.from_bytes(existing_bytes)
             existing.append(arc4.String(label))
             self.assets[asset] = existing.copy()
         else:
             # new asset, create new box
             self.assets[asset] = arc4.DynamicArray(arc4.String(label))
 
-        # incr asset count
-        label_descriptor = self.labels[label].copy()
-        label_descriptor.num_assets = arc4.UInt64(
-            label_descriptor.num_assets.native + UInt64(1)
-        )
-        self.labels[label] = label_descriptor.copy()
-
     @abimethod()
     def add_label_to_asset(self, label: String, asset: Asset) -> None:
-        self.operator_only(label)
+        self.operator_only(Txn.sender, label)
+        # fails if the label does not exist
+        num_assets = get_label_counter(label.bytes, UInt64(NUM_ASSETS_OFFSET))
         self._add_label_to_asset(label, asset)
 
+        # incr asset count
+        set_label_counter(label.bytes, UInt64(NUM_ASSETS_OFFSET), num_assets + 1)
+
     @abimethod()
     def add_label_to_assets(
         self, label: String, assets: arc4.DynamicArray[arc4.UInt64]
     ) -> None:
-        self.operator_only(label)
-        for _i, asset in uenumerate(assets):
-            self._add_label_to_asset(label, Asset(asset.native))
+        self.operator_only(Txn.sender, label)
+        # fails if the label does not exist
+        num_assets = get_label_counter(label.bytes, UInt64(NUM_ASSETS_OFFSET))
+        # read the ids directly instead of decoding an arc4.UInt64 per element
+        for i in urange(assets.length):
+            self._add_label_to_asset(label, Asset(asset_id_at(assets.bytes, i)))
+
+        # incr asset count once for the whole batch
+        # every _add_label_to_asset either added the label or failed the txn
+        set_label_counter(
+            label.bytes, UInt64(NUM_ASSETS_OFFSET), num_assets + assets.length
+        )
 
     @abimethod()
     def remove_label_from_asset(self, label: String, asset: Asset) -> None:
-        ensure(label in self.labels, S("ERR:NOEXIST"))
-
-        self.operator_only(label)
+        # fails if the label does not exist
+        num_assets = get_label_counter(label.bytes, UInt64(NUM_ASSETS_OFFSET))
 
-        found = False
-        if self.assets[asset].length == 1:
-            if self.assets[asset][0] == label:
-                del self.assets[asset]
-                found = True
-            else:
-                found = False
-        else:
-            next_list = arc4.DynamicArray[arc4.String]()
-            # walk, push everything to new box except label
-            # save $found to throw if not found
-            for _idx, stored_label in uenumerate(self.assets[asset]):
-                if stored_label != label:
-                    next_list.append(stored_label)
-                else:
-                    found = True
+        self.operator_only(Txn.sender, label)
 
-            self.assets[asset] = next_list.copy()
+        labels_bytes, exists = op.Box.get(op.itob(asset.id))
+        ensure(exists, Bytes(ERR_NOEXIST))
+        labels = LabelList.from_bytes(labels_bytes)
 
-        ensure(found, S("ERR:NOEXIST"))
+        if labels.length == 1:
+            # single label: compare in place and drop the box, no rebuild
+            ensure(labels[0] == label, Bytes(ERR_NOEXIST))
+            del self.assets[asset]
+        else:
+            found, label_idx = find_label(labels_bytes, label.bytes)
+            ensure(found, Bytes(ERR_NOEXIST))
+            # labels are unordered: move the last label into the removed slot, truncate
+            last_idx = labels.length - 1
+            if label_idx != last_idx:
+                labels[label_idx] = labels[last_idx]
+            _last = labels.pop()
+            self.assets[asset] = labels.copy()
 
         # decr asset count
-        label_descriptor = self.labels[label].copy()
-        label_descriptor.num_assets = arc4.UInt64(
-            label_descriptor.num_assets.native - UInt64(1)
-        )
-        self.labels[label] = label_descriptor.copy()
+        set_label_counter(label.bytes, UInt64(NUM_ASSETS_OFFSET), num_assets - 1)
 
     @abimethod(readonly=True)
     def has_asset_label(self, asset_id: UInt64, label: String) -> UInt64:
-        asset = Asset(asset_id)
-        idx = self.get_asset_label_index(asset, label)
-        if idx != NOT_FOUND_KEY and idx != NOT_FOUND_VALUE:
-            return UInt64(1)
-        return UInt64(0)
+        ensure(label.bytes.length == 2, Bytes(ERR_LENGTH))
+        labels_bytes, exists = op.Box.get(op.itob(asset_id))
+        return UInt64(exists and contains_label(labels_bytes, label.bytes))
+
+    @subroutine
+    def _get_asset_labels(self, asset: Asset) -> LabelList:
+        labels_bytes, exists = op.Box.get(op.itob(asset.id))
+        if exists:
+            return LabelList.from_bytes(labels_bytes)
+        # return empty
+        return LabelList.from_bytes(EMPTY_LABEL_LIST)
 
     @abimethod(readonly=True)
     def get_asset_labels(self, asset: Asset) -> LabelList:
-        if asset in self.assets:
-            return self.assets[asset]
-        # return empty
-        return empty_list()
+        return self._get_asset_labels(asset)
 
     @abimethod(readonly=True)
     def get_assets_labels(
         self, assets: arc4.DynamicArray[arc4.UInt64]
     ) -> arc4.DynamicArray[LabelList]:
         out = arc4.DynamicArray[LabelList]()
-        for _i, asset_id in uenumerate(assets):
-            asset = Asset(asset_id.native)
-            if asset in self.assets:
-                out.append(self.assets[asset].copy())
-            else:
-                out.append(empty_list())
+        for i in urange(assets.length):
+            out.append(self._get_asset_labels(Asset(asset_id_at(assets.bytes, i))))
         return out
 
     @abimethod(readonly=True)
     def log_assets_labels(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            asset = Asset(asset_id.native)
-            if asset in self.assets:
-                log(self.assets[asset])
-            else:
-                log(empty_list())
+        for i in urange(assets.length):
+            log(self._get_asset_labels(Asset(asset_id_at(assets.bytes, i))))
 
     #
     # Batch asset data fetch methods
     #
+    # get_assets_* read the packed uint64 ids with asset_id_at instead of decoding
+    # an arc4.UInt64 per element
+    #
 
     # Micro: Unit Name, Decimals (1 ref, max 128)
 
@@ -380,8 +422,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_micro(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_micro(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_micro(asset_id_at(assets.bytes, i)))
 
     # Micro+Label: Unit Name, Decimals, Labels (2 refs, max 64)
 
@@ -393,7 +435,7 @@ class AssetLabeling(ARC4Contract):
         return AssetMicroLabels(
             unit_name=b2str(asset.unit_name),
             decimals=arc4.UInt8(asset.decimals),
-            labels=self.assets[asset].copy() if asset in self.assets else empty_list(),
+            labels=self._get_asset_labels(asset),
         )
 
     @abimethod(readonly=True)
@@ -402,8 +444,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_micro_labels(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_micro_labels(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_micro_labels(asset_id_at(assets.bytes, i)))
 
     # Tiny: name+unit+decimals (1 ref, 128 max)
 
@@ -424,8 +466,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_tiny(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_tiny(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_tiny(asset_id_at(assets.bytes, i)))
 
     # Tiny+Label: Name, Unit Name, Decimals, Labels (2 refs, max 64)
 
@@ -438,7 +480,7 @@ class AssetLabeling(ARC4Contract):
             name=b2str(asset.name),
             unit_name=b2str(asset.unit_name),
             decimals=arc4.UInt8(asset.decimals),
-            labels=self.assets[asset].copy() if asset in self.assets else empty_list(),
+            labels=self._get_asset_labels(asset),
         )
 
     @abimethod(readonly=True)
@@ -447,8 +489,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_tiny_labels(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_tiny_labels(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_tiny_labels(asset_id_at(assets.bytes, i)))
 
     # Text: Searchable - Asset name, Unit Name, URL (1 ref, max 128)
 
@@ -469,8 +511,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_text(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_text(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_text(asset_id_at(assets.bytes, i)))
 
     # TextLabels: Searchable - Asset name, Unit Name, URL, Labels (2 refs, max 64)
 
@@ -483,7 +525,7 @@ class AssetLabeling(ARC4Contract):
             name=b2str(asset.name),
             unit_name=b2str(asset.unit_name),
             url=b2str(asset.url),
-            labels=self.assets[asset].copy() if asset in self.assets else empty_list(),
+            labels=self._get_asset_labels(asset),
         )
 
     @abimethod(readonly=True)
@@ -492,8 +534,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_text_labels(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_text_labels(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_text_labels(asset_id_at(assets.bytes, i)))
 
     # small (2 refs, max 64)
 
@@ -509,7 +551,7 @@ class AssetLabeling(ARC4Contract):
             total=arc4.UInt64(asset.total),
             has_freeze=arc4.Bool(asset.freeze != Global.zero_address),
             has_clawback=arc4.Bool(asset.clawback != Global.zero_address),
-            labels=self.assets[asset].copy() if asset in self.assets else empty_list(),
+            labels=self._get_asset_labels(asset),
         )
 
     @abimethod(readonly=True)
@@ -518,8 +560,8 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_small(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_small(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_small(asset_id_at(assets.bytes, i)))
 
     # full (3 refs, max 42)
 
@@ -528,7 +570,8 @@ class AssetLabeling(ARC4Contract):
         if asset_is_deleted(asset_id):
             return AssetFull.from_bytes(b"")
         asset = Asset(asset_id)
-        reserve_acct = Account(asset.reserve.bytes)
+        # read reserve once, reused for the balance lookup and the struct field
+        reserve_acct = asset.reserve
         reserve_balance = (
             asset.balance(reserve_acct)
             if reserve_acct.is_opted_in(asset)
@@ -544,11 +587,11 @@ class AssetLabeling(ARC4Contract):
             manager=arc4.Address(asset.manager),
             freeze=arc4.Address(asset.freeze),
             clawback=arc4.Address(asset.clawback),
-            reserve=arc4.Address(asset.reserve),
+            reserve=arc4.Address(reserve_acct),
             default_frozen=arc4.Bool(asset.default_frozen),
             reserve_balance=arc4.UInt64(reserve_balance),
             metadata_hash=arc4.DynamicBytes(asset.metadata_hash),
-            labels=self.assets[asset].copy() if asset in self.assets else empty_list(),
+            labels=self._get_asset_labels(asset),
         )
 
     @abimethod(readonly=True)
@@ -557,5 +600,5 @@ class AssetLabeling(ARC4Contract):
 
     @abimethod(readonly=True)
     def get_assets_full(self, assets: arc4.DynamicArray[arc4.UInt64]) -> None:
-        for _i, asset_id in uenumerate(assets):
-            log(self._get_asset_full(asset_id.native))
+        for i in urange(assets.length):
+            log(self._get_asset_full(asset_id_at(assets.bytes, i)))
@@ -1,10 +1,10 @@
-from algopy import String, arc4
-
-S = String
+from algopy import arc4
 
 LabelList = arc4.DynamicArray[arc4.String]
 
 
+# field order is load-bearing: contract.py reads and writes the counters in place at
+# NUM_ASSETS_OFFSET / NUM_OPERATORS_OFFSET, which assume exactly this layout
 class LabelDescriptor(arc4.Struct):
     name: arc4.String
     url: arc4.String
@@ -47,7 +47,7 @@ class AssetText(arc4.Struct):
     url: arc4.String
 
 
-# Searchable text view plusllabels
+# Searchable text view plus labels
 class AssetTextLabels(arc4.Struct):
     name: arc4.String
     unit_name: arc4.String
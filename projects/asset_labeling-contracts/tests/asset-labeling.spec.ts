@@ -17,6 +17,7 @@ import {
   removeOperatorFromLabel,
   removeLabelFromAsset,
   addLabelToAssets,
+  addLabelToAssetsRaw,
   hasAssetLabel,
   hasLabel,
   hasOperatorLabel,
@@ -423,6 +424,41 @@ describe('asset labeling contract', () => {
     expect(numOperators).toBe(0n)
   })
 
+  test('3x add/remove operator labels reorders by swap', async () => {
+    const { testAccount: adminAccount } = localnet.context
+    const { adminClient } = await deploy(adminAccount)
+
+    const id = 'wo'
+    const id2 = 'w2'
+    const id3 = 'w3'
+    const name = 'world'
+    const url = 'http://'
+
+    await addLabel(adminClient, adminAccount, id, name, url)
+    await addLabel(adminClient, adminAccount, id2, name, url)
+    await addLabel(adminClient, adminAccount, id3, name, url)
+
+    await addOperatorToLabel(adminClient, adminAccount, id)
+    await addOperatorToLabel(adminClient, adminAccount, id2)
+    await addOperatorToLabel(adminClient, adminAccount, id3)
+
+    // middle label: the last label moves into its slot
+    await removeOperatorFromLabel(adminClient, adminAccount, id2)
+    expect(await getOperatorLabels(adminClient, adminAccount)).toStrictEqual([id, id3])
+
+    // first label: the last label moves to the front
+    await addOperatorToLabel(adminClient, adminAccount, id2)
+    await removeOperatorFromLabel(adminClient, adminAccount, id)
+    expect(await getOperatorLabels(adminClient, adminAccount)).toStrictEqual([id2, id3])
+
+    const { numOperators } = await getLabelDescriptor(adminClient, id)
+    expect(numOperators).toBe(0n)
+    const { numOperators: numOperators2 } = await getLabelDescriptor(adminClient, id2)
+    expect(numOperators2).toBe(1n)
+    const { numOperators: numOperators3 } = await getLabelDescriptor(adminClient, id3)
+    expect(numOperators3).toBe(1n)
+  })
+
   test('remove operator label from unauth should fail', async () => {
     const { testAccount: adminAccount } = localnet.context
     const { adminClient } = await deploy(adminAccount)
@@ -501,6 +537,81 @@ describe('asset labeling contract', () => {
     }
   })
 
+  test('add label to assets uses the array length prefix', async () => {
+    const { testAccount: adminAccount } = localnet.context
+    const { adminClient } = await deploy(adminAccount)
+
+    const label = 'wo'
+    const labelName = 'world'
+    const labelUrl = 'http://'
+    const assetIds = [13n, 14n, 15n]
+
+    const operator = await localnet.context.generateAccount({ initialFunds: (0.2).algos() })
+    await addLabel(adminClient, adminAccount, label, labelName, labelUrl)
+    await addOperatorToLabel(adminClient, operator, label)
+
+    // length prefix 0 with 3 ids: nothing is labeled, nothing is counted
+    await addLabelToAssetsRaw(adminClient, operator.addr, label, 0, assetIds)
+
+    const labelDescriptor = await getLabelDescriptor(adminClient, label)
+    expect(labelDescriptor.numAssets).toBe(0n)
+    for (const assetId of assetIds) {
+      const assetLabels = await getAssetLabels(adminClient, assetId)
+      expect(assetLabels).toStrictEqual([])
+    }
+
+    // length prefix 3 with 2 ids: reading past the payload fails
+    const shortPayload = assetIds.slice(0, 2)
+    await expect(() => addLabelToAssetsRaw(adminClient, operator.addr, label, 3, shortPayload)).rejects.toThrow()
+  })
+
+  test('label counters track assets and operators', async () => {
+    const { testAccount: adminAccount } = localnet.context
+    const { adminClient } = await deploy(adminAccount)
+
+    const label = 'wo'
+    const labelName = 'world'
+    const labelUrl = 'http://'
+    const assetIds = [13n, 14n, 15n]
+    const assetIds2 = [16n, 17n]
+
+    const operator = await localnet.context.generateAccount({ initialFunds: (0.2).algos() })
+    const operator2 = await localnet.context.generateAccount({ initialFunds: (0.2).algos() })
+    await addLabel(adminClient, adminAccount, label, labelName, labelUrl)
+    await addOperatorToLabel(adminClient, operator, label)
+    await addOperatorToLabel(adminClient, operator2, label)
+
+    const operatorClient = adminClient.clone({
+      defaultSender: operator,
+      defaultSigner: operator.signer,
+    })
+
+    const expectDescriptor = async (numAssets: bigint, numOperators: bigint) => {
+      const labelDescriptor = await getLabelDescriptor(adminClient, label)
+      expect(labelDescriptor.name).toBe(labelName)
+      expect(labelDescriptor.url).toBe(labelUrl)
+      expect(labelDescriptor.numAssets).toBe(numAssets)
+      expect(labelDescriptor.numOperators).toBe(numOperators)
+    }
+
+    await expectDescriptor(0n, 2n)
+
+    await addLabelToAssets(operatorClient, assetIds, label)
+    await expectDescriptor(3n, 2n)
+
+    await addLabelToAssets(operatorClient, assetIds2, label)
+    await expectDescriptor(5n, 2n)
+
+    await removeLabelFromAsset(operatorClient, assetIds[1], label)
+    await expectDescriptor(4n, 2n)
+
+    await removeOperatorFromLabel(adminClient, operator2, label)
+    await expectDescriptor(4n, 1n)
+
+    await addOperatorToLabel(adminClient, operator2, label)
+    await expectDescriptor(4n, 2n)
+  })
+
   test('add label twice should fail', async () => {
     const { testAccount: adminAccount } = localnet.context
     const { adminClient } = await deploy(adminAccount)
@@ -700,6 +811,71 @@ describe('asset labeling contract', () => {
     await expect(() => removeLabelFromAsset(operatorClient, assetId, label2)).rejects.toThrow(/ERR:NOEXIST/)
   })
 
+  test('remove label from unlabeled asset should fail', async () => {
+    const { testAccount: adminAccount } = localnet.context
+    const { adminClient } = await deploy(adminAccount)
+
+    const label = 'wo'
+    const labelName = 'world'
+    const labelUrl = 'http://'
+    const assetId = 13n
+
+    const operator = await localnet.context.generateAccount({ initialFunds: (0.2).algos() })
+    await addLabel(adminClient, adminAccount, label, labelName, labelUrl)
+    await addOperatorToLabel(adminClient, operator, label)
+
+    const operatorClient = adminClient.clone({
+      defaultSender: operator,
+      defaultSigner: operator.signer,
+    })
+
+    await expect(() => removeLabelFromAsset(operatorClient, assetId, label)).rejects.toThrow(/ERR:NOEXIST/)
+  })
+
+  test('3x add/remove asset labels reorders by swap', async () => {
+    const { testAccount: adminAccount } = localnet.context
+    const { adminClient } = await deploy(adminAccount)
+
+    const label = 'wo'
+    const label2 = 'w2'
+    const label3 = 'w3'
+    const labelName = 'world'
+    const labelUrl = 'http://'
+    const assetId = 13n
+
+    const operator = await localnet.context.generateAccount({ initialFunds: (0.2).algos() })
+    await addLabel(adminClient, adminAccount, label, labelName, labelUrl)
+    await addLabel(adminClient, adminAccount, label2, labelName, labelUrl)
+    await addLabel(adminClient, adminAccount, label3, labelName, labelUrl)
+    await addOperatorToLabel(adminClient, operator, label)
+    await addOperatorToLabel(adminClient, operator, label2)
+    await addOperatorToLabel(adminClient, operator, label3)
+
+    const operatorClient = adminClient.clone({
+      defaultSender: operator,
+      defaultSigner: operator.signer,
+    })
+    await addLabelToAsset(operatorClient, assetId, label)
+    await addLabelToAsset(operatorClient, assetId, label2)
+    await addLabelToAsset(operatorClient, assetId, label3)
+
+    // middle label: the last label moves into its slot
+    await removeLabelFromAsset(operatorClient, assetId, label2)
+    expect(await getAssetLabels(operatorClient, assetId)).toStrictEqual([label, label3])
+
+    // first label: the last label moves to the front
+    await addLabelToAsset(operatorClient, assetId, label2)
+    await removeLabelFromAsset(operatorClient, assetId, label)
+    expect(await getAssetLabels(operatorClient, assetId)).toStrictEqual([label2, label3])
+
+    const { numAssets } = await getLabelDescriptor(operatorClient, label)
+    expect(numAssets).toBe(0n)
+    const { numAssets: numAssets2 } = await getLabelDescriptor(operatorClient, label2)
+    expect(numAssets2).toBe(1n)
+    const { numAssets: numAssets3 } = await getLabelDescriptor(operatorClient, label3)
+    expect(numAssets3).toBe(1n)
+  })
+
   test('add label to deleted asset should fail', async () => {
     const { testAccount: adminAccount, algorand } = localnet.context
 
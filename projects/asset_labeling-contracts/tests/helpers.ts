@@ -1,5 +1,5 @@
 import { TransactionSignerAccount } from '@algorandfoundation/algokit-utils/types/account'
-import { Address, Account, encodeUint64 } from 'algosdk'
+import { Address, Account, ABIType, encodeUint64 } from 'algosdk'
 import { AssetLabelingClient, LabelDescriptor } from '../smart_contracts/artifacts/asset_labeling/AssetLabelingClient'
 
 export async function addLabel(
@@ -132,6 +132,31 @@ export async function addLabelToAssets(client: AssetLabelingClient, assets: bigi
   return txIds[0]
 }
 
+// sends add_label_to_assets with a hand-encoded uint64[] whose length prefix may not match its payload
+export async function addLabelToAssetsRaw(
+  client: AssetLabelingClient,
+  sender: Address,
+  label: string,
+  assetsLength: number,
+  assets: bigint[],
+): Promise<string> {
+  const assetsArg = new Uint8Array(2 + assets.length * 8)
+  assetsArg.set([assetsLength >> 8, assetsLength & 0xff])
+  assets.forEach((asset, i) => assetsArg.set(encodeUint64(asset), 2 + i * 8))
+
+  const { txIds } = await client.algorand.send.appCall({
+    sender,
+    appId: client.appId,
+    args: [
+      client.appClient.getABIMethod('add_label_to_assets').getSelector(),
+      ABIType.from('string').encode(label),
+      assetsArg,
+    ],
+    boxReferences: [label],
+  })
+  return txIds[0]
+}
+
 export async function removeLabelFromAsset(client: AssetLabelingClient, asset: bigint, label: string): Promise<string> {
   const { txIds } = await client.send.removeLabelFromAsset({
     args: { asset, label },